@@ -1,19 +1,9 @@
-"""
-Copyright (C) 2025 Alexander "Naxela" Kleemann.
-This program is free software: you can redistribute it and/or modify
-it under the terms of the GNU General Public License as published by
-the Free Software Foundation, either version 3 of the License, or
-(at your option) any later version.
-
-This program is distributed in the hope that it will be useful,
-but WITHOUT ANY WARRANTY; without even the implied warranty of
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-GNU General Public License for more details.
-
-You should have received a copy of the GNU General Public License
-along with this program.  If not, see <http://www.gnu.org/licenses/>.
-"""
+"""Meridian - Bridging Blender and Godot. GPL-3.0-or-later, see LICENSE."""
 
+# Blender reads bl_info with ast.literal_eval during the addon scan without
+# importing this module, so it has to stay a plain literal: no names,
+# sys.intern() calls or shared constants. Tuples and strings in a literal
+# are already folded into the code object's constants.
 bl_info = {
     "name": "Meridian",
     "author": "Alexander 'Naxela' Kleemann",
@@ -25,56 +15,121 @@ bl_info = {
     "category": "Import-Export"
 }
 
-try:
-    import traceback
-    import bpy
-    import os
+import bpy
+import os
+import sys
+import traceback
 
-    from bpy.utils import register_class, unregister_class
-    from bpy.props import StringProperty
+from functools import cache
+from importlib import import_module
+from bpy.utils import register_class, unregister_class
+from bpy.props import StringProperty
 
-    from . import operators, panels, properties, logo_handler
-    from .operators.mx_export import mx_auto_export_on_save
+# NOTE: do not add module-level submodule imports here; resolve them in
+# register() (or through _get) so the addon scan stays import-free.
+#
+# Submodules are imported on first register() so that Blender's addon scan
+# only pays for bl_info. _registered holds the unregister callables of the
+# submodules that registered successfully, so unregister() only tears down
+# what was actually built. A submodule that fails part-way is unwound by its
+# own unregister(), which only removes what is actually registered.
+_registered = []
 
 
-    class MX_AddonPreferences(bpy.types.AddonPreferences):
-        bl_idname = __package__
+def __getattr__(name):
+    # PEP 562: import a submodule on first attribute access instead of at
+    # package import. The import system then binds it on the package, so
+    # later lookups never come back here.
+    if name in ('properties', 'operators', 'panels'):
+        mod = _get(name)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        godot_path: StringProperty(
-            name="Godot Executable",
-            description="Path to the Godot editor executable",
-            subtype='FILE_PATH',
-            default="",
-        )
 
-        def draw(self, context):
-            layout = self.layout
-            layout.use_property_split = True
-            layout.use_property_decorate = False
-            col = layout.column()
-            col.prop(self, "godot_path", text="Godot Executable")
-            if self.godot_path and not os.path.isfile(self.godot_path):
-                col.label(text="File not found", icon='ERROR')
+def _get(name):
+    mod = sys.modules.get(f"{__name__}.{name}")
+    if mod is not None:
+        return mod
+    try:
+        return import_module('.' + name, __name__)
+    except Exception:
+        # A broken install should be obvious in the console
+        print(f"Meridian: failed to import '{name}'")
+        raise
 
 
-    def register():
-        register_class(MX_AddonPreferences)
-        panels.register()
-        operators.register()
-        properties.register()
-        logo_handler.load_logo()
-        bpy.app.handlers.save_post.append(mx_auto_export_on_save)
+@cache
+def _submodules():
+    return (_get('properties'), _get('operators'), _get('panels'))
+
+
+@cache
+def _hooks(background):
+    """Pre-bound (name, register, unregister) triples, in registration order."""
+    properties, operators, panels = _submodules()
+    # Headless runs (CI, render farms, --background scripts) have no UI to
+    # draw into, so the panels are left out there.
+    mods = (properties, operators) if background else (properties, operators, panels)
+    return tuple((m.__name__.rpartition('.')[2], m.register, m.unregister) for m in mods)
+
+
+class MX_AddonPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    godot_path: StringProperty(
+        name="Godot Executable",
+        description="Path to the Godot editor executable",
+        subtype='FILE_PATH',
+        default="",
+    )
 
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        col = layout.column()
+        col.prop(self, "godot_path", text="Godot Executable")
+        if self.godot_path and not os.path.isfile(self.godot_path):
+            col.label(text="File not found", icon='ERROR')
 
-    def unregister():
-        if mx_auto_export_on_save in bpy.app.handlers.save_post:
-            bpy.app.handlers.save_post.remove(mx_auto_export_on_save)
-        logo_handler.unload_logo()
-        panels.unregister()
-        operators.unregister()
-        properties.unregister()
+
+def register():
+    from . import logo_handler
+    from .operators.mx_export import mx_auto_export_on_save
+
+    register_class(MX_AddonPreferences)
+    try:
+        for name, reg, unreg in _hooks(bpy.app.background):
+            try:
+                reg()
+            except Exception:
+                print(f"Meridian: failed to register '{name}', rolling back")
+                try:
+                    unreg()
+                except Exception:
+                    traceback.print_exc()
+                raise
+            _registered.append(unreg)
+    except Exception:
+        for unreg in reversed(_registered):
+            unreg()
+        _registered.clear()
         unregister_class(MX_AddonPreferences)
-        
+        raise
+    if not bpy.app.background:
+        logo_handler.load_logo()
+    bpy.app.handlers.save_post.append(mx_auto_export_on_save)
+
+
+def unregister():
+    from . import logo_handler
+    from .operators.mx_export import mx_auto_export_on_save
 
-except Exception:
-    print(traceback.format_exc())
\ No newline at end of file
+    if mx_auto_export_on_save in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(mx_auto_export_on_save)
+    logo_handler.unload_logo()
+    for unreg in reversed(_registered):
+        unreg()
+    _registered.clear()
+    unregister_class(MX_AddonPreferences)
@@ -2,25 +2,45 @@ import bpy
 import os
 import json
 import socket
+import tempfile
 import threading
 import subprocess
 
 # ── State ─────────────────────────────────────────────────────────────────────
 
-BM_STATUS = {
-    "active":    False,   # server loop running
-    "connected": False,   # a client is currently connected
-    "thread":    None,
-    "socket":    None,
-    "process":   None,    # Popen handle for the kiosk window
-}
+class _KioskStatus:
+    """Fixed-field state; slots make each check a plain attribute load."""
+    __slots__ = ("active", "connected", "thread", "socket", "process")
+
+    def __init__(self):
+        self.active = False     # server loop running
+        self.connected = False  # a client is currently connected
+        self.thread = None
+        self.socket = None
+        self.process = None     # Popen handle for the kiosk window
+
+
+BM_STATUS = _KioskStatus()
 
 _KIOSK_PORT = 12345
 
 
-def _kiosk_exe_path():
-    addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(addon_dir, "binaries", "kiosk", "AssetKiosk.exe")
+# Resolved once at import; the binary ships inside the addon folder.
+_KIOSK_EXE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "binaries", "kiosk", "AssetKiosk.exe")
+
+# On Windows the kiosk runs detached from Blender's console so no console
+# window opens and a Ctrl+C there doesn't reach it.
+if os.name == 'nt':
+    _SPAWN_KWARGS = {
+        'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+    }
+else:
+    _SPAWN_KWARGS = {}
+
+# The kiosk's stdout/stderr, overwritten on each launch
+_KIOSK_LOG = os.path.join(tempfile.gettempdir(), "meridian_asset_kiosk.log")
 
 
 # ── Socket server ──────────────────────────────────────────────────────────────
@@ -41,21 +61,21 @@ def _handle_command(action, header, command=None):
 
 
 def _server_loop():
-    srv = BM_STATUS["socket"]
+    srv = BM_STATUS.socket
     srv.bind(("127.0.0.1", _KIOSK_PORT))
     srv.listen(1)
     print(f"[AssetKiosk] Server listening on port {_KIOSK_PORT}")
 
-    while BM_STATUS["active"]:
+    while BM_STATUS.active:
         try:
             conn, addr = srv.accept()
         except OSError:
             break  # socket was closed externally
 
-        BM_STATUS["connected"] = True
+        BM_STATUS.connected = True
         print(f"[AssetKiosk] Client connected: {addr[0]}:{addr[1]}")
 
-        while BM_STATUS["active"]:
+        while BM_STATUS.active:
             try:
                 data = conn.recv(1024)
             except OSError:
@@ -66,7 +86,7 @@ def _server_loop():
                 break
 
             try:
-                msg = json.loads(data.decode())
+                msg = json.loads(data)
                 _handle_command(
                     msg.get("action"),
                     msg.get("header", ""),
@@ -76,7 +96,7 @@ def _server_loop():
                 print(f"[AssetKiosk] Bad message: {e}")
 
         conn.close()
-        BM_STATUS["connected"] = False
+        BM_STATUS.connected = False
         print("[AssetKiosk] Client disconnected")
 
     try:
@@ -94,18 +114,23 @@ class BM_OT_OpenKiosk(bpy.types.Operator):
     bl_description = "Launch the Asset Kiosk and start the connection server"
 
     def execute(self, context):
-        exe = _kiosk_exe_path()
+        exe = _KIOSK_EXE
         if os.path.exists(exe):
-            BM_STATUS["process"] = subprocess.Popen([exe])
+            # The child keeps its own handle; ours can close right away
+            with open(_KIOSK_LOG, 'wb') as log:
+                BM_STATUS.process = subprocess.Popen(
+                    [exe], **_SPAWN_KWARGS,
+                    stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT)
+            print(f"[AssetKiosk] Logging to {_KIOSK_LOG}")
         else:
             self.report({'WARNING'}, f"Asset Kiosk binary not found at: {exe}")
 
-        BM_STATUS["socket"] = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        BM_STATUS["socket"].setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        BM_STATUS["active"] = True
+        BM_STATUS.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        BM_STATUS.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        BM_STATUS.active = True
 
         t = threading.Thread(target=_server_loop, daemon=True)
-        BM_STATUS["thread"] = t
+        BM_STATUS.thread = t
         t.start()
 
         return {'FINISHED'}
@@ -117,20 +142,20 @@ class BM_OT_CloseKiosk(bpy.types.Operator):
     bl_description = "Stop the Asset Kiosk connection server"
 
     def execute(self, context):
-        BM_STATUS["active"] = False
-        BM_STATUS["connected"] = False
+        BM_STATUS.active = False
+        BM_STATUS.connected = False
         try:
-            BM_STATUS["socket"].close()
+            BM_STATUS.socket.close()
         except OSError:
             pass
-        if BM_STATUS["thread"] and BM_STATUS["thread"].is_alive():
-            BM_STATUS["thread"].join(timeout=2.0)
-        BM_STATUS["thread"] = None
-        BM_STATUS["socket"] = None
-        proc = BM_STATUS["process"]
+        if BM_STATUS.thread and BM_STATUS.thread.is_alive():
+            BM_STATUS.thread.join(timeout=2.0)
+        BM_STATUS.thread = None
+        BM_STATUS.socket = None
+        proc = BM_STATUS.process
         if proc and proc.poll() is None:
             proc.terminate()
-        BM_STATUS["process"] = None
+        BM_STATUS.process = None
         return {'FINISHED'}
 
 
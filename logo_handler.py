@@ -4,17 +4,23 @@ import os
 
 preview_collections = {}
 
+# icon_id of the loaded logo, 0 when there is none; read by MX_PT_Panel.draw
+logo_icon_id = 0
+
 def load_logo():
+    global logo_icon_id
     pcoll = bpy.utils.previews.new()
     addon_dir = os.path.dirname(__file__)
     logo_path = os.path.join(addon_dir, "logo.png")
     
     if os.path.exists(logo_path):
-        pcoll.load("meridian_logo", logo_path, 'IMAGE')
+        logo_icon_id = pcoll.load("meridian_logo", logo_path, 'IMAGE').icon_id
     
     preview_collections["main"] = pcoll
 
 def unload_logo():
+    global logo_icon_id
+    logo_icon_id = 0
     for pcoll in preview_collections.values():
         bpy.utils.previews.remove(pcoll)
     preview_collections.clear()
\ No newline at end of file
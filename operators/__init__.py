@@ -3,7 +3,7 @@ from bpy.utils import register_class, unregister_class
 from . import mx_export, mx_project, mx_publish, mx_misc, object, livelink
 from ..assetstore import bm
 
-classes = [
+classes = (
     # Primary workflow operators
     mx_export.MX_OT_ExportMesh,
     mx_export.MX_OT_InitializeProject,
@@ -45,14 +45,20 @@ classes = [
     # Asset Kiosk
     bm.BM_OT_OpenKiosk,
     bm.BM_OT_CloseKiosk,
-]
+)
 
 def register():
+    # Skip classes still registered from a previous load (addon reload)
     for cls in classes:
-        register_class(cls)
+        if not cls.is_registered:
+            register_class(cls)
     bpy.types.VIEW3D_MT_add.append(object.menu_func_add)
 
 def unregister():
+    # Safe after a partial register(): is_registered skips what never got in.
+    # A reload would otherwise leave the old module's handler and sender thread running
+    livelink.stop()
     bpy.types.VIEW3D_MT_add.remove(object.menu_func_add)
     for cls in reversed(classes):
-        unregister_class(cls)
+        if cls.is_registered:
+            unregister_class(cls)
@@ -3,6 +3,7 @@ import socket
 import json
 import time
 import math
+import queue
 import threading
 from bpy.app.handlers import persistent
 from mathutils import Matrix
@@ -15,14 +16,30 @@ _running = False
 _reconnecting = False
 _reconnect_failures = 0
 _lock = threading.Lock()
-_last_update = {}  # obj_name -> float (time of last successful send)
+_last_update = {}  # obj_name -> time.monotonic() of last successful send
+_godot_names = {}  # obj_name -> Godot node name, filled lazily
+_pending = set()   # obj_names throttled this tick; sent by _flush_pending
+_last_sent = {}    # obj_name -> last payload queued, to skip no-op updates
+_send_queue = queue.Queue(maxsize=256)  # (obj_names, encoded batch) waiting for the sender thread
+_sender = None
 
 MAX_RECONNECT_ATTEMPTS = 5  # stop LiveLink after this many consecutive failures
 
 THROTTLE = 0.1  # minimum seconds between updates per object
 
-# Debug flag — set to False to silence verbose output
-DEBUG = True
+# Socket timeout once connected. Only the sender thread writes, so a brief
+# stall in Godot's reader must not abort sendall mid-batch and tear a line.
+SEND_TIMEOUT = 5.0
+
+_STOP_SENDER = None  # queue sentinel: the sender thread returns on it
+
+# AF_INET 'localhost' always means 127.0.0.1; using the literal skips a
+# resolver lookup on every (re)connect attempt.
+HOST = '127.0.0.1'
+
+# Debug flag — set to True for verbose output. Hot-path _dbg calls are also
+# wrapped in `if DEBUG:` so their f-strings aren't built when it's off.
+DEBUG = False
 
 def _dbg(*args):
     if DEBUG:
@@ -61,16 +78,23 @@ def _connect_async(port):
 
 def connect(port):
     global _socket, _connected
-    _do_disconnect()
-    _dbg(f"Attempting connection to localhost:{port} ...")
+    # Runs on a worker thread: only the socket is touched here. The main
+    # thread resets the per-object state before starting a reconnect.
+    _close_socket()
+    _dbg(f"Attempting connection to {HOST}:{port} ...")
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # The connection is kept open for the whole session; updates are small
+        # and latency-sensitive, so don't let Nagle hold them back.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         sock.settimeout(2.0)
-        sock.connect(('localhost', port))
-        sock.settimeout(0.05)
+        sock.connect((HOST, port))
+        sock.settimeout(SEND_TIMEOUT)
         with _lock:
             _socket = sock
             _connected = True
+        _ensure_sender()
         print(f"Meridian LiveLink: Connected to Godot on port {port}")
         return True
     except Exception as e:
@@ -78,46 +102,144 @@ def connect(port):
         return False
 
 
-def _do_disconnect():
-    global _socket, _connected, _reconnect_failures
+def _close_socket():
+    """Close the socket and mark the link down. Safe from any thread."""
+    global _socket, _connected
     with _lock:
         if _socket:
             _dbg("Closing socket")
+            try:
+                # shutdown() wakes a sendall blocked on the sender thread;
+                # close() alone doesn't on Linux
+                _socket.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
             try:
                 _socket.close()
             except Exception:
                 pass
             _socket = None
         _connected = False
+
+
+def _reset_state():
+    """Forget per-object send state. Main thread only; the handler and timers use it."""
     _last_update.clear()
+    _godot_names.clear()
+    _pending.clear()
+    _last_sent.clear()
+    _drain_queue()
+
+
+def _do_disconnect():
+    global _reconnect_failures
+    _close_socket()
+    _reset_state()
+    _stop_sender()
     _reconnect_failures = 0
 
 
+# One reusable encoder with compact separators: json.dumps builds a new
+# JSONEncoder per call whenever any option is passed.
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
 def send(data):
-    global _connected
-    if not _connected:
+    return send_batch((data,))
+
+
+def send_batch(payloads, names=()):
+    """Queue several payloads as one write; the plugin reads one JSON object per line.
+
+    The socket write happens on the sender thread so the depsgraph handler
+    never waits on the network. names are the Blender objects the payloads
+    came from. Returns False if nothing was queued or an older batch had
+    to be dropped to make room.
+    """
+    if not _connected or not payloads:
         return False
+    msg = ('\n'.join(map(_encode, payloads)) + '\n').encode('utf-8')
+    queued = True
     try:
-        msg = (json.dumps(data) + '\n').encode('utf-8')
+        _send_queue.put_nowait((names, msg))
+    except queue.Full:
+        # Godot isn't keeping up; drop the oldest batch rather than stall Blender.
+        queued = False
+        try:
+            dropped, _ = _send_queue.get_nowait()
+        except queue.Empty:
+            dropped = ()
+        # Those transforms never went out: forget them so the no-op check
+        # doesn't suppress them, and let the flush timer send them again.
+        for name in dropped:
+            _last_sent.pop(name, None)
+            _schedule_flush(name)
+        _send_queue.put_nowait((names, msg))
+    if DEBUG:
+        _dbg(f"Queued {len(payloads)} update(s)")
+    return queued
+
+
+def _drain_queue():
+    try:
+        while True:
+            _send_queue.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def _sender_loop():
+    while True:
+        item = _send_queue.get()
+        if item is _STOP_SENDER:
+            return
+        _, msg = item
+        # Send outside the lock so a slow write never blocks _close_socket()
         with _lock:
-            if _socket:
-                _socket.sendall(msg)
-        _dbg(f"Sent → name='{data.get('name')}'")
-        return True
-    except Exception as e:
-        print(f"Meridian LiveLink: Disconnected ({e})")
-        _do_disconnect()
-        return False
+            sock = _socket
+        if sock is None:
+            continue
+        try:
+            sock.sendall(msg)
+        except Exception as e:
+            print(f"Meridian LiveLink: Disconnected ({e})")
+            # The modal timer sees _connected drop and resets the rest on
+            # the main thread before reconnecting.
+            if sock is _socket:
+                _close_socket()
+
+
+def _ensure_sender():
+    global _sender
+    if _sender is None or not _sender.is_alive():
+        _sender = threading.Thread(target=_sender_loop, daemon=True)
+        _sender.start()
+
+
+def _stop_sender():
+    """Main thread: end the sender thread so a reload doesn't orphan it."""
+    global _sender
+    if _sender is None:
+        return
+    _drain_queue()
+    _send_queue.put_nowait(_STOP_SENDER)
+    # The socket is already closed, so any write in flight fails at once
+    _sender.join(timeout=1.0)
+    _sender = None
 
 
 # ===== PAYLOAD BUILDER =====
 
-_CAM_CORRECTION = Matrix.Rotation(math.radians(-90), 4, 'X')
+# 3x3 is enough: the correction is a pure rotation and position comes
+# straight from the decomposed location.
+_CAM_CORRECTION = Matrix.Rotation(math.radians(-90), 3, 'X')
+_CORRECTED_TYPES = frozenset(('CAMERA', 'LIGHT'))
 
 def _build_payload(obj):
     """
     Build the transform payload in the format the Godot plugin expects:
       { name, position, basis_x, basis_y, basis_z }
+    Vectors are tuples (cheaper to build than lists; JSON encodes them as arrays).
 
     The Godot plugin sets transform.basis.{x,y,z} (columns) from the received
     vectors and then calls transform.basis = transform.basis.inverse().
@@ -127,18 +249,16 @@ def _build_payload(obj):
     This preserves the object's non-uniform scale in Godot.
     """
     loc, rot, blender_scale = obj.matrix_world.decompose()
-    rot = rot.conjugated()
-    mat = rot.to_matrix().to_4x4()
-    mat.translation = loc
+    mat = rot.conjugated().to_matrix()
 
     # Apply the same -90° X correction used for cameras and lights in the static export
-    if obj.type in ('CAMERA', 'LIGHT'):
+    if obj.type in _CORRECTED_TYPES:
         mat = mat @ _CAM_CORRECTION
 
     # Blender matrix rows (pure rotation part, no scale)
-    bx = (mat[0][0], mat[0][1], mat[0][2])
-    by = (mat[1][0], mat[1][1], mat[1][2])
-    bz = (mat[2][0], mat[2][1], mat[2][2])
+    bx = mat[0][:]
+    by = mat[1][:]
+    bz = mat[2][:]
 
     # Convert Blender Z-up basis columns → Godot Y-up basis columns (unit vectors)
     gx = ( bx[0],  bx[2], -bx[1])   # Godot X col
@@ -146,25 +266,43 @@ def _build_payload(obj):
     gz = (-by[0], -by[2],  by[1])   # Godot Z col
 
     # Map Blender scale axes to Godot axes: Blender X→Godot X, Blender Z→Godot Y, Blender Y→Godot Z
-    sx = blender_scale.x if blender_scale.x != 0.0 else 1.0
-    sy = blender_scale.z if blender_scale.z != 0.0 else 1.0
-    sz = blender_scale.y if blender_scale.y != 0.0 else 1.0
+    # Stored as reciprocals: three divisions instead of nine.
+    sx, sz, sy = blender_scale
+    ix = 1.0 / sx if sx != 0.0 else 1.0
+    iy = 1.0 / sy if sy != 0.0 else 1.0
+    iz = 1.0 / sz if sz != 0.0 else 1.0
 
     # Godot node names have dots/spaces replaced with underscores (GLTF export convention)
-    godot_name = obj.name.replace('.', '_').replace(' ', '_')
+    name = obj.name
+    godot_name = _godot_names.get(name)
+    if godot_name is None:
+        godot_name = _godot_names[name] = name.replace('.', '_').replace(' ', '_')
 
     return {
         'name':    godot_name,
-        'position': [mat[0][3], mat[2][3], -mat[1][3]],
-        'basis_x': [gx[0]/sx, gy[0]/sy, gz[0]/sz],   # col 0 of M = F.inverse()
-        'basis_y': [gx[1]/sx, gy[1]/sy, gz[1]/sz],   # col 1
-        'basis_z': [gx[2]/sx, gy[2]/sy, gz[2]/sz],   # col 2
+        'position': (loc.x, loc.z, -loc.y),
+        'basis_x': (gx[0]*ix, gy[0]*iy, gz[0]*iz),   # col 0 of M = F.inverse()
+        'basis_y': (gx[1]*ix, gy[1]*iy, gz[1]*iz),   # col 1
+        'basis_z': (gx[2]*ix, gy[2]*iy, gz[2]*iz),   # col 2
     }
 
 
+def _collect(name, obj, now, payloads, names):
+    """Append obj's payload (and name) unless it matches what was last queued for it."""
+    payload = _build_payload(obj)
+    if _last_sent.get(name) == payload:
+        return None
+    _last_sent[name] = payload
+    _last_update[name] = now
+    payloads.append(payload)
+    names.append(name)
+    return payload
+
+
 # ===== DEPSGRAPH HANDLER =====
 
 _handler_call_count = 0
+_Object = bpy.types.Object
 
 @persistent
 def _depsgraph_handler(scene, depsgraph):
@@ -178,8 +316,14 @@ def _depsgraph_handler(scene, depsgraph):
     if not _running or not _connected:
         return
 
+    # Slider scrubs on scene, material or world settings fire this handler
+    # every step without touching any object; skip them before reading props.
+    if not depsgraph.id_type_updated('OBJECT'):
+        return
+
     try:
-        props = bpy.context.scene.MX_SceneProperties
+        # The handler already receives the scene; no need to go through bpy.context
+        props = scene.MX_SceneProperties
         if not props.mx_livelink_enabled:
             _dbg("Handler skipped: mx_livelink_enabled is False")
             return
@@ -187,27 +331,46 @@ def _depsgraph_handler(scene, depsgraph):
             _dbg("Handler skipped: mx_livelink_auto_update is False")
             return
 
-        now = time.time()
-        all_updates = list(depsgraph.updates)
-        obj_updates = [u for u in all_updates if isinstance(u.id, bpy.types.Object)]
-        transform_updates = [u for u in obj_updates if u.is_updated_transform]
-
-        if DEBUG and (obj_updates or transform_updates):
-            _dbg(f"depsgraph updates: total={len(all_updates)}, objects={len(obj_updates)}, transforms={len(transform_updates)}")
-
-        for update in transform_updates:
+        now = time.monotonic()
+        # Single pass over the updates. An object can show up more than once
+        # per tick (e.g. parent/child cascades); only its final transform matters.
+        moved = {}
+        for update in depsgraph.updates:
+            # Cheap flag first; most updates are not transforms
+            if not update.is_updated_transform:
+                continue
             obj = update.id
-            name = obj.name
+            if isinstance(obj, _Object):
+                moved[obj.name] = obj
+
+        if not moved:
+            return
+        if DEBUG:
+            _dbg(f"depsgraph transform updates: {len(moved)}")
 
+        payloads = []
+        names = []
+        for name, obj in moved.items():
+            # The sender thread may drop the connection mid-tick
+            if not _connected:
+                return
             elapsed = now - _last_update.get(name, 0.0)
             if elapsed < THROTTLE:
-                _dbg(f"  Throttled '{name}' ({elapsed:.3f}s < {THROTTLE}s)")
+                if DEBUG:
+                    _dbg(f"  Throttled '{name}' ({elapsed:.3f}s < {THROTTLE}s)")
+                _schedule_flush(name)
                 continue
 
-            _last_update[name] = now
-            payload = _build_payload(obj)
-            ok = send(payload)
-            _dbg(f"  Update '{name}' → '{payload['name']}' (type={obj.type}) send={'OK' if ok else 'FAILED'} pos={payload['position']}")
+            _pending.discard(name)
+            payload = _collect(name, obj, now, payloads, names)
+            if DEBUG and payload:
+                _dbg(f"  Update '{name}' → '{payload['name']}' (type={obj.type}) pos={payload['position']}")
+
+        # One write per tick instead of one per moved object
+        if payloads:
+            ok = send_batch(payloads, names)
+            if DEBUG:
+                _dbg(f"  Batch of {len(payloads)} send={'OK' if ok else 'FAILED'}")
 
     except Exception as e:
         print(f"Meridian LiveLink handler error: {e}")
@@ -215,6 +378,41 @@ def _depsgraph_handler(scene, depsgraph):
         traceback.print_exc()
 
 
+def _schedule_flush(name):
+    """Remember a throttled object so its final transform still gets sent."""
+    _pending.add(name)
+    if not bpy.app.timers.is_registered(_flush_pending):
+        bpy.app.timers.register(_flush_pending, first_interval=THROTTLE)
+
+
+def _flush_pending():
+    """Timer: send objects whose last move was throttled. One batch per run."""
+    if not _running or not _connected:
+        _pending.clear()
+        return None
+
+    now = time.monotonic()
+    objects = bpy.data.objects
+    payloads = []
+    names = []
+    wait = None
+    for name in tuple(_pending):
+        remaining = THROTTLE - (now - _last_update.get(name, 0.0))
+        if remaining > 0.0:
+            wait = remaining if wait is None else min(wait, remaining)
+            continue
+        _pending.discard(name)
+        obj = objects.get(name)
+        if obj is not None:
+            _collect(name, obj, now, payloads, names)
+
+    send_batch(payloads, names)
+    # A dropped batch re-queues its names while this timer is still running
+    if wait is None and _pending:
+        wait = THROTTLE
+    return wait
+
+
 def _register_handler():
     if _depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(_depsgraph_handler)
@@ -224,11 +422,21 @@ def _register_handler():
 
 
 def _unregister_handler():
+    if bpy.app.timers.is_registered(_flush_pending):
+        bpy.app.timers.unregister(_flush_pending)
     if _depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_handler)
         _dbg("depsgraph_update_post handler unregistered")
 
 
+def stop():
+    """Stop LiveLink: handlers, socket and sender thread. Also run on unregister."""
+    global _running
+    _running = False
+    _unregister_handler()
+    _do_disconnect()
+
+
 # ===== OPERATORS =====
 
 class MX_OT_LiveLink(bpy.types.Operator):
@@ -250,6 +458,9 @@ class MX_OT_LiveLink(bpy.types.Operator):
                 global _reconnecting
                 props = context.scene.MX_SceneProperties
                 if not _reconnecting:
+                    # Main thread: drop the old link's per-object state here,
+                    # never from the sender or connect threads.
+                    _reset_state()
                     _reconnecting = True
                     _dbg(f"Modal timer: not connected, retrying on port {props.mx_livelink_godot_port} (async)")
                     threading.Thread(target=_connect_async, args=(props.mx_livelink_godot_port,), daemon=True).start()
@@ -268,6 +479,7 @@ class MX_OT_LiveLink(bpy.types.Operator):
 
         _running = True
         global _reconnecting
+        _reset_state()
         _reconnecting = True
         threading.Thread(target=_connect_async, args=(props.mx_livelink_godot_port,), daemon=True).start()
         _dbg("Initial connect started (async)")
@@ -298,10 +510,7 @@ class MX_OT_LiveLinkStop(bpy.types.Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        global _running
         _dbg("Stop operator called")
-        _running = False
-        _unregister_handler()
-        _do_disconnect()
+        stop()
         self.report({'INFO'}, "LiveLink stopped")
         return {'FINISHED'}
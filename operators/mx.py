@@ -1,32 +1,52 @@
 import bpy
 
+# main.tscn builds cameras, lights and probes itself from
+# extract_scene_objects(). export_cameras/export_lights=False keep the first
+# two out of the glTF; probes have no exporter flag and would come through
+# as stray empty nodes, so they are hidden for the export instead.
+_HIDDEN_FOR_EXPORT_TYPES = frozenset({'LIGHT_PROBE'})
+
 
 class MX_OperatorBase:
     """Base class providing shared state (Godot path) and hide/restore helpers."""
 
     @property
     def godot_path(self):
+        # Walks the addon preferences on every access; read it once per method
         prefs = bpy.context.preferences.addons.get(__package__.split('.')[0])
         if prefs:
             return prefs.preferences.godot_path
         return ""
 
     def hide_non_exported_objects(self):
-        """Temporarily hide objects with mx_export_object disabled and all decal empties.
+        """Temporarily hide objects with mx_export_object disabled, all decal empties
+        and the light probes that main.tscn recreates.
         Returns list of hidden objects to restore."""
+        objects = bpy.data.objects
+        states = [False] * len(objects)
+        objects.foreach_get('hide_render', states)
+
         hidden_objects = []
-        for obj in bpy.data.objects:
+        for obj, already_hidden in zip(objects, states):
+            if already_hidden:
+                continue
+            obj_type = obj.type
+            if obj_type in _HIDDEN_FOR_EXPORT_TYPES:
+                hidden_objects.append(obj)
+                continue
             obj_props = obj.MX_ObjectProperties
-            should_hide = (
-                not obj_props.mx_export_object or
-                (obj.type == 'EMPTY' and obj_props.mx_is_decal)
-            )
-            if should_hide and not obj.hide_render:
-                obj.hide_render = True
+            if not obj_props.mx_export_object or (obj_type == 'EMPTY' and obj_props.mx_is_decal):
                 hidden_objects.append(obj)
+
+        for obj in hidden_objects:
+            obj.hide_render = True
         return hidden_objects
 
     def restore_hidden_objects(self, hidden_objects):
         """Restore objects that were temporarily hidden for export."""
         for obj in hidden_objects:
-            obj.hide_render = False
+            # An export hook may have deleted the object in the meantime
+            try:
+                obj.hide_render = False
+            except ReferenceError:
+                continue
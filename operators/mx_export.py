@@ -1,4 +1,4 @@
-import bpy, os, subprocess, time, shutil
+import bpy, os, shutil, subprocess
 from ..utility import util
 from . import scene_builder, project_setup
 from .mx import MX_OperatorBase
@@ -6,10 +6,10 @@ from .mx import MX_OperatorBase
 
 def _gltf_supports_image_max_size():
     try:
-        bpy.ops.export_scene.gltf.get_rna_type().properties['export_image_max_size']
-        return True
-    except (KeyError, AttributeError):
+        props = bpy.ops.export_scene.gltf.get_rna_type().properties
+    except AttributeError:
         return False
+    return props.get('export_image_max_size') is not None
 
 _GLTF_HAS_IMAGE_MAX_SIZE = None  # cached after first check
 
@@ -27,6 +27,79 @@ def _apply_image_max_size(gltf_kwargs, props):
         gltf_kwargs['export_image_max_size'] = int(props.mx_texture_max_size)
 
 
+def _gltf_kwargs(props, export_path, export_format):
+    """Keyword arguments for bpy.ops.export_scene.gltf shared by all export operators."""
+    gltf_kwargs = dict(
+        filepath=export_path,
+        export_format=export_format,
+        # Godot's glTF importer cannot decode KHR_draco_mesh_compression,
+        # so Draco stays off regardless of scene size.
+        export_draco_mesh_compression_enable=False,
+        export_apply=props.mx_export_apply_modifiers,
+        export_lights=False,
+        export_cameras=False,
+        export_extras=props.mx_export_custom_properties,
+        use_visible=True,
+        use_renderable=True,
+        use_active_scene=True,
+        export_yup=True,
+        export_animations=props.mx_export_animations,
+    )
+    _apply_image_max_size(gltf_kwargs, props)
+    return gltf_kwargs
+
+
+def _meshes_dir(project_dir):
+    return os.path.join(project_dir, "assets", "meshes")
+
+
+def _export_target(props, project_dir, scene_name):
+    """Return (export_path, export_format) for the scene's GLTF/GLB."""
+    if props.mx_export_format == 'GLTF':
+        export_format, file_ext = 'GLTF_SEPARATE', 'gltf'
+    else:
+        export_format, file_ext = 'GLB', 'glb'
+    return os.path.join(_meshes_dir(project_dir), f"{scene_name}.{file_ext}"), export_format
+
+
+def _remove_previous_export(project_dir, scene_name):
+    """Delete the scene's old GLTF/GLB side files (.bin, .import, ...) so none go stale.
+
+    The exporter itself writes straight into assets/meshes, so there is no
+    staging copy to make afterwards. Returns the removed file names.
+    """
+    meshes_dir = _meshes_dir(project_dir)
+    prefix = scene_name + '.'
+    removed = []
+    try:
+        with os.scandir(meshes_dir) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.is_file():
+                    os.remove(entry.path)
+                    removed.append(entry.name)
+    except FileNotFoundError:
+        pass
+    return removed
+
+
+_godot_procs = []  # Popen handles for launched Godot windows, reaped by timer
+
+
+def _reap_godot_procs():
+    """Timer: poll() exited Godot processes so they don't linger as zombies."""
+    _godot_procs[:] = [p for p in _godot_procs if p.poll() is None]
+    return 1.0 if _godot_procs else None
+
+
+def _launch_godot(godot_path, *args):
+    """Start Godot without blocking; exit status is collected on the main loop."""
+    _godot_procs.append(subprocess.Popen([godot_path, *args], stdin=subprocess.DEVNULL))
+    if not bpy.app.timers.is_registered(_reap_godot_procs):
+        # persistent: Godot keeps running across .blend loads; the timer
+        # only touches _godot_procs, never file data
+        bpy.app.timers.register(_reap_godot_procs, first_interval=1.0, persistent=True)
+
+
 # ===== AUTO-EXPORT SAVE HANDLER =====
 
 @bpy.app.handlers.persistent
@@ -57,37 +130,18 @@ class MX_OT_ExportMesh(bpy.types.Operator, MX_OperatorBase):
             self.report({'ERROR'}, "Godot project path not set.")
             return {'CANCELLED'}
 
+        project_dir = props.mx_godot_project_path
+
         try:
             scene_name = util.get_scene_name(context)
-            meshes_dir = os.path.join(props.mx_godot_project_path, "assets", "meshes")
-            export_format = 'GLTF_SEPARATE' if props.mx_export_format == 'GLTF' else 'GLB'
-            file_ext = 'gltf' if props.mx_export_format == 'GLTF' else 'glb'
-            export_path = os.path.join(meshes_dir, f"{scene_name}.{file_ext}")
+            export_path, export_format = _export_target(props, project_dir, scene_name)
 
-            if os.path.isdir(meshes_dir):
-                for f in os.listdir(meshes_dir):
-                    if f.startswith(scene_name + '.'):
-                        os.remove(os.path.join(meshes_dir, f))
+            _remove_previous_export(project_dir, scene_name)
 
             mat_state = util.prepare_materials_for_export(props)
             hidden_objects = self.hide_non_exported_objects()
             try:
-                gltf_kwargs = dict(
-                    filepath=export_path,
-                    export_format=export_format,
-                    export_draco_mesh_compression_enable=False,
-                    export_apply=props.mx_export_apply_modifiers,
-                    export_lights=False,
-                    export_cameras=False,
-                    export_extras=props.mx_export_custom_properties,
-                    use_visible=True,
-                    use_renderable=True,
-                    use_active_scene=True,
-                    export_yup=True,
-                    export_animations=props.mx_export_animations,
-                )
-                _apply_image_max_size(gltf_kwargs, props)
-                bpy.ops.export_scene.gltf(**gltf_kwargs)
+                bpy.ops.export_scene.gltf(**_gltf_kwargs(props, export_path, export_format))
             finally:
                 self.restore_hidden_objects(hidden_objects)
                 util.restore_materials_after_export(mat_state)
@@ -127,6 +181,9 @@ class MX_OT_InitializeProject(bpy.types.Operator, MX_OperatorBase):
             props.mx_godot_project_path = project_dir
             print(f"Auto-created project path: {project_dir}")
 
+        project_dir = props.mx_godot_project_path
+        godot_path = self.godot_path
+
         wm = context.window_manager
         wm.progress_begin(0, 100)
 
@@ -136,59 +193,38 @@ class MX_OT_InitializeProject(bpy.types.Operator, MX_OperatorBase):
             wm.progress_update(5)
 
             print("Collecting script assignments...")
-            script_assignments = project_setup.collect_script_assignments(context)
+            script_assignments, mesh_layer_overrides = project_setup.collect_object_data(context)
             mesh_scripts, scene_node_scripts = project_setup.split_script_assignments(script_assignments)
-            mesh_layer_overrides = project_setup.collect_mesh_render_layers()
 
             print("Creating project structure...")
-            project_setup.createGodotProject(props.mx_godot_project_path, props)
-            util.createFolderStructure(props.mx_godot_project_path)
-            project_setup.create_scene_config(props.mx_godot_project_path, scene_name, props, script_assignments)
+            project_setup.createGodotProject(project_dir, props)
+            util.createFolderStructure(project_dir)
+            project_setup.create_scene_config(project_dir, scene_name, props, script_assignments)
             wm.progress_update(15)
 
             print("Extracting scene data...")
-            cameras, lights = util.extract_cameras_and_lights()
-            probes = util.extract_reflection_probes()
-            decals = util.extract_decals()
+            cameras, lights, probes, decals = util.extract_scene_objects(scene)
             wm.progress_update(20)
 
             print("Extracting environment data...")
             env_data = util.extract_environment_data(
-                props.mx_godot_project_path,
-                world=props.mx_export_world_override or bpy.context.scene.world
+                project_dir,
+                world=props.mx_export_world_override or scene.world
             )
             wm.progress_update(25)
 
             print("Copying lightmaps and bundled assets...")
             project_setup.copy_lightmaps(context, props)
-            project_setup.copy_bundled_assets(context, props.mx_godot_project_path)
+            project_setup.copy_bundled_assets(context, project_dir)
             wm.progress_update(40)
 
             print("Exporting GLTF/GLB...")
-            meshes_dir = os.path.join(props.mx_godot_project_path, "assets", "meshes")
-            export_format = 'GLTF_SEPARATE' if props.mx_export_format == 'GLTF' else 'GLB'
-            file_ext = 'gltf' if props.mx_export_format == 'GLTF' else 'glb'
-            export_path = os.path.join(meshes_dir, f"{scene_name}.{file_ext}")
+            export_path, export_format = _export_target(props, project_dir, scene_name)
 
             mat_state = util.prepare_materials_for_export(props)
             hidden_objects = self.hide_non_exported_objects()
             try:
-                gltf_kwargs = dict(
-                    filepath=export_path,
-                    export_format=export_format,
-                    export_draco_mesh_compression_enable=False,
-                    export_apply=props.mx_export_apply_modifiers,
-                    export_lights=False,
-                    export_cameras=False,
-                    export_extras=props.mx_export_custom_properties,
-                    use_visible=True,
-                    use_renderable=True,
-                    use_active_scene=True,
-                    export_yup=True,
-                    export_animations=props.mx_export_animations,
-                )
-                _apply_image_max_size(gltf_kwargs, props)
-                bpy.ops.export_scene.gltf(**gltf_kwargs)
+                bpy.ops.export_scene.gltf(**_gltf_kwargs(props, export_path, export_format))
             finally:
                 self.restore_hidden_objects(hidden_objects)
                 util.restore_materials_after_export(mat_state)
@@ -196,12 +232,12 @@ class MX_OT_InitializeProject(bpy.types.Operator, MX_OperatorBase):
 
             if props.mx_create_inherited_scene:
                 scene_builder.create_inherited_scene_file(
-                    props.mx_godot_project_path, scene_name, props,
+                    project_dir, scene_name, props,
                     mesh_scripts, mesh_layer_overrides
                 )
 
             print("Creating main scene...")
-            scenes_dir = os.path.join(props.mx_godot_project_path, "scenes")
+            scenes_dir = os.path.join(project_dir, "scenes")
             main_scene_file = os.path.join(scenes_dir, "main.tscn")
             scene_content = scene_builder.generate_godot_scene(
                 cameras, lights, probes, scene_name, env_data, props,
@@ -210,31 +246,30 @@ class MX_OT_InitializeProject(bpy.types.Operator, MX_OperatorBase):
                 decals=decals
             )
 
-            with open(main_scene_file, 'w') as f:
-                f.write(scene_content)
+            util.write_if_changed(main_scene_file, scene_content)
             wm.progress_update(75)
 
-            if os.path.exists(self.godot_path):
+            if os.path.exists(godot_path):
                 print("Running Godot import (headless)...")
                 subprocess.run(
-                    [self.godot_path, "--headless", "--path", props.mx_godot_project_path, "--import"],
+                    [godot_path, "--headless", "--path", project_dir, "--import"],
                     capture_output=True, text=True
                 )
                 print("Import complete!")
 
                 if props.mx_use_lightmapper:
                     print("Applying lightmap import settings...")
-                    project_setup.apply_lightmap_import_settings(props.mx_godot_project_path, props)
+                    project_setup.apply_lightmap_import_settings(project_dir, props)
 
                 if props.mx_use_lightmapper:
                     print("Opening Godot editor for lightmap automation...")
-                    subprocess.Popen([self.godot_path, "--editor", "--path", props.mx_godot_project_path])
+                    _launch_godot(godot_path, "--editor", "--path", project_dir)
 
             wm.progress_update(100)
             wm.progress_end()
 
             props.mx_platform_initialized = props.mx_platform
-            self.report({'INFO'}, f"Project initialized: {props.mx_godot_project_path}")
+            self.report({'INFO'}, f"Project initialized: {project_dir}")
             return {'FINISHED'}
 
         except Exception as e:
@@ -253,8 +288,8 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
     bl_description = "Export GLTF and update scene (CTRL: include lightmaps/bundled + open editor | SHIFT: full compile + play)"
     bl_options = {'REGISTER', 'UNDO'}
 
-    ctrl_held: bpy.props.BoolProperty(default=False, options={'HIDDEN'})
-    shift_held: bpy.props.BoolProperty(default=False, options={'HIDDEN'})
+    ctrl_held: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+    shift_held: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
 
     def invoke(self, context, event):
         self.ctrl_held = event.ctrl
@@ -275,6 +310,9 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
             self.report({'ERROR'}, "Godot project path not set.")
             return {'CANCELLED'}
 
+        project_dir = props.mx_godot_project_path
+        godot_path = self.godot_path
+
         wm = context.window_manager
         wm.progress_begin(0, 100)
 
@@ -283,55 +321,47 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
             print(f"Compiling scene: {scene_name}")
             wm.progress_update(10)
 
-            project_setup.copy_bundled_essential(context, props.mx_godot_project_path)
-            project_setup.copy_custom_scripts(props.mx_godot_project_path)
+            project_setup.copy_bundled_essential(context, project_dir)
+            project_setup.copy_custom_scripts(project_dir)
 
             if self.ctrl_held or self.shift_held:
                 print("Copying lightmaps and optional bundled assets...")
                 project_setup.copy_lightmaps(context, props)
-                project_setup.copy_bundled_optional(context, props.mx_godot_project_path)
+                project_setup.copy_bundled_optional(context, project_dir)
 
             wm.progress_update(25)
 
             print("Extracting scene data...")
-            cameras, lights = util.extract_cameras_and_lights()
-            probes = util.extract_reflection_probes()
-            decals = util.extract_decals()
+            cameras, lights, probes, decals = util.extract_scene_objects(scene)
             env_data = util.extract_environment_data(
-                props.mx_godot_project_path,
-                world=props.mx_export_world_override or bpy.context.scene.world
+                project_dir,
+                world=props.mx_export_world_override or scene.world
             )
 
             print("Collecting script assignments...")
-            script_assignments = project_setup.collect_script_assignments(context)
+            script_assignments, mesh_layer_overrides = project_setup.collect_object_data(context)
             mesh_scripts, scene_node_scripts = project_setup.split_script_assignments(script_assignments)
-            mesh_layer_overrides = project_setup.collect_mesh_render_layers()
-            project_setup.create_scene_config(props.mx_godot_project_path, scene_name, props, script_assignments)
+            project_setup.create_scene_config(project_dir, scene_name, props, script_assignments)
             wm.progress_update(35)
 
-            meshes_dir = os.path.join(props.mx_godot_project_path, "assets", "meshes")
-            export_format = 'GLTF_SEPARATE' if props.mx_export_format == 'GLTF' else 'GLB'
-            file_ext = 'gltf' if props.mx_export_format == 'GLTF' else 'glb'
-            export_path = os.path.join(meshes_dir, f"{scene_name}.{file_ext}")
+            export_path, export_format = _export_target(props, project_dir, scene_name)
 
-            if os.path.isdir(meshes_dir):
-                for f in os.listdir(meshes_dir):
-                    if f.startswith(scene_name + '.'):
-                        os.remove(os.path.join(meshes_dir, f))
-                        print(f"Cleaned: assets/meshes/{f}")
+            for f in _remove_previous_export(project_dir, scene_name):
+                print(f"Cleaned: assets/meshes/{f}")
 
-            import_cache = os.path.join(props.mx_godot_project_path, ".godot", "imported")
+            import_cache = os.path.join(project_dir, ".godot", "imported")
             if os.path.isdir(import_cache):
-                for f in os.listdir(import_cache):
-                    if f.startswith(f"{scene_name}."):
-                        cache_path = os.path.join(import_cache, f)
-                        if os.path.isfile(cache_path):
-                            os.remove(cache_path)
-                        elif os.path.isdir(cache_path):
-                            shutil.rmtree(cache_path)
-                        print(f"Cleaned cache: .godot/imported/{f}")
-
-            inherited_scene_path = os.path.join(props.mx_godot_project_path, "scenes", f"{scene_name}.tscn")
+                prefix = f"{scene_name}."
+                with os.scandir(import_cache) as it:
+                    stale = [e for e in it if e.name.startswith(prefix)]
+                for entry in stale:
+                    if entry.is_file():
+                        os.remove(entry.path)
+                    elif entry.is_dir():
+                        shutil.rmtree(entry.path)
+                    print(f"Cleaned cache: .godot/imported/{entry.name}")
+
+            inherited_scene_path = os.path.join(project_dir, "scenes", f"{scene_name}.tscn")
             if os.path.exists(inherited_scene_path):
                 os.remove(inherited_scene_path)
                 print("Cleaned inherited scene (will be recreated)")
@@ -343,41 +373,26 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
             mat_state = util.prepare_materials_for_export(props)
             hidden_objects = self.hide_non_exported_objects()
             try:
-                gltf_kwargs = dict(
-                    filepath=export_path,
-                    export_format=export_format,
-                    export_draco_mesh_compression_enable=False,
-                    export_apply=props.mx_export_apply_modifiers,
-                    export_lights=False,
-                    export_cameras=False,
-                    export_extras=props.mx_export_custom_properties,
-                    use_visible=True,
-                    use_renderable=True,
-                    use_active_scene=True,
-                    export_yup=True,
-                    export_animations=props.mx_export_animations,
-                )
-                _apply_image_max_size(gltf_kwargs, props)
-                bpy.ops.export_scene.gltf(**gltf_kwargs)
+                bpy.ops.export_scene.gltf(**_gltf_kwargs(props, export_path, export_format))
             finally:
                 self.restore_hidden_objects(hidden_objects)
                 util.restore_materials_after_export(mat_state)
 
-            if os.path.exists(export_path):
-                file_size = os.path.getsize(export_path)
+            try:
+                file_size = os.stat(export_path).st_size
                 print(f"GLTF export successful: {export_path} ({file_size} bytes)")
-            else:
+            except OSError:
                 print(f"WARNING: GLTF file not found after export: {export_path}")
 
             wm.progress_update(70)
 
             scene_builder.create_inherited_scene_file(
-                props.mx_godot_project_path, scene_name, props,
+                project_dir, scene_name, props,
                 mesh_scripts, mesh_layer_overrides
             )
 
             print("Updating main scene...")
-            scenes_dir = os.path.join(props.mx_godot_project_path, "scenes")
+            scenes_dir = os.path.join(project_dir, "scenes")
             main_scene_file = os.path.join(scenes_dir, "main.tscn")
             scene_content = scene_builder.generate_godot_scene(
                 cameras, lights, probes, scene_name, env_data, props,
@@ -386,20 +401,15 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
                 decals=decals
             )
 
-            with open(main_scene_file, 'w') as f:
-                f.write(scene_content)
+            util.write_if_changed(main_scene_file, scene_content)
 
             wm.progress_update(90)
 
-            if os.path.exists(self.godot_path):
-                if os.path.exists(export_path):
-                    print(f"GLTF file verified before import: {export_path}")
-                else:
-                    print(f"WARNING: GLTF file missing before import: {export_path}")
-
+            # The export was verified above and nothing has touched it since
+            if os.path.exists(godot_path):
                 print("Running quick import...")
                 subprocess.run(
-                    [self.godot_path, "--headless", "--path", props.mx_godot_project_path, "--import"],
+                    [godot_path, "--headless", "--path", project_dir, "--import"],
                     capture_output=True, text=True
                 )
 
@@ -408,37 +418,18 @@ class MX_OT_Compile(bpy.types.Operator, MX_OperatorBase):
                 else:
                     print(f"WARNING: GLTF file missing after import: {export_path}")
 
+                # subprocess.run has already waited for the headless import to
+                # exit, so the .import sidecar is either there now or not at all.
                 if self.shift_held:
-                    print("Waiting for import to complete...")
-                    import_file = os.path.join(
-                        props.mx_godot_project_path, "assets", "meshes",
-                        f"{scene_name}.{file_ext}.import"
-                    )
-                    max_wait = 5.0
-                    wait_interval = 0.1
-                    elapsed = 0.0
-                    while elapsed < max_wait and not os.path.exists(import_file):
-                        time.sleep(wait_interval)
-                        elapsed += wait_interval
-
-                    if os.path.exists(import_file):
-                        time.sleep(0.5)
+                    if os.path.exists(export_path + ".import"):
                         print("Import complete!")
                     else:
-                        print(f"Warning: Import file not found after {max_wait}s, launching anyway...")
-
-            if os.path.exists(self.godot_path):
-                if self.shift_held:
+                        print("Warning: Import file not found, launching anyway...")
                     print("Launching Godot...")
-                    subprocess.Popen([
-                        self.godot_path, "--path", props.mx_godot_project_path,
-                        "res://scenes/main.tscn"
-                    ])
+                    _launch_godot(godot_path, "--path", project_dir, "res://scenes/main.tscn")
                 elif self.ctrl_held:
                     print("Opening Godot editor for lightmap automation...")
-                    subprocess.Popen([
-                        self.godot_path, "--editor", "--path", props.mx_godot_project_path
-                    ])
+                    _launch_godot(godot_path, "--editor", "--path", project_dir)
 
             wm.progress_update(100)
             wm.progress_end()
@@ -467,7 +458,7 @@ class MX_OT_Play(bpy.types.Operator, MX_OperatorBase):
     bl_description = "Run Godot project (Hold CTRL to open editor instead)"
     bl_options = {'REGISTER', 'UNDO'}
 
-    ctrl_held: bpy.props.BoolProperty(default=False, options={'HIDDEN'})
+    ctrl_held: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
 
     def invoke(self, context, event):
         self.ctrl_held = event.ctrl
@@ -485,55 +476,57 @@ class MX_OT_Play(bpy.types.Operator, MX_OperatorBase):
             self.report({'ERROR'}, "Godot project path not set.")
             return {'CANCELLED'}
 
-        project_file = os.path.join(props.mx_godot_project_path, "project.godot")
+        project_dir = props.mx_godot_project_path
+        godot_path = self.godot_path
+
+        project_file = os.path.join(project_dir, "project.godot")
         if not os.path.exists(project_file):
             self.report({'ERROR'}, "Godot project not found. Initialize project first.")
             return {'CANCELLED'}
 
-        if not os.path.exists(self.godot_path):
-            self.report({'ERROR'}, f"Godot executable not found: {self.godot_path}")
+        if not os.path.exists(godot_path):
+            self.report({'ERROR'}, f"Godot executable not found: {godot_path}")
             return {'CANCELLED'}
 
         try:
             print("Refreshing project files...")
             scene_name = util.get_scene_name(context)
 
-            project_setup.copy_custom_scripts(props.mx_godot_project_path)
+            project_setup.copy_custom_scripts(project_dir)
 
-            script_assignments = project_setup.collect_script_assignments(context)
+            script_assignments, mesh_layer_overrides = project_setup.collect_object_data(context)
             mesh_scripts, scene_node_scripts = project_setup.split_script_assignments(script_assignments)
-            mesh_layer_overrides = project_setup.collect_mesh_render_layers()
 
-            project_setup.createGodotProject(props.mx_godot_project_path, props)
-            project_setup.create_scene_config(props.mx_godot_project_path, scene_name, props, script_assignments)
+            project_setup.createGodotProject(project_dir, props)
+            project_setup.create_scene_config(project_dir, scene_name, props, script_assignments)
 
-            inherited_scene_path = os.path.join(props.mx_godot_project_path, "scenes", f"{scene_name}.tscn")
-            has_lightmap_data = False
+            inherited_scene_path = os.path.join(project_dir, "scenes", f"{scene_name}.tscn")
+            # Read once: the header decides the path and the lines feed the update.
+            inherited_lines = None
             if os.path.exists(inherited_scene_path):
                 with open(inherited_scene_path, 'r') as f:
-                    first_line = f.readline()
-                    has_lightmap_data = 'format=4' in first_line
+                    inherited_lines = f.read().splitlines()
+            has_lightmap_data = bool(inherited_lines) and 'format=4' in inherited_lines[0]
 
             if not has_lightmap_data:
                 scene_builder.create_inherited_scene_file(
-                    props.mx_godot_project_path, scene_name, props,
+                    project_dir, scene_name, props,
                     mesh_scripts, mesh_layer_overrides
                 )
             else:
                 scene_builder.update_inherited_scene_scripts(
-                    props.mx_godot_project_path, scene_name,
-                    mesh_scripts, mesh_layer_overrides
+                    project_dir, scene_name,
+                    mesh_scripts, mesh_layer_overrides,
+                    lines=inherited_lines
                 )
 
-            cameras, lights = util.extract_cameras_and_lights()
-            probes = util.extract_reflection_probes()
-            decals = util.extract_decals()
+            cameras, lights, probes, decals = util.extract_scene_objects(scene)
             env_data = util.extract_environment_data(
-                props.mx_godot_project_path,
-                world=props.mx_export_world_override or bpy.context.scene.world
+                project_dir,
+                world=props.mx_export_world_override or scene.world
             )
 
-            scenes_dir = os.path.join(props.mx_godot_project_path, "scenes")
+            scenes_dir = os.path.join(project_dir, "scenes")
             main_scene_file = os.path.join(scenes_dir, "main.tscn")
             scene_content = scene_builder.generate_godot_scene(
                 cameras, lights, probes, scene_name, env_data, props,
@@ -542,20 +535,19 @@ class MX_OT_Play(bpy.types.Operator, MX_OperatorBase):
                 decals=decals
             )
 
-            with open(main_scene_file, 'w') as f:
-                f.write(scene_content)
+            util.write_if_changed(main_scene_file, scene_content)
 
             print("Project files refreshed")
 
             if self.ctrl_held:
-                print(f"Opening Godot editor: {props.mx_godot_project_path}")
-                subprocess.Popen([self.godot_path, "--editor", "--path", props.mx_godot_project_path])
+                print(f"Opening Godot editor: {project_dir}")
+                _launch_godot(godot_path, "--editor", "--path", project_dir)
                 self.report({'INFO'}, "Godot editor opened")
             else:
-                print(f"Running Godot project: {props.mx_godot_project_path}")
-                main_scene = os.path.join(props.mx_godot_project_path, "scenes", "main.tscn")
+                print(f"Running Godot project: {project_dir}")
+                main_scene = os.path.join(project_dir, "scenes", "main.tscn")
                 if os.path.exists(main_scene):
-                    subprocess.Popen([self.godot_path, "--path", props.mx_godot_project_path, "res://scenes/main.tscn"])
+                    _launch_godot(godot_path, "--path", project_dir, "res://scenes/main.tscn")
                     self.report({'INFO'}, "Godot project running")
                 else:
                     self.report({'ERROR'}, "Main scene not found. Compile project first.")
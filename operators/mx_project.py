@@ -1,4 +1,5 @@
 import bpy, os, shutil
+from ..utility import util
 
 
 class MX_OT_CleanProject(bpy.types.Operator):
@@ -8,7 +9,7 @@ class MX_OT_CleanProject(bpy.types.Operator):
     bl_description = "Remove the Godot project folder (WARNING: This will delete all project files!)"
     bl_options = {'REGISTER', 'UNDO'}
 
-    confirm: bpy.props.BoolProperty(default=False, options={'HIDDEN'})
+    confirm: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
 
     def invoke(self, context, event):
         return context.window_manager.invoke_confirm(self, event)
@@ -38,6 +39,7 @@ class MX_OT_CleanProject(bpy.types.Operator):
 
         try:
             shutil.rmtree(project_path)
+            util.project_status.cache_clear()
             self.report({'INFO'}, f"Deleted Godot project: {project_path}")
             print(f"Cleaned Godot project folder: {project_path}")
             props.mx_godot_project_path = ""
@@ -111,8 +113,13 @@ class MX_OT_CreateGodotProject(bpy.types.Operator):
         blend_name = os.path.splitext(os.path.basename(blend_file))[0]
         project_dir = os.path.join(blend_dir, f"{blend_name}_godot")
 
-        if not os.path.exists(project_dir):
+        # One mkdir instead of exists()+mkdir; an existing folder is just reused
+        try:
             os.makedirs(project_dir)
+        except FileExistsError:
+            pass
+        else:
+            util.project_status.cache_clear()
             self.report({'INFO'}, f"Created: {project_dir}")
 
         context.scene.MX_SceneProperties.mx_godot_project_path = project_dir
@@ -1,5 +1,9 @@
 import bpy, os, subprocess
 from .mx import MX_OperatorBase
+from ..utility import util
+
+# (godot_path, mtime_ns) -> (dir_version, url_version)
+_version_cache = {}
 
 
 class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
@@ -17,10 +21,24 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
+    def _platform(self, props):
+        """(preset_name, ext, template_file) for the publish target; Windows if unknown."""
+        return self._PLATFORM_MAP.get(props.mx_publish_target, self._PLATFORM_MAP['WINDOWS'])
+
     def _godot_version(self):
         """Return (dir_version, url_version) e.g. ('4.6.stable', '4.6-stable')."""
+        godot_path = self.godot_path
+        # invoke, draw and execute all ask; only spawn Godot once per binary.
+        try:
+            key = (godot_path, os.stat(godot_path).st_mtime_ns)
+        except OSError:
+            key = None
+        cached = _version_cache.get(key)
+        if cached:
+            return cached
+
         result = subprocess.run(
-            [self.godot_path, "--version"],
+            [godot_path, "--version"],
             capture_output=True, text=True
         )
         raw = result.stdout.strip()
@@ -29,6 +47,8 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
             return None, None
         dir_ver = ".".join(parts[:3])
         url_ver = parts[0] + "." + parts[1] + "-" + parts[2]
+        if key:
+            _version_cache[key] = (dir_ver, url_ver)
         return dir_ver, url_ver
 
     def _templates_dir(self):
@@ -124,8 +144,7 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
             f'binary_format/embed_pck=true\n'
         )
         presets_path = os.path.join(project_dir, "export_presets.cfg")
-        with open(presets_path, 'w') as f:
-            f.write(content)
+        util.write_if_changed(presets_path, content)
         return presets_path
 
     # ── Main ──────────────────────────────────────────────────────────────────
@@ -138,13 +157,12 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
             self.report({'ERROR'}, "No Godot project found. Run Initialize Project first.")
             return {'CANCELLED'}
 
-        if not os.path.exists(self.godot_path):
-            self.report({'ERROR'}, f"Godot executable not found: {self.godot_path}")
+        godot_path = self.godot_path
+        if not os.path.exists(godot_path):
+            self.report({'ERROR'}, f"Godot executable not found: {godot_path}")
             return {'CANCELLED'}
 
-        _, __, template_file = self._PLATFORM_MAP.get(
-            props.mx_publish_target, ("Windows Desktop", ".exe", "windows_release_x86_64.exe")
-        )
+        _, __, template_file = self._platform(props)
         dir_version, _ = self._godot_version()
         if not dir_version:
             self.report({'ERROR'}, "Could not detect Godot version from executable.")
@@ -159,10 +177,7 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
 
     def draw(self, context):
         """Shown only when export templates need to be downloaded."""
-        _, __, template_file = self._PLATFORM_MAP.get(
-            context.scene.MX_SceneProperties.mx_publish_target,
-            ("Windows Desktop", ".exe", "windows_release_x86_64.exe")
-        )
+        _, __, template_file = self._platform(context.scene.MX_SceneProperties)
         dir_version, _ = self._godot_version()
 
         layout = self.layout
@@ -181,13 +196,12 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
             self.report({'ERROR'}, "No Godot project found. Run Initialize Project first.")
             return {'CANCELLED'}
 
-        if not os.path.exists(self.godot_path):
-            self.report({'ERROR'}, f"Godot executable not found: {self.godot_path}")
+        godot_path = self.godot_path
+        if not os.path.exists(godot_path):
+            self.report({'ERROR'}, f"Godot executable not found: {godot_path}")
             return {'CANCELLED'}
 
-        preset_name, ext, template_file = self._PLATFORM_MAP.get(
-            props.mx_publish_target, ("Windows Desktop", ".exe", "windows_release_x86_64.exe")
-        )
+        preset_name, ext, template_file = self._platform(props)
         output_file = self._output_file(props, ext)
 
         wm = context.window_manager
@@ -221,14 +235,14 @@ class MX_OT_Publish(bpy.types.Operator, MX_OperatorBase):
             wm.progress_update(35)
             print("[Publish] Running headless import...")
             subprocess.run(
-                [self.godot_path, "--headless", "--path", project_dir, "--import"],
+                [godot_path, "--headless", "--path", project_dir, "--import"],
                 capture_output=True, text=True
             )
 
             wm.progress_update(60)
             print(f"[Publish] Exporting '{preset_name}'...")
             result = subprocess.run(
-                [self.godot_path, "--headless", "--path", project_dir,
+                [godot_path, "--headless", "--path", project_dir,
                  "--export-release", preset_name, output_file],
                 capture_output=True, text=True
             )
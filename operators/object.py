@@ -1,7 +1,31 @@
 import bpy
 import os
 import subprocess
-import shutil
+from ..utility import util
+
+# Desktop "open with default app" command on POSIX
+_OPENER = 'open' if os.name == 'posix' and os.uname().sysname == 'Darwin' else 'xdg-open'
+
+# Bundled scripts ship inside the addon, so the folder never moves at runtime.
+_BUNDLED_SCRIPTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "bundled", "scripts")
+
+
+# Basic GDScript template written by MX_OT_NewScript
+_GDSCRIPT_TEMPLATE = '''extends Node3D
+
+# Script for {obj_name}
+# Created from Blender Meridian addon
+
+# Called when the node enters the scene tree for the first time
+func _ready():
+\tpass
+
+
+# Called every frame. 'delta' is the elapsed time since the previous frame
+func _process(delta):
+\tpass
+'''
 
 
 class MX_OT_AddScript(bpy.types.Operator):
@@ -101,36 +125,20 @@ class MX_OT_NewScript(bpy.types.Operator):
         scripts_dir = os.path.join(blend_dir, "scripts")
 
         # Create scripts directory if it doesn't exist
-        if not os.path.exists(scripts_dir):
-            os.makedirs(scripts_dir)
+        os.makedirs(scripts_dir, exist_ok=True)
 
         # Create script file
         script_filename = f"{self.script_name}.gd"
         script_path = os.path.join(scripts_dir, script_filename)
 
-        if os.path.exists(script_path):
+        # 'x' creates the file and fails if it already exists, in one open()
+        try:
+            with open(script_path, 'x') as f:
+                f.write(_GDSCRIPT_TEMPLATE.format(obj_name=obj.name))
+        except FileExistsError:
             self.report({'WARNING'}, f"Script '{script_filename}' already exists")
             return {'CANCELLED'}
 
-        # Create basic GDScript template
-        script_content = f'''extends Node3D
-
-# Script for {obj.name}
-# Created from Blender Meridian addon
-
-# Called when the node enters the scene tree for the first time
-func _ready():
-\tpass
-
-
-# Called every frame. 'delta' is the elapsed time since the previous frame
-func _process(delta):
-\tpass
-'''
-
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-
         # Update script properties
         script.name = self.script_name
         script.script_type = 'GDSCRIPT'
@@ -171,40 +179,44 @@ class MX_OT_EditScript(bpy.types.Operator):
         blend_dir = os.path.dirname(blend_file)
         scripts_dir = os.path.join(blend_dir, "scripts")
 
+        # Read the entry's RNA properties once instead of per branch
+        script_type = script.script_type
+        bundled = script.bundled_script
+        script_path = script.script_path
+        custom = script.custom_script
+
         # For bundled scripts, copy to local scripts folder if not already there
-        if script.script_type == 'BUNDLED' and script.bundled_script and script.bundled_script != 'NONE':
-            addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-            bundled_path = os.path.join(addon_dir, "bundled", "scripts", script.bundled_script)
+        if script_type == 'BUNDLED' and bundled and bundled != 'NONE':
+            bundled_path = os.path.join(_BUNDLED_SCRIPTS_DIR, bundled)
 
-            if not os.path.exists(bundled_path):
-                self.report({'ERROR'}, f"Bundled script not found: {script.bundled_script}")
+            if not os.path.isfile(bundled_path):
+                self.report({'ERROR'}, f"Bundled script not found: {bundled}")
                 return {'CANCELLED'}
 
-            if not os.path.exists(scripts_dir):
-                os.makedirs(scripts_dir)
+            os.makedirs(scripts_dir, exist_ok=True)
 
-            dest_path = os.path.join(scripts_dir, script.bundled_script)
+            # A real copy, never a hardlink: the user edits this file in place
+            dest_path = os.path.join(scripts_dir, bundled)
             if not os.path.exists(dest_path):
-                shutil.copy2(bundled_path, dest_path)
+                util.fast_copy(bundled_path, dest_path)
 
             # Switch entry from Bundled to GDScript with the local copy selected
-            script_filename = script.bundled_script
             script.script_type = 'GDSCRIPT'
-            script.custom_script = script_filename
-            script.script_path = script_filename
-            script.name = os.path.splitext(script_filename)[0]
-            self.report({'INFO'}, f"Copied bundled script to scripts/{script_filename} (switched to GDScript)")
+            script.custom_script = bundled
+            script.script_path = bundled
+            script.name = os.path.splitext(bundled)[0]
+            self.report({'INFO'}, f"Copied bundled script to scripts/{bundled} (switched to GDScript)")
 
             full_path = dest_path
 
-        elif script.script_path:
+        elif script_path:
             # Custom script - resolve path
-            script_path = script.script_path.replace("res://", "").replace("res://scripts/", "")
+            script_path = script_path.replace("res://", "")
             full_path = os.path.join(scripts_dir, script_path) if not os.path.sep in script_path else os.path.join(blend_dir, script_path)
 
-        elif script.script_type == 'GDSCRIPT' and script.custom_script and script.custom_script != 'NONE':
+        elif script_type == 'GDSCRIPT' and custom and custom != 'NONE':
             # Custom script selected from dropdown
-            full_path = os.path.join(scripts_dir, script.custom_script)
+            full_path = os.path.join(scripts_dir, custom)
 
         else:
             self.report({'ERROR'}, "No script file associated with this entry")
@@ -219,7 +231,10 @@ class MX_OT_EditScript(bpy.types.Operator):
             if os.name == 'nt':  # Windows
                 os.startfile(full_path)
             elif os.name == 'posix':  # macOS and Linux
-                subprocess.call(['open' if os.uname().sysname == 'Darwin' else 'xdg-open', full_path])
+                # Don't wait on the opener
+                subprocess.Popen(
+                    [_OPENER, full_path],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
             self.report({'INFO'}, f"Opened script in default editor")
             return {'FINISHED'}
@@ -234,12 +249,15 @@ class MX_OT_RefreshScripts(bpy.types.Operator):
     bl_idname = "mx.refresh_scripts"
     bl_label = "Refresh"
     bl_description = "Refresh the bundled scripts list from the addon folder"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
-        # Dynamic EnumProperty callbacks re-evaluate on UI redraw, so just tag a redraw
+        # Dynamic EnumProperty callbacks re-evaluate on UI redraw and only rescan
+        # a scripts folder whose mtime changed, so a redraw is all that's needed.
+        # Only the Properties editor shows these enums; leave the viewports alone.
         for area in context.screen.areas:
-            area.tag_redraw()
+            if area.type == 'PROPERTIES':
+                area.tag_redraw()
 
         self.report({'INFO'}, "Refreshed bundled scripts list")
         return {'FINISHED'}
@@ -270,16 +288,15 @@ class MX_OT_ApplyBundledScript(bpy.types.Operator):
             self.report({'ERROR'}, "Script type must be set to 'Bundled'")
             return {'CANCELLED'}
 
-        if script.bundled_script == 'GDSCRIPT':
+        bundled = script.bundled_script
+        if bundled == 'GDSCRIPT':
             self.report({'ERROR'}, "Please select a bundled script")
             return {'CANCELLED'}
 
-        # Get addon directory
-        addon_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
-        bundled_script_path = os.path.join(addon_dir, "bundled", "scripts", script.bundled_script)
+        bundled_script_path = os.path.join(_BUNDLED_SCRIPTS_DIR, bundled)
 
-        if not os.path.exists(bundled_script_path):
-            self.report({'ERROR'}, f"Bundled script not found: {script.bundled_script}")
+        if not os.path.isfile(bundled_script_path):
+            self.report({'ERROR'}, f"Bundled script not found: {bundled}")
             return {'CANCELLED'}
 
         # Get blend file directory
@@ -292,20 +309,19 @@ class MX_OT_ApplyBundledScript(bpy.types.Operator):
         scripts_dir = os.path.join(blend_dir, "scripts")
 
         # Create scripts directory if needed
-        if not os.path.exists(scripts_dir):
-            os.makedirs(scripts_dir)
+        os.makedirs(scripts_dir, exist_ok=True)
 
-        # Copy bundled script to project
-        dest_path = os.path.join(scripts_dir, script.bundled_script)
+        # Copy bundled script to project (a copy, not a link: it gets edited)
+        dest_path = os.path.join(scripts_dir, bundled)
 
         if not os.path.exists(dest_path):
-            shutil.copy2(bundled_script_path, dest_path)
-            print(f"Copied bundled script: {script.bundled_script}")
+            util.fast_copy(bundled_script_path, dest_path)
+            print(f"Copied bundled script: {bundled}")
 
         # Update script properties
-        script_name = os.path.splitext(script.bundled_script)[0]
+        script_name = os.path.splitext(bundled)[0]
         script.name = script_name
-        script.script_path = f"res://scripts/{script.bundled_script}"
+        script.script_path = f"res://scripts/{bundled}"
 
         self.report({'INFO'}, f"Applied bundled script: {script_name}")
         return {'FINISHED'}
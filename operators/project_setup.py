@@ -1,66 +1,67 @@
-import bpy, os, json, re, shutil, time
+import bpy, os, json, re, time
 from ..utility import util
 
+# Resolved once at import; the addon does not move while Blender runs.
+_ADDON_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_BUNDLED_DIR = os.path.join(_ADDON_DIR, "bundled")
+_DEFAULT_SPLASH = os.path.join(_ADDON_DIR, "logo.png")
 
-def createGodotProject(project_dir, props):
-    """Create/update project.godot with rendering, platform, and app settings."""
+# Lightmap .import rewriting, applied to every lightmap texture
+_COMPRESS_MODE_RE = re.compile(r'^compress/mode=\S+', re.MULTILINE)
+_MIPMAPS_RE = re.compile(r'^mipmaps/generate=\S+', re.MULTILINE)
+_CTEX_PATH_RE = re.compile(r'^path[^=]*="(res://[^"]+\.ctex)"', re.MULTILINE)
 
-    if not os.path.exists(project_dir):
-        os.makedirs(project_dir)
+# mx_renderer → project.godot config/features renderer name
+_RENDERER_FEATURES = {
+    'FORWARD_PLUS':  'Forward Plus',
+    'MOBILE':        'Mobile',
+    'COMPATIBILITY': 'GL Compatibility',
+}
 
-    icon_godot_path = ""
-    splash_godot_path = ""
+_XR_SETTINGS = """[xr]
+openxr/enabled=true
+shaders/enabled=true
 
-    if props.mx_app_icon:
-        icon_src = bpy.path.abspath(props.mx_app_icon)
-        if os.path.isfile(icon_src):
-            icon_filename = os.path.basename(icon_src)
-            icon_dest = os.path.join(project_dir, icon_filename)
-            shutil.copy2(icon_src, icon_dest)
-            icon_godot_path = f"res://{icon_filename}"
-            print(f"Copied app icon: {icon_filename}")
+[physics]
+common/physics_ticks_per_second=90
 
-    splash_src = ""
-    if props.mx_splash_image:
-        splash_src = bpy.path.abspath(props.mx_splash_image)
-    if not splash_src or not os.path.isfile(splash_src):
-        addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-        splash_src = os.path.join(addon_dir, "logo.png")
+"""
 
-    if os.path.isfile(splash_src):
-        splash_filename = os.path.basename(splash_src)
-        splash_dest = os.path.join(project_dir, splash_filename)
-        shutil.copy2(splash_src, splash_dest)
-        splash_godot_path = f"res://{splash_filename}"
-        print(f"Copied boot splash: {splash_filename}")
+_LIGHTMAPPER_PLUGINS = """[editor_plugins]
 
-    project_file = os.path.join(project_dir, "project.godot")
+enabled=PackedStringArray("res://addons/naxplus/plugin.cfg", "res://addons/blender_livelink/plugin.cfg")
+
+"""
+
+def _gd_string(value):
+    """Godot config string literal, with backslashes and quotes escaped."""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
-    renderer_feature = {
-        'FORWARD_PLUS':  'Forward Plus',
-        'MOBILE':        'Mobile',
-        'COMPATIBILITY': 'GL Compatibility',
-    }.get(props.mx_renderer, 'Forward Plus')
 
-    project_content = f"""; Engine configuration file.
+def _project_godot_content(props, icon_godot_path, splash_godot_path):
+    """Render project.godot from the scene settings; no file system access."""
+    renderer_feature = _RENDERER_FEATURES.get(props.mx_renderer, 'Forward Plus')
+
+    parts = [f"""; Engine configuration file.
 
 config_version=5
 
 [application]
 
-config/name="{props.mx_project_name or 'Blender Export'}"
+config/name={_gd_string(props.mx_project_name or 'Blender Export')}
 run/main_scene="res://scenes/main.tscn"
 config/features=PackedStringArray("4.6", "{renderer_feature}")
-"""
+"""]
+    add = parts.append
 
     if icon_godot_path:
-        project_content += f'config/icon="{icon_godot_path}"\n'
+        add(f'config/icon={_gd_string(icon_godot_path)}\n')
 
     if splash_godot_path:
-        project_content += f'boot_splash/image="{splash_godot_path}"\n'
-        project_content += 'boot_splash/stretch_mode=0\n'
+        add(f'boot_splash/image={_gd_string(splash_godot_path)}\n')
+        add('boot_splash/stretch_mode=0\n')
 
-    project_content += f"""
+    add(f"""
 [rendering]
 anti_aliasing/quality/msaa_3d={props.mx_msaa}
 anti_aliasing/quality/screen_space_aa={props.mx_screen_space_aa}
@@ -70,27 +71,50 @@ scaling_3d/mode={props.mx_scaling_3d_mode}
 scaling_3d/scale={props.mx_scaling_3d_scale}
 scaling_3d/fsr_sharpness={props.mx_fsr_sharpness}
 
-"""
+""")
 
     if props.mx_platform == 'XR':
-        project_content += """[xr]
-openxr/enabled=true
-shaders/enabled=true
+        add(_XR_SETTINGS)
 
-[physics]
-common/physics_ticks_per_second=90
+    if props.mx_use_lightmapper:
+        add(_LIGHTMAPPER_PLUGINS)
 
-"""
+    return ''.join(parts)
 
-    if props.mx_use_lightmapper:
-        project_content += """[editor_plugins]
 
-enabled=PackedStringArray("res://addons/naxplus/plugin.cfg", "res://addons/blender_livelink/plugin.cfg")
+def createGodotProject(project_dir, props):
+    """Create/update project.godot with rendering, platform, and app settings."""
 
-"""
+    os.makedirs(project_dir, exist_ok=True)
 
-    with open(project_file, 'w') as f:
-        f.write(project_content)
+    icon_godot_path = ""
+    splash_godot_path = ""
+
+    if props.mx_app_icon:
+        icon_src = util.abspath(props.mx_app_icon)
+        if os.path.isfile(icon_src):
+            icon_filename = os.path.basename(icon_src)
+            icon_dest = os.path.join(project_dir, icon_filename)
+            util.fast_copy(icon_src, icon_dest)
+            icon_godot_path = f"res://{icon_filename}"
+            print(f"Copied app icon: {icon_filename}")
+
+    splash_src = ""
+    if props.mx_splash_image:
+        splash_src = util.abspath(props.mx_splash_image)
+    if not splash_src or not os.path.isfile(splash_src):
+        splash_src = _DEFAULT_SPLASH
+
+    if os.path.isfile(splash_src):
+        splash_filename = os.path.basename(splash_src)
+        splash_dest = os.path.join(project_dir, splash_filename)
+        util.fast_copy(splash_src, splash_dest)
+        splash_godot_path = f"res://{splash_filename}"
+        print(f"Copied boot splash: {splash_filename}")
+
+    project_file = os.path.join(project_dir, "project.godot")
+    util.write_if_changed(project_file, _project_godot_content(props, icon_godot_path, splash_godot_path))
+    util.project_status.cache_clear()
 
     print(f"Created/Updated project.godot")
     return project_dir
@@ -116,8 +140,12 @@ def create_scene_config(project_dir, scene_name, props, script_assignments=None)
         "script_assignments": script_assignments or {}
     }
 
-    with open(config_path, 'w') as f:
-        json.dump(config_data, f, indent=4)
+    # json.dumps without indent runs on the C encoder and lands in one write;
+    # json.dump(indent=...) falls back to the pure-Python chunked encoder.
+    # Written as UTF-8 bytes so no text-layer encoding/newline pass is needed.
+    data = json.dumps(config_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    with open(config_path, 'wb') as f:
+        f.write(data)
 
     print(f"Created scene config")
     if script_assignments:
@@ -138,22 +166,17 @@ def copy_lightmaps(context, props):
     blend_dir = os.path.dirname(blend_file_path)
     source_lightmaps = os.path.join(blend_dir, "Lightmaps")
 
-    if os.path.exists(source_lightmaps) and os.path.isdir(source_lightmaps):
-        dest_lightmaps = os.path.join(props.mx_godot_project_path, "assets", "lightmaps")
-
-        texture_extensions = {'.exr', '.hdr', '.png', '.jpg', '.jpeg', '.webp'}
-        for item in os.listdir(source_lightmaps):
-            source_item = os.path.join(source_lightmaps, item)
-            dest_item = os.path.join(dest_lightmaps, item)
+    if os.path.isdir(source_lightmaps):
+        project_dir = props.mx_godot_project_path
+        dest_lightmaps = os.path.join(project_dir, "assets", "lightmaps")
 
-            if os.path.isfile(source_item):
-                shutil.copy2(source_item, dest_item)
-            elif os.path.isdir(source_item):
-                shutil.copytree(source_item, dest_item, dirs_exist_ok=True)
+        # Godot only reads the images (settings live in .import files), so
+        # hardlinks are safe and skip duplicating large EXRs on one volume.
+        util.copy_files(util.gather_tree(source_lightmaps, dest_lightmaps, []), link=True)
 
         print(f"Lightmaps copied")
 
-        flag_file = os.path.join(props.mx_godot_project_path, ".lightmaps_applied")
+        flag_file = os.path.join(project_dir, ".lightmaps_applied")
         if os.path.exists(flag_file):
             os.remove(flag_file)
             print("Removed old lightmap flag - will re-apply on startup")
@@ -172,33 +195,34 @@ def apply_lightmap_import_settings(project_dir, props):
     texture_extensions = {'.exr', '.hdr', '.png', '.jpg', '.jpeg', '.webp'}
     patched = 0
 
-    for item in os.listdir(lightmaps_dir):
+    # The .import sidecars sit next to their textures, so one listing answers
+    # both "is it a texture" and "has Godot imported it" without a stat each.
+    names = set(os.listdir(lightmaps_dir))
+    for item in names:
+        if item + ".import" not in names:
+            continue
         if os.path.splitext(item)[1].lower() not in texture_extensions:
             continue
 
         import_path = os.path.join(lightmaps_dir, item + ".import")
-        if not os.path.exists(import_path):
-            continue
 
         with open(import_path, 'r') as f:
             content = f.read()
 
-        content = re.sub(r'^compress/mode=\S+', f'compress/mode={compress_mode}', content, flags=re.MULTILINE)
-        content = re.sub(r'^mipmaps/generate=\S+', f'mipmaps/generate={mipmaps}', content, flags=re.MULTILINE)
+        content = _COMPRESS_MODE_RE.sub(f'compress/mode={compress_mode}', content)
+        content = _MIPMAPS_RE.sub(f'mipmaps/generate={mipmaps}', content)
 
         with open(import_path, 'w') as f:
             f.write(content)
 
-        for ctex_res in re.findall(r'^path[^=]*="(res://[^"]+\.ctex)"', content, flags=re.MULTILINE):
+        for ctex_res in _CTEX_PATH_RE.findall(content):
             ctex_abs = os.path.join(project_dir, ctex_res.replace("res://", "").replace("/", os.sep))
             if os.path.exists(ctex_abs):
                 os.remove(ctex_abs)
-                print(f"  Invalidated cache: {ctex_res}")
 
         patched += 1
-        print(f"Patched import settings: {item} (compress={compress_mode}, mipmaps={mipmaps})")
 
-    print(f"Lightmap import settings applied to {patched} texture(s)")
+    print(f"Lightmap import settings applied to {patched} texture(s) (compress={compress_mode}, mipmaps={mipmaps})")
 
 
 def copy_custom_scripts(project_dir):
@@ -213,82 +237,98 @@ def copy_custom_scripts(project_dir):
         return
 
     dest_scripts = os.path.join(project_dir, "scripts")
-    if not os.path.exists(dest_scripts):
-        os.makedirs(dest_scripts)
+    os.makedirs(dest_scripts, exist_ok=True)
 
-    copied = 0
-    for filename in os.listdir(source_scripts):
-        if filename.endswith('.gd'):
-            src = os.path.join(source_scripts, filename)
-            dst = os.path.join(dest_scripts, filename)
-            shutil.copy2(src, dst)
-            copied += 1
+    pairs = [
+        (os.path.join(source_scripts, filename), os.path.join(dest_scripts, filename))
+        for filename in os.listdir(source_scripts)
+        if filename.endswith('.gd')
+    ]
+    util.copy_files(pairs)
 
-    if copied:
-        print(f"Copied {copied} custom script(s)")
+    if pairs:
+        print(f"Copied {len(pairs)} custom script(s)")
 
 
-def _get_node_path(obj):
+def _get_node_path(obj, cache=None):
     """Return the full Godot node path for a Blender object, following the parent chain.
     e.g. a Cube_005 parented to Cube_004 → 'Cube_004/Cube_005'
-    Root-level objects return just their safe name."""
-    parts = [util.safe_name(obj.name)]
-    parent = obj.parent
-    while parent:
-        parts.insert(0, util.safe_name(parent.name))
-        parent = parent.parent
-    return '/'.join(parts)
+    Root-level objects return just their safe name.
+
+    cache (object name → node path) is filled for every object on the chain,
+    so siblings and children stop at the first ancestor already resolved."""
+    names = []
+    path = None
+    while obj:
+        name = obj.name
+        if cache is not None:
+            path = cache.get(name)
+            if path is not None:
+                break
+        names.append(name)
+        obj = obj.parent
+    for name in reversed(names):
+        leaf = util.safe_name(name)
+        path = f"{path}/{leaf}" if path else leaf
+        if cache is not None:
+            cache[name] = path
+    return path
 
 
-def collect_script_assignments(context):
-    """Return dict of node path → script filename for all enabled scripts.
-    Keys use full hierarchy paths (e.g. 'Parent/Child') so the inherited scene
-    can write the correct parent= attribute for nested nodes."""
+_LAYER_OBJECT_TYPES = frozenset(('MESH', 'CURVE', 'SURFACE', 'META', 'FONT'))
 
-    assignments = {}
 
-    for obj in bpy.data.objects:
-        obj_props = obj.MX_ObjectProperties
-
-        if len(obj_props.mx_scripts) > 0:
-            for script_item in obj_props.mx_scripts:
-                if not script_item.enabled:
-                    continue
+def _assigned_script(obj_props):
+    """Filename of the first enabled script on an object, or None."""
+    for script_item in obj_props.mx_scripts:
+        if not script_item.enabled:
+            continue
 
-                script_file = None
-                if script_item.script_type == 'BUNDLED' and script_item.bundled_script and script_item.bundled_script != 'NONE':
-                    script_file = script_item.bundled_script
-                elif script_item.script_type == 'GDSCRIPT':
-                    if script_item.custom_script and script_item.custom_script != 'NONE':
-                        script_file = script_item.custom_script
-                    elif script_item.script_path:
-                        script_file = script_item.script_path
-                        if script_file.startswith('res://scripts/'):
-                            script_file = script_file[len('res://scripts/'):]
+        script_type = script_item.script_type
+        if script_type == 'BUNDLED' and script_item.bundled_script and script_item.bundled_script != 'NONE':
+            return script_item.bundled_script
+        elif script_type == 'GDSCRIPT':
+            if script_item.custom_script and script_item.custom_script != 'NONE':
+                return script_item.custom_script
+            elif script_item.script_path:
+                script_file = script_item.script_path
+                if script_file.startswith('res://scripts/'):
+                    script_file = script_file[len('res://scripts/'):]
+                return script_file
+    return None
+
+
+def collect_object_data(context):
+    """Walk bpy.data.objects once for both script assignments and render layers.
+
+    Returns (script_assignments, layer_overrides):
+      script_assignments: node path → script filename for all enabled scripts.
+        Keys use full hierarchy paths (e.g. 'Parent/Child') so the inherited
+        scene can write the correct parent= attribute for nested nodes.
+      layer_overrides: node path → bitmask for exported mesh-like objects
+        with non-default render layers.
+    """
 
-                if script_file:
-                    node_path = _get_node_path(obj)
-                    assignments[node_path] = script_file
-                    print(f"Script assignment: {node_path} -> {script_file}")
-                    break
+    assignments = {}
+    overrides = {}
+    # Parent paths are shared by every child; resolve each ancestor once per walk
+    paths = {}
 
-    return assignments
+    for obj in bpy.data.objects:
+        obj_props = obj.MX_ObjectProperties
+        node_path = None
 
+        script_file = _assigned_script(obj_props)
+        if script_file:
+            node_path = _get_node_path(obj, paths)
+            assignments[node_path] = script_file
 
-def collect_mesh_render_layers():
-    """Return dict of node path → bitmask for mesh objects with non-default render layers."""
+        if obj.type in _LAYER_OBJECT_TYPES and obj_props.mx_export_object:
+            bitmask = util.bool_vector_to_bitmask(obj_props.mx_render_layers)
+            if bitmask != 1:
+                overrides[node_path or _get_node_path(obj, paths)] = bitmask
 
-    overrides = {}
-    for obj in bpy.data.objects:
-        if obj.type not in ('MESH', 'CURVE', 'SURFACE', 'META', 'FONT'):
-            continue
-        obj_props = obj.MX_ObjectProperties
-        if not obj_props.mx_export_object:
-            continue
-        bitmask = util.bool_vector_to_bitmask(obj_props.mx_render_layers)
-        if bitmask != 1:
-            overrides[_get_node_path(obj)] = bitmask
-    return overrides
+    return assignments, overrides
 
 
 def split_script_assignments(script_assignments):
@@ -301,16 +341,19 @@ def split_script_assignments(script_assignments):
 
     mesh_assignments = {}
     scene_node_assignments = {}
+    if not script_assignments:
+        return mesh_assignments, scene_node_assignments
+
+    # Leaf name → object type, built once instead of rescanning
+    # bpy.data.objects per assignment. First match wins, as before.
+    leaf_types = {}
+    for o in bpy.data.objects:
+        leaf_types.setdefault(util.safe_name(o.name), o.type)
 
     for node_path, script_file in script_assignments.items():
         leaf_name = node_path.split('/')[-1]
-        obj = None
-        for o in bpy.data.objects:
-            if util.safe_name(o.name) == leaf_name:
-                obj = o
-                break
 
-        if obj and obj.type in ('CAMERA', 'LIGHT', 'LIGHT_PROBE'):
+        if leaf_types.get(leaf_name) in ('CAMERA', 'LIGHT', 'LIGHT_PROBE'):
             # main.tscn always emits cameras/lights as root-level nodes → use leaf name
             scene_node_assignments[leaf_name] = script_file
         else:
@@ -322,8 +365,7 @@ def split_script_assignments(script_assignments):
 def copy_bundled_essential(context, project_dir):
     """Copy essential bundled folders (addons, assets, scripts) — always copied."""
 
-    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    bundled_dir = os.path.join(addon_dir, "bundled")
+    bundled_dir = _BUNDLED_DIR
 
     print(f"Looking for bundled folder at: {bundled_dir}")
 
@@ -337,31 +379,34 @@ def copy_bundled_essential(context, project_dir):
 
     essential_folders = ["addons", "assets", "scripts"]
     copied_count = 0
+    pairs = []
 
     for folder in essential_folders:
         source_folder = os.path.join(bundled_dir, folder)
 
-        if os.path.exists(source_folder) and os.path.isdir(source_folder):
+        if os.path.isdir(source_folder):
             dest_folder = os.path.join(project_dir, folder)
-            items = os.listdir(source_folder)
+            os.makedirs(dest_folder, exist_ok=True)
+            # DirEntry carries the file type, so no isfile/isdir stat per item
+            with os.scandir(source_folder) as it:
+                entries = list(it)
 
-            print(f"Copying {len(items)} items from Bundled/{folder}...")
+            print(f"Copying {len(entries)} items from Bundled/{folder}...")
 
-            for item in items:
-                source_item = os.path.join(source_folder, item)
-                dest_item = os.path.join(dest_folder, item)
+            for entry in entries:
+                dest_item = os.path.join(dest_folder, entry.name)
 
-                if os.path.isfile(source_item):
-                    shutil.copy2(source_item, dest_item)
-                    print(f"  Copied file: {folder}/{item}")
+                if entry.is_file():
+                    pairs.append((entry.path, dest_item))
                     copied_count += 1
-                elif os.path.isdir(source_item):
-                    shutil.copytree(source_item, dest_item, dirs_exist_ok=True)
-                    print(f"  Copied folder: {folder}/{item}")
+                elif entry.is_dir():
+                    util.gather_tree(entry.path, dest_item, pairs)
                     copied_count += 1
         else:
             print(f"Info: Bundled/{folder} not found, skipping")
 
+    util.copy_files(pairs)
+
     if copied_count > 0:
         print(f"Essential bundled folders copied ({copied_count} items)")
     else:
@@ -371,26 +416,19 @@ def copy_bundled_essential(context, project_dir):
 def copy_bundled_optional(context, project_dir):
     """Copy optional bundled folders (scenes, shaders) — only with CTRL/SHIFT."""
 
-    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    bundled_dir = os.path.join(addon_dir, "bundled")
+    bundled_dir = _BUNDLED_DIR
 
-    if os.path.exists(bundled_dir) and os.path.isdir(bundled_dir):
+    if os.path.isdir(bundled_dir):
         optional_folders = ["scenes", "shaders"]
+        pairs = []
 
         for folder in optional_folders:
             source_folder = os.path.join(bundled_dir, folder)
 
-            if os.path.exists(source_folder) and os.path.isdir(source_folder):
-                dest_folder = os.path.join(project_dir, folder)
-
-                for item in os.listdir(source_folder):
-                    source_item = os.path.join(source_folder, item)
-                    dest_item = os.path.join(dest_folder, item)
+            if os.path.isdir(source_folder):
+                util.gather_tree(source_folder, os.path.join(project_dir, folder), pairs)
 
-                    if os.path.isfile(source_item):
-                        shutil.copy2(source_item, dest_item)
-                    elif os.path.isdir(source_item):
-                        shutil.copytree(source_item, dest_item, dirs_exist_ok=True)
+        util.copy_files(pairs)
 
         print(f"Optional bundled folders copied (scenes, shaders)")
 
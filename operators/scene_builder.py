@@ -1,7 +1,66 @@
-import bpy, os, json, re, shutil
+import bpy, os, json, re
 from ..utility import util
 
 
+# Blender light type → Godot node type; other types are not exported.
+_GODOT_LIGHT_TYPES = {
+    'SUN':   "DirectionalLight3D",
+    'POINT': "OmniLight3D",
+    'SPOT':  "SpotLight3D",
+}
+
+_PROBE_UPDATE_MODES = {'ONCE': 0, 'ALWAYS': 1}
+_PROBE_AMBIENT_MODES = {'DISABLED': 0, 'ENVIRONMENT': 1, 'CONSTANT_COLOR': 2}
+
+# Inherited-scene rewriting runs these once per .tscn line
+_EXT_ID_RE = re.compile(r'id="([^"]+)"')
+_NODE_NAME_RE = re.compile(r'\[node name="([^"]+)"')
+_NODE_PARENT_RE = re.compile(r'parent="([^"]+)"')
+_LOAD_STEPS_RE = re.compile(r'load_steps=\d+')
+
+def _gd_bool(v):
+    """Godot bool literal (true/false) for any truthy value."""
+    return 'true' if v else 'false'
+
+
+def _rgb(c):
+    """Godot Color literal (alpha 1) from any RGB(A) sequence, read with one slice."""
+    r, g, b = c[:3]
+    return f'Color({r}, {g}, {b}, 1)'
+
+
+# Fixed node blocks emitted into every main.tscn (the XR rig only on XR).
+_BAKED_GI_NODE = (
+    '[node name="BakedGI" type="DirectionalLight3D" parent="."]\n'
+    'light_color = Color(0, 0, 0, 1)\n'
+    'light_energy = 0.0\n'
+    'editor_only = true\n\n'
+)
+
+_XR_RIG_NODES = (
+    '[node name="XROrigin" type="XROrigin3D" parent="."]\n\n'
+    '[node name="XRCamera" type="XRCamera3D" parent="XROrigin"]\n'
+    'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1.7, 0)\n'
+    '\n'
+    '[node name="LeftHand" type="XRController3D" parent="XROrigin"]\n'
+    'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, -0.5, 1.0, -0.5)\n'
+    'tracker = &"left_hand"\n'
+    '\n'
+    '[node name="RightHand" type="XRController3D" parent="XROrigin"]\n'
+    'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0.5, 1.0, -0.5)\n'
+    'tracker = &"right_hand"\n'
+    '\n'
+)
+
+# (decal dict source key, decal dict name key, Godot Decal property)
+_DECAL_TEX_KEYS = (
+    ('albedo_src',   'albedo_name',   'texture_albedo'),
+    ('normal_src',   'normal_name',   'texture_normal'),
+    ('orm_src',      'orm_name',      'texture_orm'),
+    ('emission_src', 'emission_name', 'texture_emission'),
+)
+
+
 def generate_godot_scene(cameras, lights, probes, scene_name, env_data, props,
                          has_model=True, use_lightmaps=False,
                          script_assignments=None, decals=None):
@@ -12,8 +71,9 @@ def generate_godot_scene(cameras, lights, probes, scene_name, env_data, props,
     if not decals:
         decals = []
 
+    project_dir = props.mx_godot_project_path
     lmbake_res_path = "res://assets/lightmaps/lightmap_data.lmbake"
-    lmbake_abs_path = os.path.join(props.mx_godot_project_path, "assets", "lightmaps", "lightmap_data.lmbake")
+    lmbake_abs_path = os.path.join(project_dir, "assets", "lightmaps", "lightmap_data.lmbake")
     has_lmbake = use_lightmaps and os.path.exists(lmbake_abs_path)
 
     has_naxpost = getattr(props, 'mx_naxpost_enabled', False)
@@ -32,487 +92,459 @@ def generate_godot_scene(cameras, lights, probes, scene_name, env_data, props,
     if has_compositor:
         load_steps += 1
 
-    naxpost_path = os.path.join(props.mx_godot_project_path, "addons", "naxpost", "naxpost.gd")
+    naxpost_path = os.path.join(project_dir, "addons", "naxpost", "naxpost.gd")
     naxpost_exists = os.path.exists(naxpost_path)
     if naxpost_exists:
         load_steps += 1
 
-    if env_data['type'] == 'hdri' and env_data['hdri_godot_path']:
-        load_steps += 2
-    elif env_data['type'] == 'procedural_sky':
-        load_steps += 2
+    match env_data['type']:
+        case 'hdri' if env_data['hdri_godot_path']:
+            load_steps += 2
+        case 'procedural_sky':
+            load_steps += 2
 
     unique_scripts = set(script_assignments.values())
     load_steps += len(unique_scripts)
 
     cams_with_attrs = [c for c in cameras if c.get('attributes', {}).get('type', 'DISABLED') != 'DISABLED']
     load_steps += len(cams_with_attrs)
+    # Sub-resource ids are keyed on the safe camera name; reused by the node loop.
+    attr_cam_names = {util.safe_name(c['name']) for c in cams_with_attrs}
 
-    _decal_tex_slots = ['albedo_src', 'normal_src', 'orm_src', 'emission_src']
-    for dec in decals:
-        for slot in _decal_tex_slots:
-            if dec.get(slot):
-                load_steps += 1
+    # Decals sharing a texture file share one ext_resource.
+    decal_tex_srcs = {dec[slot] for dec in decals for slot, _, _ in _DECAL_TEX_KEYS if dec.get(slot)}
+    load_steps += len(decal_tex_srcs)
 
     is_xr = props.mx_platform == 'XR'
     if is_xr:
         load_steps += 1
 
-    scene_content = f"[gd_scene load_steps={load_steps} format=3]\n\n"
+    # Accumulate fragments and join once; repeated str += is quadratic.
+    parts = [f"[gd_scene load_steps={load_steps} format=3]\n\n"]
+    add = parts.append
 
     ext_resource_id = 1
 
     if has_model:
-        scene_content += f'[ext_resource type="PackedScene" path="res://scenes/{scene_name}.tscn" id="{ext_resource_id}_model"]\n'
+        add(f'[ext_resource type="PackedScene" path="res://scenes/{scene_name}.tscn" id="{ext_resource_id}_model"]\n')
         ext_resource_id += 1
 
     xr_init_id = None
     if is_xr:
-        scene_content += f'[ext_resource type="Script" path="res://scripts/xr_init.gd" id="{ext_resource_id}_xr_init"]\n'
+        add(f'[ext_resource type="Script" path="res://scripts/xr_init.gd" id="{ext_resource_id}_xr_init"]\n')
         xr_init_id = ext_resource_id
         ext_resource_id += 1
 
     if naxpost_exists:
-        scene_content += f'[ext_resource type="Script" path="res://addons/naxpost/naxpost.gd" id="{ext_resource_id}_naxpost"]\n'
+        add(f'[ext_resource type="Script" path="res://addons/naxpost/naxpost.gd" id="{ext_resource_id}_naxpost"]\n')
         naxpost_id = ext_resource_id
         ext_resource_id += 1
 
     naxpost_effect_id = None
     if has_naxpost:
-        scene_content += f'[ext_resource type="Script" path="res://addons/naxpost/naxpost_compositor_effect.gd" id="{ext_resource_id}_naxpost_effect"]\n'
+        add(f'[ext_resource type="Script" path="res://addons/naxpost/naxpost_compositor_effect.gd" id="{ext_resource_id}_naxpost_effect"]\n')
         naxpost_effect_id = ext_resource_id
         ext_resource_id += 1
 
     anamorphic_effect_id = None
     if has_anamorphic:
-        scene_content += f'[ext_resource type="Script" path="res://addons/naxpost/anamorphic_bloom.gd" id="{ext_resource_id}_anamorphic_effect"]\n'
+        add(f'[ext_resource type="Script" path="res://addons/naxpost/anamorphic_bloom.gd" id="{ext_resource_id}_anamorphic_effect"]\n')
         anamorphic_effect_id = ext_resource_id
         ext_resource_id += 1
 
     lmbake_id = None
     disable_culling_id = None
     if has_lmbake:
-        scene_content += f'[ext_resource type="LightmapGIData" path="{lmbake_res_path}" id="{ext_resource_id}_lmbake"]\n'
+        add(f'[ext_resource type="LightmapGIData" path="{lmbake_res_path}" id="{ext_resource_id}_lmbake"]\n')
         lmbake_id = ext_resource_id
         ext_resource_id += 1
-        scene_content += f'[ext_resource type="Script" path="res://scripts/disable_culling.gd" id="{ext_resource_id}_disable_culling"]\n'
+        add(f'[ext_resource type="Script" path="res://scripts/disable_culling.gd" id="{ext_resource_id}_disable_culling"]\n')
         disable_culling_id = ext_resource_id
         ext_resource_id += 1
 
     hdri_texture_id = None
     if env_data['type'] == 'hdri' and env_data['hdri_godot_path']:
-        scene_content += f'[ext_resource type="Texture2D" path="{env_data["hdri_godot_path"]}" id="{ext_resource_id}_hdri"]\n'
+        add(f'[ext_resource type="Texture2D" path="{env_data["hdri_godot_path"]}" id="{ext_resource_id}_hdri"]\n')
         hdri_texture_id = ext_resource_id
         ext_resource_id += 1
 
     decal_tex_ids = {}
-    decal_tex_keys = [
-        ('albedo_src',   'albedo_name',   'texture_albedo'),
-        ('normal_src',   'normal_name',   'texture_normal'),
-        ('orm_src',      'orm_name',      'texture_orm'),
-        ('emission_src', 'emission_name', 'texture_emission'),
-    ]
+    decal_res_by_src = {}
+    tex_dest_dir = os.path.join(project_dir, "assets", "textures")
+    decal_copies = {}  # dest -> src; copied together once all ids are assigned
+    if decals:
+        os.makedirs(tex_dest_dir, exist_ok=True)
     for dec in decals:
-        for src_key, name_key, _ in decal_tex_keys:
+        for src_key, name_key, _ in _DECAL_TEX_KEYS:
             src_path = dec.get(src_key)
             if not src_path:
                 continue
+            res_id = decal_res_by_src.get(src_path)
+            if res_id:
+                decal_tex_ids[(dec['name'], src_key)] = res_id
+                continue
             filename = os.path.basename(src_path)
-            dest_dir = os.path.join(props.mx_godot_project_path, "assets", "textures")
-            os.makedirs(dest_dir, exist_ok=True)
-            dest_path = os.path.join(dest_dir, filename)
-            if not os.path.exists(dest_path):
-                shutil.copy2(src_path, dest_path)
-                print(f"  Copied decal texture: {filename}")
+            dest_path = os.path.join(tex_dest_dir, filename)
+            if dest_path not in decal_copies and not os.path.exists(dest_path):
+                decal_copies[dest_path] = src_path
             godot_path_str = f"res://assets/textures/{filename}"
             res_id = f"{ext_resource_id}_decaltex"
-            scene_content += f'[ext_resource type="Texture2D" path="{godot_path_str}" id="{res_id}"]\n'
+            add(f'[ext_resource type="Texture2D" path="{godot_path_str}" id="{res_id}"]\n')
             decal_tex_ids[(dec['name'], src_key)] = res_id
+            decal_res_by_src[src_path] = res_id
             ext_resource_id += 1
+    if decal_copies:
+        util.copy_files([(src, dst) for dst, src in decal_copies.items()])
+        print(f"  Copied {len(decal_copies)} decal texture(s)")
 
     script_id_map = {}
     for script_file in sorted(unique_scripts):
         res_id = f"{ext_resource_id}_script"
-        scene_content += f'[ext_resource type="Script" path="res://scripts/{script_file}" id="{res_id}"]\n'
+        add(f'[ext_resource type="Script" path="res://scripts/{script_file}" id="{res_id}"]\n')
         script_id_map[script_file] = res_id
         ext_resource_id += 1
 
-    scene_content += '\n'
+    add('\n')
 
     has_sky = False
 
-    if env_data['type'] == 'hdri' and hdri_texture_id:
-        scene_content += '[sub_resource type="PanoramaSkyMaterial" id="PanoramaSkyMaterial_1"]\n'
-        scene_content += f'panorama = ExtResource("{hdri_texture_id}_hdri")\n'
-        scene_content += f'energy_multiplier = {env_data["strength"]}\n'
-        scene_content += '\n'
-        scene_content += '[sub_resource type="Sky" id="Sky_1"]\n'
-        scene_content += 'sky_material = SubResource("PanoramaSkyMaterial_1")\n'
-        scene_content += '\n'
-        has_sky = True
-
-    elif env_data['type'] == 'procedural_sky' and env_data.get('sky_params'):
-        sky_params = env_data['sky_params']
-        scene_content += '[sub_resource type="PhysicalSkyMaterial" id="PhysicalSkyMaterial_1"]\n'
-        scene_content += f'rayleigh_coefficient = {sky_params["rayleigh_coefficient"]}\n'
-        rc = sky_params['rayleigh_color']
-        scene_content += f'rayleigh_color = Color({rc[0]}, {rc[1]}, {rc[2]}, 1)\n'
-        scene_content += f'mie_coefficient = {sky_params["mie_coefficient"]}\n'
-        scene_content += f'mie_eccentricity = {sky_params["mie_eccentricity"]}\n'
-        mc = sky_params['mie_color']
-        scene_content += f'mie_color = Color({mc[0]}, {mc[1]}, {mc[2]}, 1)\n'
-        scene_content += f'turbidity = {sky_params["turbidity"]}\n'
-        scene_content += f'sun_disk_scale = {sky_params["sun_size"]}\n'
-        gc = sky_params['ground_color']
-        scene_content += f'ground_color = Color({gc[0]}, {gc[1]}, {gc[2]}, 1)\n'
-        scene_content += f'exposure = {sky_params["exposure"]}\n'
-        scene_content += f'energy_multiplier = {sky_params["energy_multiplier"]}\n'
-        scene_content += '\n'
-        scene_content += '[sub_resource type="Sky" id="Sky_1"]\n'
-        scene_content += 'sky_material = SubResource("PhysicalSkyMaterial_1")\n'
-        scene_content += '\n'
-        has_sky = True
-
-    scene_content += '[sub_resource type="Environment" id="Environment_default"]\n'
+    match env_data['type']:
+        case 'hdri' if hdri_texture_id:
+            add('[sub_resource type="PanoramaSkyMaterial" id="PanoramaSkyMaterial_1"]\n')
+            add(f'panorama = ExtResource("{hdri_texture_id}_hdri")\n')
+            add(f'energy_multiplier = {env_data["strength"]}\n')
+            add('\n')
+            add('[sub_resource type="Sky" id="Sky_1"]\n')
+            add('sky_material = SubResource("PanoramaSkyMaterial_1")\n')
+            add('\n')
+            has_sky = True
+
+        case 'procedural_sky' if env_data.get('sky_params'):
+            sky_params = env_data['sky_params']
+            add('[sub_resource type="PhysicalSkyMaterial" id="PhysicalSkyMaterial_1"]\n')
+            add(f'rayleigh_coefficient = {sky_params["rayleigh_coefficient"]}\n')
+            add(f'rayleigh_color = {_rgb(sky_params["rayleigh_color"])}\n')
+            add(f'mie_coefficient = {sky_params["mie_coefficient"]}\n')
+            add(f'mie_eccentricity = {sky_params["mie_eccentricity"]}\n')
+            add(f'mie_color = {_rgb(sky_params["mie_color"])}\n')
+            add(f'turbidity = {sky_params["turbidity"]}\n')
+            add(f'sun_disk_scale = {sky_params["sun_size"]}\n')
+            add(f'ground_color = {_rgb(sky_params["ground_color"])}\n')
+            add(f'exposure = {sky_params["exposure"]}\n')
+            add(f'energy_multiplier = {sky_params["energy_multiplier"]}\n')
+            add('\n')
+            add('[sub_resource type="Sky" id="Sky_1"]\n')
+            add('sky_material = SubResource("PhysicalSkyMaterial_1")\n')
+            add('\n')
+            has_sky = True
+
+    add('[sub_resource type="Environment" id="Environment_default"]\n')
 
     if has_sky:
-        scene_content += 'background_mode = 2\n'
-        scene_content += 'sky = SubResource("Sky_1")\n'
-        scene_content += 'ambient_light_source = 2\n'
-        scene_content += 'reflected_light_source = 2\n'
+        add('background_mode = 2\n')
+        add('sky = SubResource("Sky_1")\n')
+        add('ambient_light_source = 2\n')
+        add('reflected_light_source = 2\n')
     elif env_data['type'] == 'color':
-        scene_content += 'background_mode = 1\n'
-        bc = env_data['background_color']
-        scene_content += f'background_color = Color({bc[0]}, {bc[1]}, {bc[2]}, 1)\n'
+        add('background_mode = 1\n')
+        add(f'background_color = {_rgb(env_data["background_color"])}\n')
 
-    scene_content += f'tonemap_mode = {props.mx_tonemap_mode}\n'
-    scene_content += f'tonemap_exposure = {props.mx_tonemap_exposure}\n'
-    scene_content += f'tonemap_white = {props.mx_tonemap_white}\n'
+    add(f'tonemap_mode = {props.mx_tonemap_mode}\n')
+    add(f'tonemap_exposure = {props.mx_tonemap_exposure}\n')
+    add(f'tonemap_white = {props.mx_tonemap_white}\n')
 
     if props.mx_glow_enabled:
-        scene_content += 'glow_enabled = true\n'
-        scene_content += f'glow_levels/1 = {props.mx_glow_level_1}\n'
-        scene_content += f'glow_levels/2 = {props.mx_glow_level_2}\n'
-        scene_content += f'glow_levels/3 = {props.mx_glow_level_3}\n'
-        scene_content += f'glow_levels/4 = {props.mx_glow_level_4}\n'
-        scene_content += f'glow_levels/5 = {props.mx_glow_level_5}\n'
-        scene_content += f'glow_levels/6 = {props.mx_glow_level_6}\n'
-        scene_content += f'glow_levels/7 = {props.mx_glow_level_7}\n'
-        scene_content += f'glow_normalized = {"true" if props.mx_glow_normalized else "false"}\n'
-        scene_content += f'glow_intensity = {props.mx_glow_intensity}\n'
-        scene_content += f'glow_strength = {props.mx_glow_strength}\n'
-        scene_content += f'glow_bloom = {props.mx_glow_bloom}\n'
-        scene_content += f'glow_blend_mode = {props.mx_glow_blend_mode}\n'
-        scene_content += f'glow_hdr_threshold = {props.mx_glow_hdr_threshold}\n'
-        scene_content += f'glow_hdr_scale = {props.mx_glow_hdr_scale}\n'
+        add('glow_enabled = true\n')
+        add(f'glow_levels/1 = {props.mx_glow_level_1}\n')
+        add(f'glow_levels/2 = {props.mx_glow_level_2}\n')
+        add(f'glow_levels/3 = {props.mx_glow_level_3}\n')
+        add(f'glow_levels/4 = {props.mx_glow_level_4}\n')
+        add(f'glow_levels/5 = {props.mx_glow_level_5}\n')
+        add(f'glow_levels/6 = {props.mx_glow_level_6}\n')
+        add(f'glow_levels/7 = {props.mx_glow_level_7}\n')
+        add(f'glow_normalized = {_gd_bool(props.mx_glow_normalized)}\n')
+        add(f'glow_intensity = {props.mx_glow_intensity}\n')
+        add(f'glow_strength = {props.mx_glow_strength}\n')
+        add(f'glow_bloom = {props.mx_glow_bloom}\n')
+        add(f'glow_blend_mode = {props.mx_glow_blend_mode}\n')
+        add(f'glow_hdr_threshold = {props.mx_glow_hdr_threshold}\n')
+        add(f'glow_hdr_scale = {props.mx_glow_hdr_scale}\n')
 
     if props.mx_ssr_enabled:
-        scene_content += 'ssr_enabled = true\n'
-        scene_content += f'ssr_max_steps = {props.mx_ssr_max_steps}\n'
-        scene_content += f'ssr_fade_in = {props.mx_ssr_fade_in}\n'
-        scene_content += f'ssr_fade_out = {props.mx_ssr_fade_out}\n'
-        scene_content += f'ssr_depth_tolerance = {props.mx_ssr_depth_tolerance}\n'
+        add('ssr_enabled = true\n')
+        add(f'ssr_max_steps = {props.mx_ssr_max_steps}\n')
+        add(f'ssr_fade_in = {props.mx_ssr_fade_in}\n')
+        add(f'ssr_fade_out = {props.mx_ssr_fade_out}\n')
+        add(f'ssr_depth_tolerance = {props.mx_ssr_depth_tolerance}\n')
 
     if props.mx_ssao_enabled:
-        scene_content += 'ssao_enabled = true\n'
-        scene_content += f'ssao_radius = {props.mx_ssao_radius}\n'
-        scene_content += f'ssao_intensity = {props.mx_ssao_intensity}\n'
-        scene_content += f'ssao_power = {props.mx_ssao_power}\n'
-        scene_content += f'ssao_detail = {props.mx_ssao_detail}\n'
-        scene_content += f'ssao_horizon = {props.mx_ssao_horizon}\n'
-        scene_content += f'ssao_sharpness = {props.mx_ssao_sharpness}\n'
-        scene_content += f'ssao_light_affect = {props.mx_ssao_light_affect}\n'
-        scene_content += f'ssao_ao_channel_affect = {props.mx_ssao_ao_channel_affect}\n'
+        add('ssao_enabled = true\n')
+        add(f'ssao_radius = {props.mx_ssao_radius}\n')
+        add(f'ssao_intensity = {props.mx_ssao_intensity}\n')
+        add(f'ssao_power = {props.mx_ssao_power}\n')
+        add(f'ssao_detail = {props.mx_ssao_detail}\n')
+        add(f'ssao_horizon = {props.mx_ssao_horizon}\n')
+        add(f'ssao_sharpness = {props.mx_ssao_sharpness}\n')
+        add(f'ssao_light_affect = {props.mx_ssao_light_affect}\n')
+        add(f'ssao_ao_channel_affect = {props.mx_ssao_ao_channel_affect}\n')
 
     if props.mx_ssil_enabled:
-        scene_content += 'ssil_enabled = true\n'
-        scene_content += f'ssil_radius = {props.mx_ssil_radius}\n'
-        scene_content += f'ssil_intensity = {props.mx_ssil_intensity}\n'
-        scene_content += f'ssil_sharpness = {props.mx_ssil_sharpness}\n'
-        scene_content += f'ssil_normal_rejection = {props.mx_ssil_normal_rejection}\n'
+        add('ssil_enabled = true\n')
+        add(f'ssil_radius = {props.mx_ssil_radius}\n')
+        add(f'ssil_intensity = {props.mx_ssil_intensity}\n')
+        add(f'ssil_sharpness = {props.mx_ssil_sharpness}\n')
+        add(f'ssil_normal_rejection = {props.mx_ssil_normal_rejection}\n')
 
     if props.mx_sdfgi_enabled:
-        scene_content += 'sdfgi_enabled = true\n'
-        scene_content += f'sdfgi_use_occlusion = {str(props.mx_sdfgi_use_occlusion).lower()}\n'
-        scene_content += f'sdfgi_read_sky_light = {str(props.mx_sdfgi_read_sky_light).lower()}\n'
-        scene_content += f'sdfgi_bounce_feedback = {props.mx_sdfgi_bounce_feedback}\n'
-        scene_content += f'sdfgi_cascades = {props.mx_sdfgi_cascades}\n'
-        scene_content += f'sdfgi_min_cell_size = {props.mx_sdfgi_min_cell_size}\n'
-        scene_content += f'sdfgi_cascade0_distance = {props.mx_sdfgi_cascade0_distance}\n'
-        scene_content += f'sdfgi_max_distance = {props.mx_sdfgi_max_distance}\n'
-        scene_content += f'sdfgi_y_scale = {props.mx_sdfgi_y_scale}\n'
-        scene_content += f'sdfgi_energy = {props.mx_sdfgi_energy}\n'
-        scene_content += f'sdfgi_normal_bias = {props.mx_sdfgi_normal_bias}\n'
-        scene_content += f'sdfgi_probe_bias = {props.mx_sdfgi_probe_bias}\n'
+        add('sdfgi_enabled = true\n')
+        add(f'sdfgi_use_occlusion = {_gd_bool(props.mx_sdfgi_use_occlusion)}\n')
+        add(f'sdfgi_read_sky_light = {_gd_bool(props.mx_sdfgi_read_sky_light)}\n')
+        add(f'sdfgi_bounce_feedback = {props.mx_sdfgi_bounce_feedback}\n')
+        add(f'sdfgi_cascades = {props.mx_sdfgi_cascades}\n')
+        add(f'sdfgi_min_cell_size = {props.mx_sdfgi_min_cell_size}\n')
+        add(f'sdfgi_cascade0_distance = {props.mx_sdfgi_cascade0_distance}\n')
+        add(f'sdfgi_max_distance = {props.mx_sdfgi_max_distance}\n')
+        add(f'sdfgi_y_scale = {props.mx_sdfgi_y_scale}\n')
+        add(f'sdfgi_energy = {props.mx_sdfgi_energy}\n')
+        add(f'sdfgi_normal_bias = {props.mx_sdfgi_normal_bias}\n')
+        add(f'sdfgi_probe_bias = {props.mx_sdfgi_probe_bias}\n')
 
     if props.mx_fog_enabled:
-        scene_content += 'fog_enabled = true\n'
-        fc = props.mx_fog_light_color
-        scene_content += f'fog_light_color = Color({fc[0]}, {fc[1]}, {fc[2]}, 1)\n'
-        scene_content += f'fog_light_energy = {props.mx_fog_light_energy}\n'
-        scene_content += f'fog_sun_scatter = {props.mx_fog_sun_scatter}\n'
-        scene_content += f'fog_density = {props.mx_fog_density}\n'
-        scene_content += f'fog_aerial_perspective = {props.mx_fog_aerial_perspective}\n'
-        scene_content += f'fog_sky_affect = {props.mx_fog_sky_affect}\n'
-        scene_content += f'fog_height = {props.mx_fog_height}\n'
-        scene_content += f'fog_height_density = {props.mx_fog_height_density}\n'
+        add('fog_enabled = true\n')
+        add(f'fog_light_color = {_rgb(props.mx_fog_light_color)}\n')
+        add(f'fog_light_energy = {props.mx_fog_light_energy}\n')
+        add(f'fog_sun_scatter = {props.mx_fog_sun_scatter}\n')
+        add(f'fog_density = {props.mx_fog_density}\n')
+        add(f'fog_aerial_perspective = {props.mx_fog_aerial_perspective}\n')
+        add(f'fog_sky_affect = {props.mx_fog_sky_affect}\n')
+        add(f'fog_height = {props.mx_fog_height}\n')
+        add(f'fog_height_density = {props.mx_fog_height_density}\n')
 
     if props.mx_volumetric_fog_enabled:
-        scene_content += 'volumetric_fog_enabled = true\n'
-        scene_content += f'volumetric_fog_density = {props.mx_volumetric_fog_density}\n'
-        va = props.mx_volumetric_fog_albedo
-        scene_content += f'volumetric_fog_albedo = Color({va[0]}, {va[1]}, {va[2]}, 1)\n'
-        ve = props.mx_volumetric_fog_emission
-        scene_content += f'volumetric_fog_emission = Color({ve[0]}, {ve[1]}, {ve[2]}, 1)\n'
-        scene_content += f'volumetric_fog_emission_energy = {props.mx_volumetric_fog_emission_energy}\n'
-        scene_content += f'volumetric_fog_gi_inject = {props.mx_volumetric_fog_gi_inject}\n'
-        scene_content += f'volumetric_fog_anisotropy = {props.mx_volumetric_fog_anisotropy}\n'
-        scene_content += f'volumetric_fog_length = {props.mx_volumetric_fog_length}\n'
-        scene_content += f'volumetric_fog_detail_spread = {props.mx_volumetric_fog_detail_spread}\n'
-        scene_content += f'volumetric_fog_ambient_inject = {props.mx_volumetric_fog_ambient_inject}\n'
-        scene_content += f'volumetric_fog_sky_affect = {props.mx_volumetric_fog_sky_affect}\n'
-        scene_content += f'volumetric_fog_temporal_reprojection_enabled = {str(props.mx_volumetric_fog_temporal_reprojection_enabled).lower()}\n'
-        scene_content += f'volumetric_fog_temporal_reprojection_amount = {props.mx_volumetric_fog_temporal_reprojection_amount}\n'
+        add('volumetric_fog_enabled = true\n')
+        add(f'volumetric_fog_density = {props.mx_volumetric_fog_density}\n')
+        add(f'volumetric_fog_albedo = {_rgb(props.mx_volumetric_fog_albedo)}\n')
+        add(f'volumetric_fog_emission = {_rgb(props.mx_volumetric_fog_emission)}\n')
+        add(f'volumetric_fog_emission_energy = {props.mx_volumetric_fog_emission_energy}\n')
+        add(f'volumetric_fog_gi_inject = {props.mx_volumetric_fog_gi_inject}\n')
+        add(f'volumetric_fog_anisotropy = {props.mx_volumetric_fog_anisotropy}\n')
+        add(f'volumetric_fog_length = {props.mx_volumetric_fog_length}\n')
+        add(f'volumetric_fog_detail_spread = {props.mx_volumetric_fog_detail_spread}\n')
+        add(f'volumetric_fog_ambient_inject = {props.mx_volumetric_fog_ambient_inject}\n')
+        add(f'volumetric_fog_sky_affect = {props.mx_volumetric_fog_sky_affect}\n')
+        add(f'volumetric_fog_temporal_reprojection_enabled = {_gd_bool(props.mx_volumetric_fog_temporal_reprojection_enabled)}\n')
+        add(f'volumetric_fog_temporal_reprojection_amount = {props.mx_volumetric_fog_temporal_reprojection_amount}\n')
 
     if props.mx_adjustments_enabled:
-        scene_content += 'adjustment_enabled = true\n'
-        scene_content += f'adjustment_brightness = {props.mx_adjustments_brightness}\n'
-        scene_content += f'adjustment_contrast = {props.mx_adjustments_contrast}\n'
-        scene_content += f'adjustment_saturation = {props.mx_adjustments_saturation}\n'
+        add('adjustment_enabled = true\n')
+        add(f'adjustment_brightness = {props.mx_adjustments_brightness}\n')
+        add(f'adjustment_contrast = {props.mx_adjustments_contrast}\n')
+        add(f'adjustment_saturation = {props.mx_adjustments_saturation}\n')
 
-    scene_content += '\n'
+    add('\n')
 
     compositor_effect_ids = []
 
     if has_naxpost:
         p = props
-        scene_content += '[sub_resource type="CompositorEffect" id="CompositorEffect_naxpost"]\n'
-        scene_content += f'script = ExtResource("{naxpost_effect_id}_naxpost_effect")\n'
-        scene_content += 'enabled = true\n'
-        scene_content += 'effect_callback_type = 4\n'
-        scene_content += f'enable_chromatic_aberration = {"true" if p.mx_naxpost_ca_enabled else "false"}\n'
-        scene_content += f'enable_vignette = {"true" if p.mx_naxpost_vignette_enabled else "false"}\n'
-        scene_content += f'enable_sharpen = {"true" if p.mx_naxpost_sharpen_enabled else "false"}\n'
-        scene_content += f'enable_colorgrading = {"true" if p.mx_naxpost_colorgrading_enabled else "false"}\n'
-        scene_content += f'ca_intensity = {p.mx_naxpost_ca_intensity}\n'
-        scene_content += f'ca_max_samples = {p.mx_naxpost_ca_max_samples}\n'
-        scene_content += f'vignette_intensity = {p.mx_naxpost_vignette_intensity}\n'
-        scene_content += f'vignette_smoothness = {p.mx_naxpost_vignette_smoothness}\n'
-        scene_content += f'vignette_roundness = {p.mx_naxpost_vignette_roundness}\n'
-        vc = p.mx_naxpost_vignette_color
-        scene_content += f'vignette_color = Color({vc[0]}, {vc[1]}, {vc[2]}, 1)\n'
-        scene_content += f'sharpen_size = {p.mx_naxpost_sharpen_size}\n'
-        scene_content += f'sharpen_strength = {p.mx_naxpost_sharpen_strength}\n'
-        scene_content += f'whitebalance = {p.mx_naxpost_whitebalance}\n'
-        scene_content += f'shadow_max = {p.mx_naxpost_shadow_max}\n'
-        scene_content += f'highlight_min = {p.mx_naxpost_highlight_min}\n'
-        tc = p.mx_naxpost_tint
-        scene_content += f'tint = Color({tc[0]}, {tc[1]}, {tc[2]}, 1)\n'
-        scene_content += f'saturation = {p.mx_naxpost_saturation}\n'
-        scene_content += f'contrast = {p.mx_naxpost_contrast}\n'
-        scene_content += f'gamma = {p.mx_naxpost_gamma}\n'
-        scene_content += f'gain = {p.mx_naxpost_gain}\n'
-        scene_content += f'offset = {p.mx_naxpost_offset}\n'
-        scene_content += '\n'
+        add('[sub_resource type="CompositorEffect" id="CompositorEffect_naxpost"]\n')
+        add(f'script = ExtResource("{naxpost_effect_id}_naxpost_effect")\n')
+        add('enabled = true\n')
+        add('effect_callback_type = 4\n')
+        add(f'enable_chromatic_aberration = {_gd_bool(p.mx_naxpost_ca_enabled)}\n')
+        add(f'enable_vignette = {_gd_bool(p.mx_naxpost_vignette_enabled)}\n')
+        add(f'enable_sharpen = {_gd_bool(p.mx_naxpost_sharpen_enabled)}\n')
+        add(f'enable_colorgrading = {_gd_bool(p.mx_naxpost_colorgrading_enabled)}\n')
+        add(f'ca_intensity = {p.mx_naxpost_ca_intensity}\n')
+        add(f'ca_max_samples = {p.mx_naxpost_ca_max_samples}\n')
+        add(f'vignette_intensity = {p.mx_naxpost_vignette_intensity}\n')
+        add(f'vignette_smoothness = {p.mx_naxpost_vignette_smoothness}\n')
+        add(f'vignette_roundness = {p.mx_naxpost_vignette_roundness}\n')
+        add(f'vignette_color = {_rgb(p.mx_naxpost_vignette_color)}\n')
+        add(f'sharpen_size = {p.mx_naxpost_sharpen_size}\n')
+        add(f'sharpen_strength = {p.mx_naxpost_sharpen_strength}\n')
+        add(f'whitebalance = {p.mx_naxpost_whitebalance}\n')
+        add(f'shadow_max = {p.mx_naxpost_shadow_max}\n')
+        add(f'highlight_min = {p.mx_naxpost_highlight_min}\n')
+        add(f'tint = {_rgb(p.mx_naxpost_tint)}\n')
+        add(f'saturation = {p.mx_naxpost_saturation}\n')
+        add(f'contrast = {p.mx_naxpost_contrast}\n')
+        add(f'gamma = {p.mx_naxpost_gamma}\n')
+        add(f'gain = {p.mx_naxpost_gain}\n')
+        add(f'offset = {p.mx_naxpost_offset}\n')
+        add('\n')
         compositor_effect_ids.append('SubResource("CompositorEffect_naxpost")')
 
     if has_anamorphic:
         p = props
-        scene_content += '[sub_resource type="CompositorEffect" id="CompositorEffect_anamorphic"]\n'
-        scene_content += f'script = ExtResource("{anamorphic_effect_id}_anamorphic_effect")\n'
-        scene_content += 'enabled = true\n'
-        scene_content += 'effect_callback_type = 4\n'
-        scene_content += f'intensity = {p.mx_anamorphic_bloom_intensity}\n'
-        scene_content += f'threshold = {p.mx_anamorphic_bloom_threshold}\n'
-        scene_content += f'soft_knee = {p.mx_anamorphic_bloom_soft_knee}\n'
-        scene_content += f'strength = {p.mx_anamorphic_bloom_strength}\n'
-        scene_content += f'bloom_mix = {p.mx_anamorphic_bloom_mix}\n'
-        scene_content += f'hdr_scale = {p.mx_anamorphic_bloom_hdr_scale}\n'
-        scene_content += f'hdr_luminance_cap = {p.mx_anamorphic_bloom_hdr_luminance_cap}\n'
-        scene_content += f'tint_enabled = {"true" if p.mx_anamorphic_bloom_tint_enabled else "false"}\n'
-        btc = p.mx_anamorphic_bloom_tint_color
-        scene_content += f'tint_color = Color({btc[0]}, {btc[1]}, {btc[2]}, 1)\n'
-        scene_content += f'horizontal = {"true" if p.mx_anamorphic_bloom_horizontal else "false"}\n'
-        scene_content += f'streak_stretch = {p.mx_anamorphic_bloom_streak_stretch}\n'
-        scene_content += f'cross_blur_enabled = {"true" if p.mx_anamorphic_bloom_cross_blur_enabled else "false"}\n'
-        scene_content += f'cross_blur_strength = {p.mx_anamorphic_bloom_cross_blur_strength}\n'
-        scene_content += f'blend_mode = {p.mx_anamorphic_bloom_blend_mode}\n'
-        scene_content += f'mip_levels = {p.mx_anamorphic_bloom_mip_levels}\n'
-        scene_content += '\n'
+        add('[sub_resource type="CompositorEffect" id="CompositorEffect_anamorphic"]\n')
+        add(f'script = ExtResource("{anamorphic_effect_id}_anamorphic_effect")\n')
+        add('enabled = true\n')
+        add('effect_callback_type = 4\n')
+        add(f'intensity = {p.mx_anamorphic_bloom_intensity}\n')
+        add(f'threshold = {p.mx_anamorphic_bloom_threshold}\n')
+        add(f'soft_knee = {p.mx_anamorphic_bloom_soft_knee}\n')
+        add(f'strength = {p.mx_anamorphic_bloom_strength}\n')
+        add(f'bloom_mix = {p.mx_anamorphic_bloom_mix}\n')
+        add(f'hdr_scale = {p.mx_anamorphic_bloom_hdr_scale}\n')
+        add(f'hdr_luminance_cap = {p.mx_anamorphic_bloom_hdr_luminance_cap}\n')
+        add(f'tint_enabled = {_gd_bool(p.mx_anamorphic_bloom_tint_enabled)}\n')
+        add(f'tint_color = {_rgb(p.mx_anamorphic_bloom_tint_color)}\n')
+        add(f'horizontal = {_gd_bool(p.mx_anamorphic_bloom_horizontal)}\n')
+        add(f'streak_stretch = {p.mx_anamorphic_bloom_streak_stretch}\n')
+        add(f'cross_blur_enabled = {_gd_bool(p.mx_anamorphic_bloom_cross_blur_enabled)}\n')
+        add(f'cross_blur_strength = {p.mx_anamorphic_bloom_cross_blur_strength}\n')
+        add(f'blend_mode = {p.mx_anamorphic_bloom_blend_mode}\n')
+        add(f'mip_levels = {p.mx_anamorphic_bloom_mip_levels}\n')
+        add('\n')
         compositor_effect_ids.append('SubResource("CompositorEffect_anamorphic")')
 
     if has_compositor:
         effects_array = ', '.join(compositor_effect_ids)
-        scene_content += '[sub_resource type="Compositor" id="Compositor_1"]\n'
-        scene_content += f'compositor_effects = Array[CompositorEffect]([{effects_array}])\n'
-        scene_content += '\n'
+        add('[sub_resource type="Compositor" id="Compositor_1"]\n')
+        add(f'compositor_effects = Array[CompositorEffect]([{effects_array}])\n')
+        add('\n')
 
     for cam in cams_with_attrs:
         safe_cam = util.safe_name(cam['name'])
         attrs = cam['attributes']
         attr_type = attrs['type']
         res_type = 'CameraAttributesPractical' if attr_type == 'PRACTICAL' else 'CameraAttributesPhysical'
-        scene_content += f'[sub_resource type="{res_type}" id="CameraAttr_{safe_cam}"]\n'
+        add(f'[sub_resource type="{res_type}" id="CameraAttr_{safe_cam}"]\n')
         if attr_type == 'PRACTICAL':
-            scene_content += f'dof_blur_far_enabled = {"true" if attrs["dof_far_enabled"] else "false"}\n'
-            scene_content += f'dof_blur_near_enabled = {"true" if attrs["dof_near_enabled"] else "false"}\n'
-            scene_content += f'dof_blur_amount = {attrs["dof_amount"]}\n'
-            scene_content += f'auto_exposure_min_sensitivity = {attrs["auto_exp_min_sensitivity"]}\n'
-            scene_content += f'auto_exposure_max_sensitivity = {attrs["auto_exp_max_sensitivity"]}\n'
+            add(f'dof_blur_far_enabled = {_gd_bool(attrs["dof_far_enabled"])}\n')
+            add(f'dof_blur_near_enabled = {_gd_bool(attrs["dof_near_enabled"])}\n')
+            add(f'dof_blur_amount = {attrs["dof_amount"]}\n')
+            add(f'auto_exposure_min_sensitivity = {attrs["auto_exp_min_sensitivity"]}\n')
+            add(f'auto_exposure_max_sensitivity = {attrs["auto_exp_max_sensitivity"]}\n')
         else:
-            scene_content += f'frustum_focus_distance = {attrs["frustum_focus_distance"]}\n'
-            scene_content += f'frustum_focal_length = {attrs["frustum_focal_length"]}\n'
-            scene_content += f'frustum_near = {attrs["frustum_near"]}\n'
-            scene_content += f'frustum_far = {attrs["frustum_far"]}\n'
-            scene_content += f'auto_exposure_min_exposure_value = {attrs["phys_auto_exp_min"]}\n'
-            scene_content += f'auto_exposure_max_exposure_value = {attrs["phys_auto_exp_max"]}\n'
-        scene_content += f'exposure_multiplier = {attrs["exposure_multiplier"]}\n'
-        scene_content += f'auto_exposure_enabled = {"true" if attrs["auto_exp_enabled"] else "false"}\n'
-        scene_content += f'auto_exposure_scale = {attrs["auto_exp_scale"]}\n'
-        scene_content += f'auto_exposure_speed = {attrs["auto_exp_speed"]}\n'
-        scene_content += '\n'
-
-    scene_content += '[node name="Main" type="Node3D"]\n'
+            add(f'frustum_focus_distance = {attrs["frustum_focus_distance"]}\n')
+            add(f'frustum_focal_length = {attrs["frustum_focal_length"]}\n')
+            add(f'frustum_near = {attrs["frustum_near"]}\n')
+            add(f'frustum_far = {attrs["frustum_far"]}\n')
+            add(f'auto_exposure_min_exposure_value = {attrs["phys_auto_exp_min"]}\n')
+            add(f'auto_exposure_max_exposure_value = {attrs["phys_auto_exp_max"]}\n')
+        add(f'exposure_multiplier = {attrs["exposure_multiplier"]}\n')
+        add(f'auto_exposure_enabled = {_gd_bool(attrs["auto_exp_enabled"])}\n')
+        add(f'auto_exposure_scale = {attrs["auto_exp_scale"]}\n')
+        add(f'auto_exposure_speed = {attrs["auto_exp_speed"]}\n')
+        add('\n')
+
+    add('[node name="Main" type="Node3D"]\n')
     if is_xr and xr_init_id:
-        scene_content += f'script = ExtResource("{xr_init_id}_xr_init")\n'
-    scene_content += '\n'
+        add(f'script = ExtResource("{xr_init_id}_xr_init")\n')
+    add('\n')
 
-    scene_content += '[node name="BakedGI" type="DirectionalLight3D" parent="."]\n'
-    scene_content += 'light_color = Color(0, 0, 0, 1)\n'
-    scene_content += 'light_energy = 0.0\n'
-    scene_content += 'editor_only = true\n\n'
+    add(_BAKED_GI_NODE)
 
     if is_xr:
-        scene_content += '[node name="XROrigin" type="XROrigin3D" parent="."]\n\n'
-        scene_content += '[node name="XRCamera" type="XRCamera3D" parent="XROrigin"]\n'
-        scene_content += 'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1.7, 0)\n'
-        scene_content += '\n'
-        scene_content += '[node name="LeftHand" type="XRController3D" parent="XROrigin"]\n'
-        scene_content += 'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, -0.5, 1.0, -0.5)\n'
-        scene_content += 'tracker = &"left_hand"\n'
-        scene_content += '\n'
-        scene_content += '[node name="RightHand" type="XRController3D" parent="XROrigin"]\n'
-        scene_content += 'transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0.5, 1.0, -0.5)\n'
-        scene_content += 'tracker = &"right_hand"\n'
-        scene_content += '\n'
+        add(_XR_RIG_NODES)
 
     for i, cam in enumerate(cameras):
         if is_xr:
             continue
         safe_cam_name = util.safe_name(cam['name'])
-        scene_content += f'[node name="{safe_cam_name}" type="Camera3D" parent="."]\n'
-        scene_content += f'transform = {cam["transform"]}\n'
-        scene_content += f'fov = {cam["fov"]}\n'
-        scene_content += f'near = {cam["near"]}\n'
-        scene_content += f'far = {cam["far"]}\n'
+        add(f'[node name="{safe_cam_name}" type="Camera3D" parent="."]\n')
+        add(f'transform = {cam["transform"]}\n')
+        add(f'fov = {cam["fov"]}\n')
+        add(f'near = {cam["near"]}\n')
+        add(f'far = {cam["far"]}\n')
         if cam.get('render_layers', 1) != 1:
-            scene_content += f'layers = {cam["render_layers"]}\n'
-        if cam.get('attributes', {}).get('type', 'DISABLED') != 'DISABLED':
-            scene_content += f'attributes = SubResource("CameraAttr_{safe_cam_name}")\n'
+            add(f'layers = {cam["render_layers"]}\n')
+        if safe_cam_name in attr_cam_names:
+            add(f'attributes = SubResource("CameraAttr_{safe_cam_name}")\n')
         if i == 0:
-            scene_content += 'current = true\n'
+            add('current = true\n')
         if safe_cam_name in script_assignments:
             res_id = script_id_map[script_assignments[safe_cam_name]]
-            scene_content += f'script = ExtResource("{res_id}")\n'
-        scene_content += '\n'
+            add(f'script = ExtResource("{res_id}")\n')
+        add('\n')
 
     for light in lights:
-        safe_light_name = util.safe_name(light['name'])
-        if light['type'] == 'SUN':
-            godot_type = "DirectionalLight3D"
-        elif light['type'] == 'POINT':
-            godot_type = "OmniLight3D"
-        elif light['type'] == 'SPOT':
-            godot_type = "SpotLight3D"
-        else:
+        godot_type = _GODOT_LIGHT_TYPES.get(light['type'])
+        if godot_type is None:
             continue
-        scene_content += f'[node name="{safe_light_name}" type="{godot_type}" parent="."]\n'
-        scene_content += f'transform = {light["transform"]}\n'
-        scene_content += f'light_energy = {light["energy"]}\n'
-        scene_content += f'light_color = Color({light["color"][0]}, {light["color"][1]}, {light["color"][2]}, 1)\n'
-        scene_content += f'shadow_enabled = {str(light.get("shadow_enabled", True)).lower()}\n'
+        safe_light_name = util.safe_name(light['name'])
+        add(f'[node name="{safe_light_name}" type="{godot_type}" parent="."]\n')
+        add(f'transform = {light["transform"]}\n')
+        add(f'light_energy = {light["energy"]}\n')
+        add(f'light_color = {_rgb(light["color"])}\n')
+        add(f'shadow_enabled = {_gd_bool(light.get("shadow_enabled", True))}\n')
         if light.get('render_layers', 1) != 1:
-            scene_content += f'layers = {light["render_layers"]}\n'
-        if light['type'] in ['POINT', 'SPOT']:
-            scene_content += f'omni_range = {light.get("range", 10.0)}\n'
+            add(f'layers = {light["render_layers"]}\n')
+        if light['type'] in ('POINT', 'SPOT'):
+            add(f'omni_range = {light.get("range", 10.0)}\n')
         if light['type'] == 'SPOT':
-            scene_content += f'spot_angle = {light.get("spot_angle", 45)}\n'
+            add(f'spot_angle = {light.get("spot_angle", 45)}\n')
         if safe_light_name in script_assignments:
             res_id = script_id_map[script_assignments[safe_light_name]]
-            scene_content += f'script = ExtResource("{res_id}")\n'
-        scene_content += '\n'
+            add(f'script = ExtResource("{res_id}")\n')
+        add('\n')
 
     for probe in probes:
         safe_probe_name = util.safe_name(probe['name'])
-        update_mode_map = {'ONCE': 0, 'ALWAYS': 1}
-        ambient_mode_map = {'DISABLED': 0, 'ENVIRONMENT': 1, 'CONSTANT_COLOR': 2}
-        scene_content += f'[node name="{safe_probe_name}" type="ReflectionProbe" parent="."]\n'
-        scene_content += f'transform = {probe["transform"]}\n'
+        add(f'[node name="{safe_probe_name}" type="ReflectionProbe" parent="."]\n')
+        add(f'transform = {probe["transform"]}\n')
         size = probe['size']
-        scene_content += f'size = Vector3({size[0]}, {size[1]}, {size[2]})\n'
+        add(f'size = Vector3({size[0]}, {size[1]}, {size[2]})\n')
         if probe.get('render_layers', 1) != 1:
-            scene_content += f'layers = {probe["render_layers"]}\n'
-        scene_content += f'update_mode = {update_mode_map.get(probe.get("update_mode", "ONCE"), 0)}\n'
-        scene_content += f'intensity = {probe.get("intensity", 1.0)}\n'
-        scene_content += f'max_distance = {probe.get("max_distance", 0.0)}\n'
-        scene_content += f'ambient_mode = {ambient_mode_map.get(probe.get("ambient_mode", "DISABLED"), 0)}\n'
-        scene_content += f'cull_mask = {probe.get("cull_mask", 1048575)}\n'
-        scene_content += f'reflection_mask = {probe.get("reflection_mask", 1048575)}\n'
-        scene_content += f'box_projection = {"true" if probe.get("box_projection", True) else "false"}\n'
-        scene_content += f'interior = {"true" if probe.get("interior", False) else "false"}\n'
-        scene_content += f'enable_shadows = {"true" if probe.get("enable_shadows", False) else "false"}\n'
-        scene_content += f'blend_distance = {probe.get("blend_distance", 0.0)}\n'
-        scene_content += '\n'
+            add(f'layers = {probe["render_layers"]}\n')
+        add(f'update_mode = {_PROBE_UPDATE_MODES.get(probe.get("update_mode", "ONCE"), 0)}\n')
+        add(f'intensity = {probe.get("intensity", 1.0)}\n')
+        add(f'max_distance = {probe.get("max_distance", 0.0)}\n')
+        add(f'ambient_mode = {_PROBE_AMBIENT_MODES.get(probe.get("ambient_mode", "DISABLED"), 0)}\n')
+        add(f'cull_mask = {probe.get("cull_mask", 1048575)}\n')
+        add(f'reflection_mask = {probe.get("reflection_mask", 1048575)}\n')
+        add(f'box_projection = {_gd_bool(probe.get("box_projection", True))}\n')
+        add(f'interior = {_gd_bool(probe.get("interior", False))}\n')
+        add(f'enable_shadows = {_gd_bool(probe.get("enable_shadows", False))}\n')
+        add(f'blend_distance = {probe.get("blend_distance", 0.0)}\n')
+        add('\n')
 
     if has_model:
-        scene_content += f'[node name="{scene_name}" parent="." instance=ExtResource("1_model")]\n\n'
+        add(f'[node name="{scene_name}" parent="." instance=ExtResource("1_model")]\n\n')
 
     if has_lmbake:
-        scene_content += '[node name="LightmapGI" type="LightmapGI" parent="."]\n'
-        scene_content += f'light_data = ExtResource("{lmbake_id}_lmbake")\n'
-        scene_content += f'script = ExtResource("{disable_culling_id}_disable_culling")\n\n'
+        add('[node name="LightmapGI" type="LightmapGI" parent="."]\n')
+        add(f'light_data = ExtResource("{lmbake_id}_lmbake")\n')
+        add(f'script = ExtResource("{disable_culling_id}_disable_culling")\n\n')
 
     for dec in decals:
         safe_dec = util.safe_name(dec['name'])
-        scene_content += f'[node name="{safe_dec}" type="Decal" parent="."]\n'
-        scene_content += f'transform = {dec["transform"]}\n'
+        add(f'[node name="{safe_dec}" type="Decal" parent="."]\n')
+        add(f'transform = {dec["transform"]}\n')
         sz = dec['size']
-        scene_content += f'size = Vector3({sz[0]}, {sz[1]}, {sz[2]})\n'
-        for src_key, _, prop_name in [
-            ('albedo_src',   'albedo_name',   'texture_albedo'),
-            ('normal_src',   'normal_name',   'texture_normal'),
-            ('orm_src',      'orm_name',      'texture_orm'),
-            ('emission_src', 'emission_name', 'texture_emission'),
-        ]:
+        add(f'size = Vector3({sz[0]}, {sz[1]}, {sz[2]})\n')
+        for src_key, _, prop_name in _DECAL_TEX_KEYS:
             tex_id = decal_tex_ids.get((dec['name'], src_key))
             if tex_id:
-                scene_content += f'{prop_name} = ExtResource("{tex_id}")\n'
-        scene_content += f'emission_energy = {dec["emission_energy"]}\n'
+                add(f'{prop_name} = ExtResource("{tex_id}")\n')
+        add(f'emission_energy = {dec["emission_energy"]}\n')
         mc = dec['modulate']
-        scene_content += f'modulate = Color({mc[0]}, {mc[1]}, {mc[2]}, {mc[3]})\n'
-        scene_content += f'albedo_mix = {dec["albedo_mix"]}\n'
-        scene_content += f'normal_fade = {dec["normal_fade"]}\n'
-        scene_content += f'upper_fade = {dec["upper_fade"]}\n'
-        scene_content += f'lower_fade = {dec["lower_fade"]}\n'
-        scene_content += f'distance_fade_enabled = {"true" if dec["distance_fade"] else "false"}\n'
+        add(f'modulate = Color({mc[0]}, {mc[1]}, {mc[2]}, {mc[3]})\n')
+        add(f'albedo_mix = {dec["albedo_mix"]}\n')
+        add(f'normal_fade = {dec["normal_fade"]}\n')
+        add(f'upper_fade = {dec["upper_fade"]}\n')
+        add(f'lower_fade = {dec["lower_fade"]}\n')
+        add(f'distance_fade_enabled = {_gd_bool(dec["distance_fade"])}\n')
         if dec['distance_fade']:
-            scene_content += f'distance_fade_begin = {dec["distance_fade_begin"]}\n'
-            scene_content += f'distance_fade_length = {dec["distance_fade_length"]}\n'
+            add(f'distance_fade_begin = {dec["distance_fade_begin"]}\n')
+            add(f'distance_fade_length = {dec["distance_fade_length"]}\n')
         if dec['cull_mask'] != 1048575:
-            scene_content += f'cull_mask = {dec["cull_mask"]}\n'
-        scene_content += '\n'
+            add(f'cull_mask = {dec["cull_mask"]}\n')
+        add('\n')
 
-    scene_content += '[node name="WorldEnvironment" type="WorldEnvironment" parent="."]\n'
-    scene_content += 'environment = SubResource("Environment_default")\n'
+    add('[node name="WorldEnvironment" type="WorldEnvironment" parent="."]\n')
+    add('environment = SubResource("Environment_default")\n')
     if has_compositor:
-        scene_content += 'compositor = SubResource("Compositor_1")\n'
-    scene_content += '\n'
+        add('compositor = SubResource("Compositor_1")\n')
+    add('\n')
 
     if naxpost_exists:
-        scene_content += '[node name="NaxPostController" type="Node" parent="."]\n'
-        scene_content += f'script = ExtResource("{naxpost_id}_naxpost")\n'
+        add('[node name="NaxPostController" type="Node" parent="."]\n')
+        add(f'script = ExtResource("{naxpost_id}_naxpost")\n')
 
-    return scene_content
+    return ''.join(parts)
 
 
 def create_inherited_scene_file(project_dir, scene_name, props,
@@ -520,8 +552,7 @@ def create_inherited_scene_file(project_dir, scene_name, props,
     """Create an inherited .tscn referencing the GLTF, with scripts/layers/lightmap materials."""
 
     scenes_dir = os.path.join(project_dir, "scenes")
-    if not os.path.exists(scenes_dir):
-        os.makedirs(scenes_dir)
+    os.makedirs(scenes_dir, exist_ok=True)
 
     inherited_scene_path = os.path.join(scenes_dir, f"{scene_name}.tscn")
     file_ext = 'gltf' if props.mx_export_format == 'GLTF' else 'glb'
@@ -535,8 +566,10 @@ def create_inherited_scene_file(project_dir, scene_name, props,
     if props.mx_lightmap_mode == 'INDIVIDUAL':
         manifest_path = os.path.join(project_dir, "assets", "lightmaps", "manifest.json")
         if os.path.exists(manifest_path):
-            with open(manifest_path, 'r') as mf:
-                mdata = json.load(mf)
+            # Bytes straight to json.loads: one read, UTF-8 detected by the
+            # parser instead of the platform's locale encoding.
+            with open(manifest_path, 'rb') as mf:
+                mdata = json.loads(mf.read())
             lm_ext = mdata.get("ext", "hdr")
             for obj_name, lm_file in mdata.get("lightmaps", {}).items():
                 individual_mats[util.safe_name(obj_name)] = {
@@ -554,15 +587,19 @@ def create_inherited_scene_file(project_dir, scene_name, props,
         load_steps += len(individual_mats)
         load_steps += len(individual_mats)
 
-    scene_content = f'[gd_scene load_steps={load_steps} format=3]\n\n'
+    # Accumulate fragments and join once; written through write_if_changed
+    # so Godot never loads a half-written scene if generation fails.
+    parts = []
+    add = parts.append
+    add(f'[gd_scene load_steps={load_steps} format=3]\n\n')
 
-    scene_content += f'[ext_resource type="PackedScene" path="res://assets/meshes/{scene_name}.{file_ext}" id="1"]\n'
+    add(f'[ext_resource type="PackedScene" path="res://assets/meshes/{scene_name}.{file_ext}" id="1"]\n')
 
     script_id_map = {}
     ext_id = 2
     for script_file in sorted(unique_scripts):
         res_id = f"{ext_id}_script"
-        scene_content += f'[ext_resource type="Script" path="res://scripts/{script_file}" id="{res_id}"]\n'
+        add(f'[ext_resource type="Script" path="res://scripts/{script_file}" id="{res_id}"]\n')
         script_id_map[script_file] = res_id
         ext_id += 1
 
@@ -570,28 +607,28 @@ def create_inherited_scene_file(project_dir, scene_name, props,
     lm_tex_ids = {}
     if individual_mats:
         shader_ext_id = f"{ext_id}_shader"
-        scene_content += f'[ext_resource type="Shader" path="res://assets/StandardPlusAuto.gdshader" id="{shader_ext_id}"]\n'
+        add(f'[ext_resource type="Shader" path="res://assets/StandardPlusAuto.gdshader" id="{shader_ext_id}"]\n')
         ext_id += 1
         for sn, info in individual_mats.items():
             lm_res_id = f"{ext_id}_lm_{sn}"
             lm_path = f'res://assets/lightmaps/{info["lm_file"]}.{info["lm_ext"]}'
-            scene_content += f'[ext_resource type="Texture2D" path="{lm_path}" id="{lm_res_id}"]\n'
+            add(f'[ext_resource type="Texture2D" path="{lm_path}" id="{lm_res_id}"]\n')
             lm_tex_ids[sn] = lm_res_id
             ext_id += 1
 
-    scene_content += '\n'
+    add('\n')
 
     if individual_mats:
-        bicubic = str(props.mx_lightmap_bicubic_filtering).lower()
+        bicubic = _gd_bool(props.mx_lightmap_bicubic_filtering)
         for sn, info in individual_mats.items():
-            scene_content += f'[sub_resource type="ShaderMaterial" id="{info["mat_id"]}"]\n'
-            scene_content += f'shader = ExtResource("{shader_ext_id}")\n'
-            scene_content += f'shader_parameter/texture_lightmap = ExtResource("{lm_tex_ids[sn]}")\n'
-            scene_content += f'shader_parameter/use_bicubic_lightmap = {bicubic}\n'
-            scene_content += f'shader_parameter/lightmap_strength = 1.0\n'
-            scene_content += '\n'
+            add(f'[sub_resource type="ShaderMaterial" id="{info["mat_id"]}"]\n')
+            add(f'shader = ExtResource("{shader_ext_id}")\n')
+            add(f'shader_parameter/texture_lightmap = ExtResource("{lm_tex_ids[sn]}")\n')
+            add(f'shader_parameter/use_bicubic_lightmap = {bicubic}\n')
+            add(f'shader_parameter/lightmap_strength = 1.0\n')
+            add('\n')
 
-    scene_content += f'[node name="{scene_name}" instance=ExtResource("1")]\n'
+    add(f'[node name="{scene_name}" instance=ExtResource("1")]\n')
 
     # script_assignments / layer_assignments keys are full paths (e.g. "Parent/Child")
     # individual_mats keys are leaf names (always direct children of the inherited root)
@@ -603,23 +640,22 @@ def create_inherited_scene_file(project_dir, scene_name, props,
         path_parts = node_path.split('/')
         node_name = path_parts[-1]
         parent = '/'.join(path_parts[:-1]) if len(path_parts) > 1 else '.'
-        scene_content += f'\n[node name="{node_name}" parent="{parent}"]\n'
+        add(f'\n[node name="{node_name}" parent="{parent}"]\n')
         if node_path in layer_assignments:
-            scene_content += f'layers = {layer_assignments[node_path]}\n'
+            add(f'layers = {layer_assignments[node_path]}\n')
         if node_path in script_assignments:
             res_id = script_id_map[script_assignments[node_path]]
-            scene_content += f'script = ExtResource("{res_id}")\n'
+            add(f'script = ExtResource("{res_id}")\n')
         if node_name in individual_mats:
             mat_id = individual_mats[node_name]['mat_id']
-            scene_content += f'surface_material_override/0 = SubResource("{mat_id}")\n'
+            add(f'surface_material_override/0 = SubResource("{mat_id}")\n')
 
     for node_name in sorted(solo_mat_nodes):
-        scene_content += f'\n[node name="{node_name}" parent="."]\n'
+        add(f'\n[node name="{node_name}" parent="."]\n')
         mat_id = individual_mats[node_name]['mat_id']
-        scene_content += f'surface_material_override/0 = SubResource("{mat_id}")\n'
+        add(f'surface_material_override/0 = SubResource("{mat_id}")\n')
 
-    with open(inherited_scene_path, 'w') as f:
-        f.write(scene_content)
+    util.write_if_changed(inherited_scene_path, ''.join(parts))
 
     print(f"Created inherited scene at: {inherited_scene_path}")
     if script_assignments:
@@ -632,8 +668,12 @@ def create_inherited_scene_file(project_dir, scene_name, props,
 
 
 def update_inherited_scene_scripts(project_dir, scene_name,
-                                   script_assignments=None, layer_assignments=None):
-    """Surgically update script/layer assignments in an inherited scene, preserving lightmap data."""
+                                   script_assignments=None, layer_assignments=None,
+                                   lines=None):
+    """Surgically update script/layer assignments in an inherited scene, preserving lightmap data.
+
+    lines may carry the scene file already split into lines by the caller,
+    so it is not read from disk twice."""
 
     if not script_assignments:
         script_assignments = {}
@@ -642,22 +682,21 @@ def update_inherited_scene_scripts(project_dir, scene_name,
 
     inherited_scene_path = os.path.join(project_dir, "scenes", f"{scene_name}.tscn")
 
-    if not os.path.exists(inherited_scene_path):
-        print(f"Warning: Inherited scene not found at {inherited_scene_path}")
-        return
-
-    with open(inherited_scene_path, 'r') as f:
-        lines = f.readlines()
-    lines = [line.rstrip('\n') for line in lines]
+    if lines is None:
+        if not os.path.exists(inherited_scene_path):
+            print(f"Warning: Inherited scene not found at {inherited_scene_path}")
+            return
+        with open(inherited_scene_path, 'r') as f:
+            lines = f.read().splitlines()
 
     valid_ext_ids = set()
     filtered_lines = []
     for line in lines:
         if line.startswith('[ext_resource'):
-            id_match = re.search(r'id="([^"]+)"', line)
             if 'type="Script"' in line and 'path="res://scripts/' in line:
                 continue
-            elif id_match:
+            id_match = _EXT_ID_RE.search(line)
+            if id_match:
                 valid_ext_ids.add(id_match.group(1))
         filtered_lines.append(line)
     lines = filtered_lines
@@ -692,8 +731,8 @@ def update_inherited_scene_scripts(project_dir, scene_name,
         line = lines[i]
 
         if line.startswith('[node name="') and 'parent=' in line:
-            name_match = re.search(r'\[node name="([^"]+)"', line)
-            parent_match = re.search(r'parent="([^"]+)"', line)
+            name_match = _NODE_NAME_RE.search(line)
+            parent_match = _NODE_PARENT_RE.search(line)
             node_name = name_match.group(1) if name_match else None
             parent_str = parent_match.group(1) if parent_match else '.'
             full_path = node_name if parent_str == '.' else f"{parent_str}/{node_name}"
@@ -750,11 +789,10 @@ def update_inherited_scene_scripts(project_dir, scene_name,
 
     for j, line in enumerate(result_lines):
         if line.startswith('[gd_scene'):
-            result_lines[j] = re.sub(r'load_steps=\d+', f'load_steps={load_steps}', line)
+            result_lines[j] = _LOAD_STEPS_RE.sub(f'load_steps={load_steps}', line)
             break
 
-    with open(inherited_scene_path, 'w') as f:
-        f.write('\n'.join(result_lines))
+    util.write_if_changed(inherited_scene_path, '\n'.join(result_lines))
 
     print(f"Updated inherited scene scripts (preserved lightmap data)")
     if script_assignments:
@@ -1,9 +1,11 @@
-import bpy, os
+import bpy
+from bpy.app.handlers import persistent
 from bpy.utils import register_class, unregister_class
 from . import scene, object
+from ..utility import util
 from ..ui import script_list
 
-classes = [
+classes = (
     # UI Lists
     script_list.MX_UL_ScriptList,
 
@@ -27,13 +29,28 @@ classes = [
     scene.MX_PT_Publishing,
 
     # Object panels
-    object.MX_PT_ObjectMenu
-]
+    object.MX_PT_ObjectMenu,
+)
+
+
+
+@persistent
+def _clear_project_status(_):
+    # The opened .blend may point at a project changed outside Blender
+    util.project_status.cache_clear()
+
 
 def register():
     for cls in classes:
         register_class(cls)
+    bpy.app.handlers.load_post.append(_clear_project_status)
+
 
 def unregister():
-    for cls in classes:
-        unregister_class(cls)
\ No newline at end of file
+    # Safe after a partial register(): only what was registered is removed
+    if _clear_project_status in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_project_status)
+    # Reverse order, so sub-panels go before their bl_parent_id
+    for cls in reversed(classes):
+        if cls.is_registered:
+            unregister_class(cls)
@@ -1,7 +1,4 @@
 import bpy
-from bpy.props import *
-from bpy.types import Menu, Panel
-import os
 
 class MX_PT_ObjectMenu(bpy.types.Panel):
     bl_label = "Meridian - Godot Export"
@@ -12,7 +9,6 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
-        scene = context.scene
         obj = context.object
         layout.use_property_split = True
         layout.use_property_decorate = False
@@ -22,28 +18,28 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
             return
 
         obj_props = obj.MX_ObjectProperties
+        obj_type = obj.type
 
         # Export control - always stays enabled
+        # Single-control boxes take the prop directly; no wrapper column/row
         box = layout.box()
-        col = box.column(align=True)
-        col.prop(obj_props, "mx_export_object")
+        box.prop(obj_props, "mx_export_object")
 
         # Disable everything below the checkbox when export is off
         export_enabled = obj_props.mx_export_object
 
         # Mesh-specific settings
-        if obj.type == "MESH":
+        if obj_type == "MESH":
             box = layout.box()
             box.enabled = export_enabled
             box.label(text="Godot Node Settings", icon='OBJECT_DATA')
-            col = box.column(align=True)
-            col.prop(obj_props, "mx_object_type_override")
+            box.prop(obj_props, "mx_object_type_override")
 
             # Collision settings — hidden until export support is implemented
             # LOD settings — hidden until export support is implemented
 
         # Camera-specific settings
-        if obj.type == "CAMERA":
+        if obj_type == "CAMERA":
             box = layout.box()
             box.enabled = export_enabled
             box.label(text="Camera Attributes", icon='CAMERA_DATA')
@@ -88,15 +84,14 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
                     col.prop(obj_props, "mx_cam_auto_exp_speed")
 
         # Render layers (meshes, lights, empties — anything with VisualInstance3D in Godot)
-        if obj.type in {"MESH", "LIGHT", "EMPTY"}:
+        if obj_type in {"MESH", "LIGHT", "EMPTY"}:
             box = layout.box()
             box.enabled = export_enabled
             box.label(text="Layers", icon='RENDERLAYERS')
-            col = box.column(align=True)
-            col.prop(obj_props, "mx_render_layers", text="")
+            box.prop(obj_props, "mx_render_layers", text="")
 
         # Decal (EMPTY objects)
-        if obj.type == "EMPTY":
+        if obj_type == "EMPTY":
             box = layout.box()
             box.enabled = export_enabled
             row = box.row(align=True)
@@ -138,7 +133,7 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
                 col.prop(obj_props, "mx_decal_cull_mask", text="")
 
         # Reflection probe specific
-        if obj.type == "LIGHT_PROBE":
+        if obj_type == "LIGHT_PROBE":
             box = layout.box()
             box.enabled = export_enabled
             box.label(text="Reflection Probe", icon='WORLD')
@@ -186,8 +181,7 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
             # Script selection dropdown based on type
             has_script_selected = False
             if script.script_type == 'GDSCRIPT':
-                row = col.row(align=True)
-                row.prop(script, "custom_script", text="")
+                col.prop(script, "custom_script", text="")
                 has_script_selected = script.custom_script and script.custom_script != 'NONE'
             elif script.script_type == 'BUNDLED':
                 row = col.row(align=True)
@@ -214,5 +208,4 @@ class MX_PT_ObjectMenu(bpy.types.Panel):
         box = layout.box()
         box.enabled = export_enabled
         box.label(text="Godot Metadata", icon='SCRIPT')
-        col = box.column(align=True)
-        col.prop(obj_props, "mx_godot_groups")
+        box.prop(obj_props, "mx_godot_groups")
@@ -1,8 +1,16 @@
 import bpy
-from bpy.props import *
-from bpy.types import Menu, Panel
-import os
-from ..assetstore.bm import BM_STATUS
+from .. import logo_handler
+from ..utility import util
+from ..operators.livelink import is_connected as _ll_is_connected, is_running as _ll_is_running
+
+# Addon module name, the key for its entry in context.preferences.addons
+_ADDON_ID = __package__.split('.')[0]
+
+
+def _draw_toggle_header(self, context):
+    """Shared draw_header: the panel's enable checkbox, named by _toggle_prop."""
+    self.layout.prop(context.scene.MX_SceneProperties, self._toggle_prop, text="")
+
 
 class MX_PT_Panel(bpy.types.Panel):
     bl_label = "Meridian - Godot Exporter"
@@ -16,31 +24,24 @@ class MX_PT_Panel(bpy.types.Panel):
         layout.use_property_split = True
         layout.use_property_decorate = False
 
-        scene = context.scene
-        props = scene.MX_SceneProperties
-
-        # Logo display (if logo is loaded)
-        try:
-            from .. import logo_handler
-            if "main" in logo_handler.preview_collections:
-                pcoll = logo_handler.preview_collections["main"]
-                if "meridian_logo" in pcoll:
-                    # Disable property split for logo section only
-                    col = layout.column(align=True)
-                    col.use_property_split = False
-                    col.use_property_decorate = False
-
-                    row = col.row()
-                    row.alignment = 'CENTER'
-                    row.scale_y = 1.0
-                    row.template_icon(icon_value=pcoll["meridian_logo"].icon_id, scale=10.0)
-
-                    col.separator(factor=0.1)
-        except:
-            pass  # Logo not loaded, skip display
+        props = context.scene.MX_SceneProperties
+
+        # Logo display (if logo is loaded); icon_id is resolved once at load time
+        icon_id = logo_handler.logo_icon_id
+        if icon_id:
+            # Disable property split for logo section only
+            col = layout.column(align=True)
+            col.use_property_split = False
+            col.use_property_decorate = False
+
+            row = col.row()
+            row.alignment = 'CENTER'
+            row.template_icon(icon_value=icon_id, scale=10.0)
+
+            col.separator(factor=0.1)
 
         # Godot executable warning
-        prefs = bpy.context.preferences.addons.get(__package__.split('.')[0])
+        prefs = context.preferences.addons.get(_ADDON_ID)
         godot_path = prefs.preferences.godot_path if prefs else ""
         if not godot_path:
             row = layout.row()
@@ -56,19 +57,23 @@ class MX_PT_Panel(bpy.types.Panel):
         row.scale_y = 1.3
         row.operator("mx.initialize_project", text="Initialize Project", icon='FILE_NEW')
 
-        # Check if project exists (project.godot file)
-        project_exists = bool(props.mx_godot_project_path) and os.path.exists(
-            os.path.join(props.mx_godot_project_path, "project.godot")
-        )
+        # Read once per redraw; each props.attr is an RNA lookup
+        project_path = props.mx_godot_project_path
+        platform = props.mx_platform
+        platform_initialized = props.mx_platform_initialized
+        renderer = props.mx_renderer
+
+        # Check if project exists (project.godot file); cached on the folder mtime
+        path_exists, project_exists = util.project_status(project_path) if project_path else (False, False)
 
         # Disable compile/play if platform has changed since last initialize
         platform_ready = (
             project_exists and
-            (props.mx_platform_initialized == props.mx_platform)
+            (platform_initialized == platform)
         )
 
-        if project_exists and props.mx_platform_initialized and props.mx_platform != props.mx_platform_initialized:
-            col.label(text=f"Platform changed — re-initialize required", icon='ERROR')
+        if project_exists and platform_initialized and platform != platform_initialized:
+            col.label(text="Platform changed — re-initialize required", icon='ERROR')
 
         # Row 2: Compile and Play (side by side, disabled if no project or platform changed)
         row = col.row(align=True)
@@ -79,7 +84,6 @@ class MX_PT_Panel(bpy.types.Panel):
 
         # Row 3: Clean button (full width, smaller, disabled if no project)
         row = col.row(align=True)
-        row.scale_y = 1.0
         row.enabled = project_exists
         row.operator("mx.clean_project", text="Clean", icon='TRASH')
 
@@ -89,30 +93,30 @@ class MX_PT_Panel(bpy.types.Panel):
         col.prop(props, "mx_platform", text="Platform")
         renderer_row = col.row(align=True)
         renderer_row.prop(props, "mx_renderer", text="Renderer")
-        if props.mx_platform == 'WEB' and props.mx_renderer != 'COMPATIBILITY':
+        if platform == 'WEB' and renderer != 'COMPATIBILITY':
             renderer_row.label(text="", icon='ERROR')
             col.label(text="Web requires Compatibility renderer", icon='INFO')
-        elif props.mx_platform == 'XR' and props.mx_renderer == 'FORWARD_PLUS':
+        elif platform == 'XR' and renderer == 'FORWARD_PLUS':
             renderer_row.label(text="", icon='INFO')
             col.label(text="XR: Mobile (desktop VR) or Compatibility (standalone) recommended", icon='INFO')
-        elif props.mx_platform != 'WEB' and props.mx_platform != 'XR' and props.mx_renderer == 'COMPATIBILITY':
+        elif platform != 'WEB' and platform != 'XR' and renderer == 'COMPATIBILITY':
             renderer_row.label(text="", icon='ERROR')
             col.label(text="Compatibility renderer is for Web / XR standalone only", icon='INFO')
 
-        # Asset Kiosk
+        # Asset Kiosk (re-enabling also needs: from ..assetstore.bm import BM_STATUS)
         # box = layout.box()
         # col = box.column(align=True)
         # row = col.row(align=True)
         # row.scale_y = 1.2
-        # if BM_STATUS["active"]:
+        # if BM_STATUS.active:
         #     row.operator("bm.close_kiosk", text="Close Asset Kiosk", icon='DECORATE_LINKED')
         # else:
         #     row.operator("bm.open_kiosk", text="Asset Kiosk", icon='ASSET_MANAGER')
         # status_row = col.row()
         # status_row.alignment = 'CENTER'
-        # if BM_STATUS["connected"]:
+        # if BM_STATUS.connected:
         #     status_row.label(text="Connected", icon='CHECKBOX_HLT')
-        # elif BM_STATUS["active"]:
+        # elif BM_STATUS.active:
         #     status_row.label(text="Server running...", icon='PROP_ON')
         # else:
         #     status_row.label(text="Disconnected", icon='CHECKBOX_DEHLT')
@@ -125,7 +129,7 @@ class MX_PT_Panel(bpy.types.Panel):
         row.operator("mx.browse_godot_project", text="", icon='FILE_FOLDER')
 
         # Show create button if path doesn't exist
-        if props.mx_godot_project_path and not os.path.exists(props.mx_godot_project_path):
+        if project_path and not path_exists:
             col.operator("mx.create_godot_project", icon='FILE_NEW')
 
         col.prop(props, "mx_project_name")
@@ -211,9 +215,8 @@ class MX_PT_Lightmapper(bpy.types.Panel):
     bl_parent_id = "MX_PT_Panel"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_use_lightmapper", text="")
+    _toggle_prop = "mx_use_lightmapper"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -235,13 +238,6 @@ class MX_PT_Lightmapper(bpy.types.Panel):
         col.prop(props, "mx_lightmap_compress_mode")
         col.prop(props, "mx_lightmap_mipmaps")
 
-        # Integration info
-        # box = layout.box()
-        # col = box.column(align=True)
-        # col.label(text="The_Lightmapper Integration:", icon='INFO')
-        # col.label(text="• Bake lightmaps in Blender")
-        # col.label(text="• Auto-export to Godot project")
-        # col.label(text="• Set per-object resolution in Object Properties")
 
 class MX_PT_GodotRendering(bpy.types.Panel):
     bl_label = "Godot Rendering Settings"
@@ -306,9 +302,8 @@ class MX_PT_GodotGlow(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_glow_enabled", text="")
+    _toggle_prop = "mx_glow_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -348,9 +343,8 @@ class MX_PT_GodotSSR(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_ssr_enabled", text="")
+    _toggle_prop = "mx_ssr_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -375,9 +369,8 @@ class MX_PT_GodotSSAO(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_ssao_enabled", text="")
+    _toggle_prop = "mx_ssao_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -406,9 +399,8 @@ class MX_PT_GodotSSIL(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_ssil_enabled", text="")
+    _toggle_prop = "mx_ssil_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -433,9 +425,8 @@ class MX_PT_GodotSDFGI(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_sdfgi_enabled", text="")
+    _toggle_prop = "mx_sdfgi_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -471,9 +462,8 @@ class MX_PT_GodotFog(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_fog_enabled", text="")
+    _toggle_prop = "mx_fog_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -504,9 +494,8 @@ class MX_PT_GodotVolumetricFog(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_volumetric_fog_enabled", text="")
+    _toggle_prop = "mx_volumetric_fog_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -544,9 +533,8 @@ class MX_PT_GodotAdjustments(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_adjustments_enabled", text="")
+    _toggle_prop = "mx_adjustments_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -572,9 +560,8 @@ class MX_PT_NaxPost(bpy.types.Panel):
     bl_parent_id = "MX_PT_GodotRendering"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_naxpost_enabled", text="")
+    _toggle_prop = "mx_naxpost_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
@@ -691,17 +678,14 @@ class MX_PT_LiveLink(bpy.types.Panel):
     bl_parent_id = "MX_PT_Panel"
     bl_options = {'DEFAULT_CLOSED'}
 
-    def draw_header(self, context):
-        props = context.scene.MX_SceneProperties
-        self.layout.prop(props, "mx_livelink_enabled", text="")
+    _toggle_prop = "mx_livelink_enabled"
+    draw_header = _draw_toggle_header
 
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
         layout.use_property_decorate = False
 
-        from ..operators import livelink as ll
-
         props = context.scene.MX_SceneProperties
         layout.enabled = props.mx_livelink_enabled
 
@@ -711,8 +695,8 @@ class MX_PT_LiveLink(bpy.types.Panel):
 
         col.separator()
 
-        connected = ll.is_connected()
-        running = ll.is_running()
+        connected = _ll_is_connected()
+        running = _ll_is_running()
 
         if running:
             label = "Disconnect" if connected else "Reconnecting..."
@@ -1,12 +1,12 @@
-import bpy, os
+import bpy
 from bpy.utils import register_class, unregister_class
 from . import scene, object
 
-classes = [
+classes = (
     object.MX_ScriptItem,  # Must be registered before MX_ObjectProperties
     scene.MX_SceneProperties,
-    object.MX_ObjectProperties
-]
+    object.MX_ObjectProperties,
+)
 
 def register():
     for cls in classes:
@@ -16,8 +16,13 @@ def register():
     bpy.types.Object.MX_ObjectProperties = bpy.props.PointerProperty(type=object.MX_ObjectProperties)
 
 def unregister():
-    for cls in classes:
-        unregister_class(cls)
+    # Safe after a partial register(): only what was registered is removed
+    if hasattr(bpy.types.Scene, 'MX_SceneProperties'):
+        del bpy.types.Scene.MX_SceneProperties
+    if hasattr(bpy.types.Object, 'MX_ObjectProperties'):
+        del bpy.types.Object.MX_ObjectProperties
 
-    del bpy.types.Scene.MX_SceneProperties
-    del bpy.types.Object.MX_ObjectProperties
\ No newline at end of file
+    # Reverse order: MX_ObjectProperties goes before the MX_ScriptItem it points to
+    for cls in reversed(classes):
+        if cls.is_registered:
+            unregister_class(cls)
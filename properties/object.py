@@ -2,6 +2,10 @@ import bpy
 from bpy.props import *
 import os
 
+# Resolved once at import; the bundled scripts enum reads it on every redraw.
+_BUNDLED_SCRIPTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "bundled", "scripts")
+
 
 def _update_is_decal(self, context):
     """When mx_is_decal is toggled on, switch the Empty display to Cube."""
@@ -10,37 +14,50 @@ def _update_is_decal(self, context):
         obj.empty_display_type = 'CUBE'
 
 
+# scripts_dir → (mtime_ns, items). Enum callbacks run on every redraw, so the
+# folder is only listed again when its mtime changes. Holding the tuples here
+# also keeps the strings alive, as Blender requires for dynamic enum items.
+_script_items_cache = {}
+
+# Fallback item lists are module constants too: a tuple built inside the
+# callback would be freed on return while Blender still reads its strings.
+_NO_CUSTOM_SCRIPTS = (('NONE', "Select Script...", "Choose a custom script"),)
+_NO_BUNDLED_SCRIPTS = (('NONE', "Select Script...", "Choose a bundled script"),)
+
+
+def _script_items(scripts_dir, kind, empty, sort=False):
+    try:
+        mtime = os.stat(scripts_dir).st_mtime_ns
+        cached = _script_items_cache.get(scripts_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(scripts_dir) as it:
+            files = [e.name for e in it if e.name.endswith('.gd') and e.is_file()]
+    except OSError:
+        return empty
+    if sort:
+        files.sort()
+    items = list(empty)
+    for file in files:
+        script_name = file[:-3]
+        items.append((file, script_name, f"{kind} script: {script_name}"))
+    items = tuple(items)
+    _script_items_cache[scripts_dir] = (mtime, items)
+    return items
+
+
 def get_custom_scripts(self, context):
     """Get list of custom scripts from {blend_dir}/scripts/ folder"""
-    items = [('NONE', "Select Script...", "Choose a custom script")]
-
     blend_file = bpy.data.filepath
-    if blend_file:
-        scripts_dir = os.path.join(os.path.dirname(blend_file), "scripts")
-        if os.path.isdir(scripts_dir):
-            for file in sorted(os.listdir(scripts_dir)):
-                if file.endswith('.gd'):
-                    script_name = os.path.splitext(file)[0]
-                    items.append((file, script_name, f"Custom script: {script_name}"))
-
-    return items
+    if not blend_file:
+        return _NO_CUSTOM_SCRIPTS
+    scripts_dir = os.path.join(os.path.dirname(blend_file), "scripts")
+    return _script_items(scripts_dir, "Custom", _NO_CUSTOM_SCRIPTS, sort=True)
 
 
 def get_addon_bundled_scripts(self, context):
     """Get list of bundled scripts from addon's bundled/scripts folder"""
-    items = [('NONE', "Select Script...", "Choose a bundled script")]
-
-    # Get addon directory
-    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    bundled_scripts_dir = os.path.join(addon_dir, "bundled", "scripts")
-
-    if os.path.exists(bundled_scripts_dir):
-        for file in os.listdir(bundled_scripts_dir):
-            if file.endswith('.gd'):
-                script_name = os.path.splitext(file)[0]
-                items.append((file, script_name, f"Bundled script: {script_name}"))
-
-    return items
+    return _script_items(_BUNDLED_SCRIPTS_DIR, "Bundled", _NO_BUNDLED_SCRIPTS)
 
 
 def update_script_name_from_custom(self, context):
@@ -55,6 +72,51 @@ def update_script_name_from_bundled(self, context):
         self.name = os.path.splitext(self.bundled_script)[0]
 
 
+# Static EnumProperty items: immutable tuples built once at import.
+_SCRIPT_TYPE_ITEMS = (
+    ('GDSCRIPT', "GDScript", "Custom GDScript file"),
+    ('BUNDLED', "Bundled", "Bundled script from addon"),
+)
+
+_OBJECT_TYPE_OVERRIDE_ITEMS = (
+    ('AUTO', 'Auto Detect', 'Automatically determine Godot node type'),
+    ('STATICBODY', 'StaticBody3D', 'Export as StaticBody3D with collision'),
+    ('RIGIDBODY', 'RigidBody3D', 'Export as RigidBody3D'),
+    ('AREA', 'Area3D', 'Export as Area3D'),
+    ('MESHINSTANCE', 'MeshInstance3D', 'Export as MeshInstance3D (no physics)'),
+)
+
+_OBJECT_SUBTYPE_ITEMS = (
+    ('NONE', 'None', 'No special subtype'),
+    ('DECAL', 'Decal', 'Exported as a Decal node in Godot'),
+)
+
+_REFLECTION_UPDATE_MODE_ITEMS = (
+    ('ONCE', 'Once (Fast)', 'Capture once on scene load'),
+    ('ALWAYS', 'Always', 'Capture every frame (slow)'),
+)
+
+_REFLECTION_AMBIENT_MODE_ITEMS = (
+    ('DISABLED', 'Disabled', 'No ambient light from this probe'),
+    ('ENVIRONMENT', 'Environment', 'Use scene environment as ambient'),
+    ('CONSTANT_COLOR', 'Constant Color', 'Use a constant color as ambient'),
+)
+
+_CAMERA_ATTRIBUTES_TYPE_ITEMS = (
+    ('DISABLED', 'Disabled', 'No camera attributes resource'),
+    ('PRACTICAL', 'Practical', 'CameraAttributesPractical — DOF blur and sensitivity-based auto exposure'),
+    ('PHYSICAL', 'Physical', 'CameraAttributesPhysical — physical frustum and EV100-based auto exposure'),
+)
+
+_COLLISION_TYPE_ITEMS = (
+    ('CONVEX', 'Convex', 'Convex collision shape'),
+    ('TRIMESH', 'Trimesh', 'Triangle mesh collision (for static objects)'),
+    ('BOX', 'Box', 'Box collision shape'),
+    ('SPHERE', 'Sphere', 'Sphere collision shape'),
+    ('CAPSULE', 'Capsule', 'Capsule collision shape'),
+)
+
+
 class MX_ScriptItem(bpy.types.PropertyGroup):
     """Individual script entry in the scripts list"""
 
@@ -73,10 +135,7 @@ class MX_ScriptItem(bpy.types.PropertyGroup):
     script_type: EnumProperty(
         name="Type",
         description="Type of script",
-        items=[
-            ('GDSCRIPT', "GDScript", "Custom GDScript file"),
-            ('BUNDLED', "Bundled", "Bundled script from addon"),
-        ],
+        items=_SCRIPT_TYPE_ITEMS,
         default='GDSCRIPT'
     )
 
@@ -117,23 +176,14 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
     )
 
     mx_object_type_override : EnumProperty(
-        items=[
-            ('AUTO', 'Auto Detect', 'Automatically determine Godot node type'),
-            ('STATICBODY', 'StaticBody3D', 'Export as StaticBody3D with collision'),
-            ('RIGIDBODY', 'RigidBody3D', 'Export as RigidBody3D'),
-            ('AREA', 'Area3D', 'Export as Area3D'),
-            ('MESHINSTANCE', 'MeshInstance3D', 'Export as MeshInstance3D (no physics)')
-        ],
+        items=_OBJECT_TYPE_OVERRIDE_ITEMS,
         name="Godot Node Type",
         description="Override the Godot node type for this object",
         default='AUTO'
     )
 
     mx_object_subtype : EnumProperty(
-        items=[
-            ('NONE', 'None', 'No special subtype'),
-            ('DECAL', 'Decal', 'Exported as a Decal node in Godot'),
-        ],
+        items=_OBJECT_SUBTYPE_ITEMS,
         name="Object Subtype",
         description="Special Meridian object subtype",
         default='NONE'
@@ -165,10 +215,7 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
     )
 
     mx_reflection_update_mode : EnumProperty(
-        items=[
-            ('ONCE', 'Once (Fast)', 'Capture once on scene load'),
-            ('ALWAYS', 'Always', 'Capture every frame (slow)'),
-        ],
+        items=_REFLECTION_UPDATE_MODE_ITEMS,
         name="Update Mode",
         description="When the reflection probe recaptures the scene",
         default='ONCE'
@@ -194,11 +241,7 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
     )
 
     mx_reflection_ambient_mode : EnumProperty(
-        items=[
-            ('DISABLED', 'Disabled', 'No ambient light from this probe'),
-            ('ENVIRONMENT', 'Environment', 'Use scene environment as ambient'),
-            ('CONSTANT_COLOR', 'Constant Color', 'Use a constant color as ambient'),
-        ],
+        items=_REFLECTION_AMBIENT_MODE_ITEMS,
         name="Ambient Mode",
         description="Ambient light contribution mode for this reflection probe",
         default='DISABLED'
@@ -236,11 +279,7 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
 
     # ===== CAMERA ATTRIBUTES =====
     mx_camera_attributes_type : EnumProperty(
-        items=[
-            ('DISABLED', 'Disabled', 'No camera attributes resource'),
-            ('PRACTICAL', 'Practical', 'CameraAttributesPractical — DOF blur and sensitivity-based auto exposure'),
-            ('PHYSICAL', 'Physical', 'CameraAttributesPhysical — physical frustum and EV100-based auto exposure'),
-        ],
+        items=_CAMERA_ATTRIBUTES_TYPE_ITEMS,
         name="Attributes",
         description="Godot CameraAttributes resource to attach to this camera",
         default='DISABLED'
@@ -313,7 +352,7 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
     mx_cam_frustum_focal_length : FloatProperty(
         name="Focal Length",
         description="Camera focal length in millimetres",
-        default=35.0, min=1.0, max=800.0, precision=1
+        default=35.0, min=1.0, max=800.0, precision=1, subtype='DISTANCE_CAMERA'
     )
 
     mx_cam_frustum_near : FloatProperty(
@@ -414,13 +453,7 @@ class MX_ObjectProperties(bpy.types.PropertyGroup):
     )
 
     mx_collision_type : EnumProperty(
-        items=[
-            ('CONVEX', 'Convex', 'Convex collision shape'),
-            ('TRIMESH', 'Trimesh', 'Triangle mesh collision (for static objects)'),
-            ('BOX', 'Box', 'Box collision shape'),
-            ('SPHERE', 'Sphere', 'Sphere collision shape'),
-            ('CAPSULE', 'Capsule', 'Capsule collision shape')
-        ],
+        items=_COLLISION_TYPE_ITEMS,
         name="Collision Type",
         description="Type of collision shape to generate",
         default='CONVEX'
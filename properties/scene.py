@@ -1,7 +1,114 @@
-import bpy, os
+import bpy
 from bpy.props import *
 
+# Static EnumProperty items: immutable tuples built once at import.
+# Explicit ids: Blender saves an enum as its number, so the disabled entries
+# below get fresh ids instead of shifting what existing files point to.
+_PLATFORM_ITEMS = (
+    ('DESKTOP', 'Desktop', 'Standard desktop application export', 0),
+    #('WEB',     'Web',     'HTML5 / browser export', 2),
+    ('XR',      'XR',      'VR / AR / WebXR export', 1),
+)
+
+_RENDERER_ITEMS = (
+    ('FORWARD_PLUS',  'Forward+',     'Full-featured renderer (Desktop, XR)'),
+    ('MOBILE',        'Mobile',        'Optimised for mobile / lower-end hardware (Desktop, XR)'),
+    ('COMPATIBILITY', 'Compatibility', 'WebGL2-compatible renderer (Web, XR standalone)'),
+)
+
+_PUBLISH_TARGET_ITEMS = (
+    ('WINDOWS', 'Windows (.exe)',  'Export as a Windows executable'),
+    ('WEB',     'Web (HTML5)',      'Export as HTML5 for browsers'),
+    ('ANDROID', 'Android (.apk)',  'Export as an Android APK'),
+)
+
+_EXPORT_FORMAT_ITEMS = (
+    ('GLB', 'glTF Binary (.glb)', 'Export as single binary .glb file'),
+    ('GLTF', 'glTF Separate (.gltf)', 'Export as .gltf with separate .bin and textures'),
+)
+
+_EXPORT_IMAGE_FORMAT_ITEMS = (
+    ('AUTO', 'Automatic', 'Determine format from texture'),
+    ('JPEG', 'JPEG', 'Export textures as JPEG'),
+    ('PNG', 'PNG', 'Export textures as PNG'),
+)
+
+_MSAA_ITEMS = (
+    ('0', 'Disabled', 'No MSAA'),
+    ('1', '2x', '2x MSAA'),
+    ('2', '4x', '4x MSAA'),
+    ('3', '8x', '8x MSAA'),
+)
+
+_SCREEN_SPACE_AA_ITEMS = (
+    ('0', 'Disabled', 'No screen-space AA'),
+    ('1', 'FXAA', 'Fast approximate anti-aliasing'),
+    ('2', 'SMAA', 'Subpixel morphological anti-aliasing'),
+)
+
+_SCALING_3D_MODE_ITEMS = (
+    ('0', 'Bilinear', 'Bilinear scaling'),
+    ('1', 'FSR 1.0', 'FidelityFX Super Resolution 1.0'),
+    ('2', 'FSR 2.2', 'FidelityFX Super Resolution 2.2'),
+)
+
+_TONEMAP_MODE_ITEMS = (
+    ('0', 'Linear', 'Linear tonemapping'),
+    ('1', 'Reinhard', 'Reinhard tonemapping'),
+    ('2', 'Filmic', 'Filmic tonemapping'),
+    ('3', 'ACES', 'ACES tonemapping'),
+)
+
+_GLOW_BLEND_MODE_ITEMS = (
+    ('0', 'Additive', 'Additive blending'),
+    ('1', 'Screen', 'Screen blending'),
+    ('2', 'Softlight', 'Softlight blending'),
+    ('3', 'Replace', 'Replace blending'),
+    ('4', 'Mix', 'Mix blending'),
+)
+
+_SDFGI_Y_SCALE_ITEMS = (
+    ('0', '50%', 'Half resolution on Y axis'),
+    ('1', '75%', '75% resolution on Y axis'),
+    ('2', '100%', 'Full resolution'),
+)
+
+_LIGHTMAP_COMPRESS_MODE_ITEMS = (
+    ('0', "Lossless",          "Lossless compression — best quality, larger file size"),
+    ('1', "Lossy",             "Lossy compression — smaller file, some quality loss"),
+    ('2', "VRAM Compressed",   "GPU-native compression — fastest at runtime, some quality loss"),
+    ('3', "VRAM Uncompressed", "Uncompressed on GPU — highest quality, most VRAM"),
+    ('4', "Basis Universal",   "Basis Universal — cross-platform VRAM compression"),
+)
+
+# Explicit ids, as for _PLATFORM_ITEMS
+_LIGHTMAP_MODE_ITEMS = (
+    #('ATLAS',     'Atlas',      'Pack all lightmaps into a Texture2DArray and use LightmapGIData', 1),
+    ('INDIVIDUAL', 'Individual', 'Apply a separate lightmap texture per object using the StandardPlusAuto shader', 0),
+)
+
+_TEXTURE_MAX_SIZE_ITEMS = tuple(
+    (str(size), str(size), f'{size}x{size}') for size in (512, 1024, 2048, 4096, 8192)
+)
+
+_ANAMORPHIC_BLOOM_BLEND_MODE_ITEMS = (
+    ('0', 'Additive',  'Classic additive bloom'),
+    ('1', 'Screen',    'HDR-safe screen blend'),
+    ('2', 'Softlight', 'Cinematic softlight'),
+    ('3', 'Replace',   'Debug / replace'),
+)
+
+
 class MX_SceneProperties(bpy.types.PropertyGroup):
+    """Scene-level Meridian settings.
+
+    Kept as one flat group on purpose: the property names are what .blend
+    files store, so moving them into nested groups would silently reset
+    every saved project's settings. Toggles stay plain BoolProperties for
+    the same reason, and because get/set proxies onto a packed bitmask
+    would run Python for every checkbox on every redraw.
+    Sections below mirror the UI panels.
+    """
 
     # ===== GODOT PROJECT SETTINGS =====
     mx_godot_project_path : StringProperty(
@@ -51,22 +158,14 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # ===== PLATFORM & RENDERER =====
     mx_platform : EnumProperty(
-        items=[
-            ('DESKTOP', 'Desktop', 'Standard desktop application export'),
-            #('WEB',     'Web',     'HTML5 / browser export'),
-            ('XR',      'XR',      'VR / AR / WebXR export'),
-        ],
+        items=_PLATFORM_ITEMS,
         name="Platform",
         description="Target platform for the Godot export",
         default='DESKTOP'
     )
 
     mx_renderer : EnumProperty(
-        items=[
-            ('FORWARD_PLUS',  'Forward+',     'Full-featured renderer (Desktop, XR)'),
-            ('MOBILE',        'Mobile',        'Optimised for mobile / lower-end hardware (Desktop, XR)'),
-            ('COMPATIBILITY', 'Compatibility', 'WebGL2-compatible renderer (Web, XR standalone)'),
-        ],
+        items=_RENDERER_ITEMS,
         name="Renderer",
         description="Godot rendering backend",
         default='FORWARD_PLUS'
@@ -80,11 +179,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # ===== PUBLISHING =====
     mx_publish_target : EnumProperty(
-        items=[
-            ('WINDOWS', 'Windows (.exe)',  'Export as a Windows executable'),
-            ('WEB',     'Web (HTML5)',      'Export as HTML5 for browsers'),
-            ('ANDROID', 'Android (.apk)',  'Export as an Android APK'),
-        ],
+        items=_PUBLISH_TARGET_ITEMS,
         name="Target",
         description="Publish target platform",
         default='WINDOWS'
@@ -99,10 +194,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # ===== EXPORT FORMAT SETTINGS =====
     mx_export_format : EnumProperty(
-        items=[
-            ('GLB', 'glTF Binary (.glb)', 'Export as single binary .glb file'),
-            ('GLTF', 'glTF Separate (.gltf)', 'Export as .gltf with separate .bin and textures')
-        ],
+        items=_EXPORT_FORMAT_ITEMS,
         name="Export Format",
         description="Choose the export format for Godot",
         default='GLB'
@@ -115,11 +207,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     )
 
     mx_export_image_format : EnumProperty(
-        items=[
-            ('AUTO', 'Automatic', 'Determine format from texture'),
-            ('JPEG', 'JPEG', 'Export textures as JPEG'),
-            ('PNG', 'PNG', 'Export textures as PNG')
-        ],
+        items=_EXPORT_IMAGE_FORMAT_ITEMS,
         name="Image Format",
         description="Output format for texture images",
         default='AUTO'
@@ -127,23 +215,14 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # ===== RENDERING SETTINGS (for Godot scene configuration) =====
     mx_msaa : EnumProperty(
-        items=[
-            ('0', 'Disabled', 'No MSAA'),
-            ('1', '2x', '2x MSAA'),
-            ('2', '4x', '4x MSAA'),
-            ('3', '8x', '8x MSAA')
-        ],
+        items=_MSAA_ITEMS,
         name="MSAA",
         description="Multi-sample anti-aliasing quality for Godot",
         default='2'
     )
 
     mx_screen_space_aa : EnumProperty(
-        items=[
-            ('0', 'Disabled', 'No screen-space AA'),
-            ('1', 'FXAA', 'Fast approximate anti-aliasing'),
-            ('2', 'SMAA', 'Subpixel morphological anti-aliasing')
-        ],
+        items=_SCREEN_SPACE_AA_ITEMS,
         name="Screen-Space AA",
         description="Screen-space anti-aliasing method",
         default='2'
@@ -162,11 +241,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     )
 
     mx_scaling_3d_mode : EnumProperty(
-        items=[
-            ('0', 'Bilinear', 'Bilinear scaling'),
-            ('1', 'FSR 1.0', 'FidelityFX Super Resolution 1.0'),
-            ('2', 'FSR 2.2', 'FidelityFX Super Resolution 2.2')
-        ],
+        items=_SCALING_3D_MODE_ITEMS,
         name="3D Scaling Mode",
         description="3D viewport scaling/upscaling method",
         default='1'
@@ -190,12 +265,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # ===== TONEMAP SETTINGS =====
     mx_tonemap_mode : EnumProperty(
-        items=[
-            ('0', 'Linear', 'Linear tonemapping'),
-            ('1', 'Reinhard', 'Reinhard tonemapping'),
-            ('2', 'Filmic', 'Filmic tonemapping'),
-            ('3', 'ACES', 'ACES tonemapping')
-        ],
+        items=_TONEMAP_MODE_ITEMS,
         name="Tonemap Mode",
         description="Tonemapping operator for HDR rendering",
         default='1'
@@ -249,13 +319,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     )
 
     mx_glow_blend_mode : EnumProperty(
-        items=[
-            ('0', 'Additive', 'Additive blending'),
-            ('1', 'Screen', 'Screen blending'),
-            ('2', 'Softlight', 'Softlight blending'),
-            ('3', 'Replace', 'Replace blending'),
-            ('4', 'Mix', 'Mix blending')
-        ],
+        items=_GLOW_BLEND_MODE_ITEMS,
         name="Glow Blend Mode",
         description="Blending mode for glow effect",
         default='1'
@@ -501,11 +565,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     )
 
     mx_sdfgi_y_scale : EnumProperty(
-        items=[
-            ('0', '50%', 'Half resolution on Y axis'),
-            ('1', '75%', '75% resolution on Y axis'),
-            ('2', '100%', 'Full resolution')
-        ],
+        items=_SDFGI_Y_SCALE_ITEMS,
         name="Y Scale",
         description="SDFGI Y-axis resolution",
         default='1'
@@ -760,13 +820,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     mx_lightmap_compress_mode : EnumProperty(
         name="Compress Mode",
         description="Texture compression mode for imported lightmap textures in Godot",
-        items=[
-            ('0', "Lossless",          "Lossless compression — best quality, larger file size"),
-            ('1', "Lossy",             "Lossy compression — smaller file, some quality loss"),
-            ('2', "VRAM Compressed",   "GPU-native compression — fastest at runtime, some quality loss"),
-            ('3', "VRAM Uncompressed", "Uncompressed on GPU — highest quality, most VRAM"),
-            ('4', "Basis Universal",   "Basis Universal — cross-platform VRAM compression"),
-        ],
+        items=_LIGHTMAP_COMPRESS_MODE_ITEMS,
         default='0'
     )
 
@@ -779,22 +833,10 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     mx_lightmap_mode : EnumProperty(
         name="Mode",
         description="How lightmaps are applied in Godot",
-        items=[
-            ('INDIVIDUAL', 'Individual', 'Apply a separate lightmap texture per object using the StandardPlusAuto shader'),
-        ],
+        items=_LIGHTMAP_MODE_ITEMS,
         default='INDIVIDUAL'
     )
 
-    # mx_lightmap_mode : EnumProperty(
-    #     name="Mode",
-    #     description="How lightmaps are applied in Godot",
-    #     items=[
-    #         ('ATLAS',      'Atlas',      'Pack all lightmaps into a Texture2DArray and use LightmapGIData (current default)'),
-    #         ('INDIVIDUAL', 'Individual', 'Apply a separate lightmap texture per object using the StandardPlusAuto shader'),
-    #     ],
-    #     default='ATLAS'
-    # )
-
     mx_use_lightmapper : BoolProperty(
         name="Use The_Lightmapper Addon",
         description="Integrate with The_Lightmapper addon for baked lighting",
@@ -817,7 +859,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     mx_livelink_blender_port : IntProperty(
         name="Blender Port",
-        description="Port for Blender to listen on",
+        description="Port for Blender to listen on (1024-65535)",
         default=15703,
         min=1024,
         max=65535
@@ -825,7 +867,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     mx_livelink_godot_port : IntProperty(
         name="Godot Port",
-        description="Port to send updates to Godot",
+        description="Port to send updates to Godot (1024-65535)",
         default=15702,
         min=1024,
         max=65535
@@ -863,13 +905,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     )
 
     mx_texture_max_size : EnumProperty(
-        items=[
-            ('512', '512', '512x512'),
-            ('1024', '1024', '1024x1024'),
-            ('2048', '2048', '2048x2048'),
-            ('4096', '4096', '4096x4096'),
-            ('8192', '8192', '8192x8192')
-        ],
+        items=_TEXTURE_MAX_SIZE_ITEMS,
         name="Max Texture Size",
         description="Maximum texture size for export",
         default='2048'
@@ -946,7 +982,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
 
     # Chromatic Aberration
     mx_naxpost_ca_intensity : FloatProperty(
-        name="Intensity", default=0.1, min=0.0, max=1.0)
+        name="Intensity", default=0.1, min=0.0, max=1.0, subtype='FACTOR')
     mx_naxpost_ca_max_samples : IntProperty(
         name="Max Samples", default=32, min=1, max=64)
 
@@ -999,7 +1035,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
     mx_anamorphic_bloom_strength : FloatProperty(
         name="Strength", default=1.0, min=0.0, max=2.0)
     mx_anamorphic_bloom_mix : FloatProperty(
-        name="Mix", default=1.0, min=0.0, max=1.0)
+        name="Mix", default=1.0, min=0.0, max=1.0, subtype='FACTOR')
     mx_anamorphic_bloom_hdr_scale : FloatProperty(
         name="HDR Scale", default=2.0, min=0.0, max=8.0)
     mx_anamorphic_bloom_hdr_luminance_cap : FloatProperty(
@@ -1019,12 +1055,7 @@ class MX_SceneProperties(bpy.types.PropertyGroup):
         name="Cross Blur Strength", default=0.25, min=0.0, max=1.0)
     mx_anamorphic_bloom_blend_mode : EnumProperty(
         name="Blend Mode",
-        items=[
-            ('0', 'Additive',  'Classic additive bloom'),
-            ('1', 'Screen',    'HDR-safe screen blend'),
-            ('2', 'Softlight', 'Cinematic softlight'),
-            ('3', 'Replace',   'Debug / replace'),
-        ],
+        items=_ANAMORPHIC_BLOOM_BLEND_MODE_ITEMS,
         default='0'
     )
     mx_anamorphic_bloom_mip_levels : IntProperty(
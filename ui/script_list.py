@@ -1,13 +1,17 @@
 import bpy
 
+# script_type → icon shown at the end of each row
+_TYPE_ICONS = {'BUNDLED': 'PACKAGE', 'GDSCRIPT': 'FILE_TEXT'}
+
 
 class MX_UL_ScriptList(bpy.types.UIList):
     """UIList for displaying scripts attached to an object"""
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         script = item
+        layout_type = self.layout_type
 
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+        if layout_type in {'DEFAULT', 'COMPACT'}:
             # Enable toggle
             layout.prop(script, "enabled", text="", emboss=False, icon='CHECKBOX_HLT' if script.enabled else 'CHECKBOX_DEHLT')
 
@@ -15,11 +19,8 @@ class MX_UL_ScriptList(bpy.types.UIList):
             layout.prop(script, "name", text="", emboss=False, icon='FILE_SCRIPT')
 
             # Script type icon
-            if script.script_type == 'BUNDLED':
-                layout.label(text="", icon='PACKAGE')
-            else:
-                layout.label(text="", icon='FILE_TEXT')
+            layout.label(text="", icon=_TYPE_ICONS.get(script.script_type, 'FILE_TEXT'))
 
-        elif self.layout_type == 'GRID':
+        elif layout_type == 'GRID':
             layout.alignment = 'CENTER'
             layout.label(text="", icon='FILE_SCRIPT')
@@ -1,4 +1,43 @@
-import bpy, os, math, shutil
+import bpy, os, math, shutil, uuid
+from functools import lru_cache
+from operator import attrgetter
+from mathutils import Matrix
+from .. import calibration
+
+
+@lru_cache(maxsize=1024)
+def _abspath(path, blend_filepath):
+    return bpy.path.abspath(path)
+
+
+@lru_cache(maxsize=8)
+def _project_status(project_dir, dir_mtime):
+    return (dir_mtime is not None,
+            os.path.isfile(os.path.join(project_dir, "project.godot")))
+
+
+def project_status(project_dir):
+    """(folder exists, project.godot exists) for the panels, cached across redraws.
+
+    Keyed on the folder's mtime, which changes when project.godot is
+    created or deleted, so edits made outside Blender show up on the next
+    redraw for one stat. Operators that create or delete project files
+    still call project_status.cache_clear() for filesystems with coarse
+    mtimes; so does loading a .blend.
+    """
+    try:
+        dir_mtime = os.stat(project_dir).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    return _project_status(project_dir, dir_mtime)
+
+
+project_status.cache_clear = _project_status.cache_clear
+
+
+def abspath(path):
+    """Cached bpy.path.abspath. Keyed on the .blend path since '//' resolves against it."""
+    return _abspath(path, bpy.data.filepath)
 
 
 def safe_name(name):
@@ -45,41 +84,172 @@ def createFolderStructure(project_dir):
         "shaders",
     ]
     for folder in folders:
-        folder_path = os.path.join(project_dir, folder)
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
-            print(f"Created folder: {folder}")
+        try:
+            os.makedirs(os.path.join(project_dir, folder))
+        except FileExistsError:
+            continue
+        print(f"Created folder: {folder}")
     return folders
 
 
+# -90° X correction for cameras and lights (is_camera=True); constant, so
+# built once instead of per call. LiveLink applies the same turn.
+_CAM_CORRECTION = Matrix.Rotation(math.radians(-90), 4, 'X')
+
+
 def matrix_to_godot_transform(matrix, is_camera=False):
     """Convert a Blender world matrix to a Godot Transform3D string (Y-up)."""
-    pos_x = matrix[0][3]
-    pos_y = matrix[2][3]
-    pos_z = -matrix[1][3]
+    # Unpack to plain floats up front: one translation read and one slice per
+    # basis row, instead of a fresh row Vector for every element.
+    tx, ty, tz = matrix.translation
 
     if is_camera:
-        from mathutils import Matrix
-        correction = Matrix.Rotation(math.radians(-90), 4, 'X')
-        matrix = matrix @ correction
+        matrix = matrix @ _CAM_CORRECTION
 
-    bx = (matrix[0][0], matrix[0][1], matrix[0][2])
-    by = (matrix[1][0], matrix[1][1], matrix[1][2])
-    bz = (matrix[2][0], matrix[2][1], matrix[2][2])
-
-    gx = (bx[0],  bx[2], -bx[1])
-    gy = (bz[0],  bz[2], -bz[1])
-    gz = (-by[0], -by[2],  by[1])
+    (x0, x1, x2), (y0, y1, y2), (z0, z1, z2) = matrix[0][:3], matrix[1][:3], matrix[2][:3]
 
     return (
         f"Transform3D("
-        f"{gx[0]}, {gx[1]}, {gx[2]}, "
-        f"{gy[0]}, {gy[1]}, {gy[2]}, "
-        f"{gz[0]}, {gz[1]}, {gz[2]}, "
-        f"{pos_x}, {pos_y}, {pos_z})"
+        f"{x0}, {x2}, {-x1}, "
+        f"{z0}, {z2}, {-z1}, "
+        f"{-y0}, {-y2}, {y1}, "
+        f"{tx}, {tz}, {-ty})"
     )
 
 
+# ===== FILE HELPERS =====
+
+def fast_copy(src, dst):
+    """Copy a file with copy2's metadata, without copy2's directory handling.
+
+    shutil.copyfile already takes the kernel fast path (sendfile on Linux,
+    fcopyfile on macOS). copystat keeps the mode bits and the source mtime
+    that Godot's reimport checks and sync_copy compare against.
+    """
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def gather_tree(src, dst, pairs):
+    """Append (src, dst) pairs for every file under src to pairs.
+
+    Destination directories are created up front so copy workers never
+    race on mkdir.
+    """
+    # scandir reuses the dirent type, so no per-entry stat; symlinked
+    # directories are listed but not descended into, matching os.walk.
+    stack = [(src, dst)]
+    while stack:
+        in_dir, out_dir = stack.pop()
+        os.makedirs(out_dir, exist_ok=True)
+        with os.scandir(in_dir) as it:
+            for entry in it:
+                out_path = os.path.join(out_dir, entry.name)
+                if not entry.is_dir():
+                    pairs.append((entry.path, out_path))
+                elif not entry.is_symlink():
+                    stack.append((entry.path, out_path))
+    return pairs
+
+
+def sync_copy(src, dst):
+    """fast_copy unless dst already matches src's size and mtime.
+
+    fast_copy preserves the source mtime, so an unchanged file copied on a
+    previous run is skipped on the next one.
+    """
+    st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+            return dst
+    return fast_copy(src, dst)
+
+
+def sync_link(src, dst):
+    """Hardlink dst to src, falling back to sync_copy across volumes.
+
+    Only for inputs nothing writes to in place on the Godot side. An
+    existing dst is swapped via a temp link and os.replace, so a re-baked
+    source (new inode) replaces the old link atomically.
+    """
+    # A missing src raises here, not later from os.link/sync_copy
+    src_st = os.stat(src)
+    try:
+        if os.path.samestat(src_st, os.stat(dst)):
+            return dst
+    except FileNotFoundError:
+        pass
+    tmp = f"{dst}.tmp-{uuid.uuid4().hex[:8]}"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        return sync_copy(src, dst)
+    try:
+        os.replace(tmp, dst)
+    except OSError:
+        # e.g. dst held open on Windows; don't leave the temp link in the project
+        os.unlink(tmp)
+        return sync_copy(src, dst)
+    return dst
+
+
+def copy_files(pairs, link=False):
+    """Copy (src, dst) pairs concurrently, skipping up-to-date files; copies are I/O bound.
+
+    With link=True files are hardlinked where the filesystem allows it.
+    """
+    if not pairs:
+        return
+    # Only exports copy files; keep concurrent.futures out of addon startup
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    op = sync_link if link else sync_copy
+    workers = min(32, (os.cpu_count() or 1) * 4, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(op, s, d) for s, d in pairs]):
+            future.result()
+
+
+def write_if_changed(path, content):
+    """Write text to path only when it differs from what is already there.
+
+    Unchanged files keep their mtime, so an open Godot editor doesn't
+    reload them. New content goes through a temp file + os.replace so
+    Godot never sees a half-written file; a replaced file keeps its mode.
+    Line endings are written as given (LF) on every platform, which Godot
+    reads the same as CRLF. Returns True if written.
+    """
+    data = content.encode('utf-8')
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    tmp = f"{path}.tmp-{uuid.uuid4().hex[:8]}"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        # A stray .tmp-* inside the project would be picked up by Godot's importer
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return True
+
+
 # ===== ENVIRONMENT HELPERS =====
 
 def process_hdri_texture(tex_node, env_data, project_dir, node_tree):
@@ -88,14 +258,14 @@ def process_hdri_texture(tex_node, env_data, project_dir, node_tree):
         image = tex_node.image
         env_data['type'] = 'hdri'
 
-        source_path = bpy.path.abspath(image.filepath)
+        source_path = abspath(image.filepath)
         dest_dir = os.path.join(project_dir, "assets", "environment")
 
         if source_path and os.path.exists(source_path):
             filename = os.path.basename(source_path)
             dest_path = os.path.join(dest_dir, filename)
             if not os.path.exists(dest_path):
-                shutil.copy2(source_path, dest_path)
+                fast_copy(source_path, dest_path)
                 print(f"Copied HDRI: {filename}")
             env_data['hdri_path'] = source_path
             env_data['hdri_godot_path'] = f"res://assets/environment/{filename}"
@@ -112,8 +282,9 @@ def process_hdri_texture(tex_node, env_data, project_dir, node_tree):
 
     # Pick up rotation from a Mapping node wired to this texture's Vector input
     vector_input = tex_node.inputs.get('Vector')
-    if vector_input and vector_input.links:
-        mapping_node = vector_input.links[0].from_node
+    vector_links = vector_input.links if vector_input else None
+    if vector_links:
+        mapping_node = vector_links[0].from_node
         if mapping_node.type == 'MAPPING':
             rotation_input = mapping_node.inputs.get('Rotation')
             if rotation_input:
@@ -144,22 +315,22 @@ def process_sky_texture(tex_node, env_data):
         'energy_multiplier': 1.0,
     }
 
-    if hasattr(tex_node, 'turbidity'):
-        sky_params['turbidity'] = tex_node.turbidity
+    # Single getattr with a default per attribute: some properties only
+    # exist on certain Blender versions/sky models.
+    sky_params['turbidity'] = getattr(tex_node, 'turbidity', sky_params['turbidity'])
 
-    if hasattr(tex_node, 'ground_albedo'):
-        ga = tex_node.ground_albedo
+    ga = getattr(tex_node, 'ground_albedo', None)
+    if ga is not None:
         sky_params['ground_albedo'] = ga
         sky_params['ground_color'] = (ga * 0.4, ga * 0.35, ga * 0.2)
 
     if tex_node.sky_type == 'NISHITA':
         for attr in ('sun_elevation', 'sun_rotation', 'sun_size', 'sun_intensity'):
-            if hasattr(tex_node, attr):
-                sky_params[attr] = getattr(tex_node, attr)
+            sky_params[attr] = getattr(tex_node, attr, sky_params[attr])
 
     elif tex_node.sky_type in ('HOSEK_WILKIE', 'PREETHAM'):
-        if hasattr(tex_node, 'sun_direction'):
-            sun_dir = tex_node.sun_direction
+        sun_dir = getattr(tex_node, 'sun_direction', None)
+        if sun_dir is not None:
             sky_params['sun_elevation'] = math.asin(max(-1.0, min(1.0, sun_dir[2])))
             sky_params['sun_rotation'] = math.atan2(sun_dir[0], sun_dir[1])
 
@@ -170,6 +341,17 @@ def process_sky_texture(tex_node, env_data):
     return env_data
 
 
+def _process_sky(tex_node, env_data, _project_dir, _node_tree):
+    return process_sky_texture(tex_node, env_data)
+
+
+# Texture node type → handler(tex_node, env_data, project_dir, node_tree)
+_ENV_TEXTURE_HANDLERS = {
+    'TEX_ENVIRONMENT': process_hdri_texture,
+    'TEX_SKY': _process_sky,
+}
+
+
 def extract_environment_data(project_dir, world=None):
     """Extract sky/environment data from Blender's World node tree."""
     env_data = {
@@ -193,26 +375,28 @@ def extract_environment_data(project_dir, world=None):
     if not output_node:
         return env_data
 
+    # Each .inputs / .links access is an RNA lookup; bind them once.
     surface_input = output_node.inputs.get('Surface')
-    if not surface_input or not surface_input.links:
+    surface_links = surface_input.links if surface_input else None
+    if not surface_links:
         return env_data
 
-    connected_node = surface_input.links[0].from_node
+    connected_node = surface_links[0].from_node
 
     if connected_node.type == 'BACKGROUND':
-        strength_input = connected_node.inputs.get('Strength')
+        bg_inputs = connected_node.inputs
+        strength_input = bg_inputs.get('Strength')
         if strength_input:
             env_data['strength'] = strength_input.default_value
 
-        color_input = connected_node.inputs.get('Color')
-        if color_input and color_input.links:
-            color_source = color_input.links[0].from_node
-
-            if color_source.type == 'TEX_ENVIRONMENT':
-                env_data = process_hdri_texture(color_source, env_data, project_dir, node_tree)
+        color_input = bg_inputs.get('Color')
+        color_links = color_input.links if color_input else None
+        if color_links:
+            color_source = color_links[0].from_node
+            handler = _ENV_TEXTURE_HANDLERS.get(color_source.type)
 
-            elif color_source.type == 'TEX_SKY':
-                env_data = process_sky_texture(color_source, env_data)
+            if handler:
+                env_data = handler(color_source, env_data, project_dir, node_tree)
 
             elif color_source.type == 'MAPPING':
                 rotation_input = color_source.inputs.get('Rotation')
@@ -221,154 +405,254 @@ def extract_environment_data(project_dir, world=None):
 
                 # Find the texture node wired through this Mapping node
                 for node in nodes:
-                    if node.type not in ('TEX_ENVIRONMENT', 'TEX_SKY'):
+                    handler = _ENV_TEXTURE_HANDLERS.get(node.type)
+                    if not handler:
                         continue
                     vec_in = node.inputs.get('Vector')
-                    if vec_in and vec_in.links and vec_in.links[0].from_node == color_source:
-                        if node.type == 'TEX_ENVIRONMENT':
-                            env_data = process_hdri_texture(node, env_data, project_dir, node_tree)
-                        else:
-                            env_data = process_sky_texture(node, env_data)
+                    vec_links = vec_in.links if vec_in else None
+                    if vec_links and vec_links[0].from_node == color_source:
+                        env_data = handler(node, env_data, project_dir, node_tree)
                         break
 
         elif color_input:
             color = color_input.default_value
             env_data['type'] = 'color'
-            env_data['background_color'] = (color[0], color[1], color[2])
+            env_data['background_color'] = color[:3]
 
-    elif connected_node.type == 'TEX_ENVIRONMENT':
-        env_data = process_hdri_texture(connected_node, env_data, project_dir, node_tree)
-
-    elif connected_node.type == 'TEX_SKY':
-        env_data = process_sky_texture(connected_node, env_data)
+    else:
+        handler = _ENV_TEXTURE_HANDLERS.get(connected_node.type)
+        if handler:
+            env_data = handler(connected_node, env_data, project_dir, node_tree)
 
     return env_data
 
 
 # ===== SCENE EXTRACTION =====
 
-def extract_cameras_and_lights():
-    """Extract camera and light data from the current Blender scene."""
-    from .. import calibration
+def _render_aspect(scene):
+    """Final render width / height, including pixel aspect."""
+    render = scene.render
+    width = render.resolution_x * render.pixel_aspect_x
+    height = render.resolution_y * render.pixel_aspect_y
+    return width / height if height else 1.0
 
-    cameras = []
-    lights = []
 
-    for obj in bpy.data.objects:
-        if obj.hide_render:
-            continue
+def _vertical_fov(cam_data, aspect):
+    """Vertical FOV in radians for Godot's Camera3D (KEEP_HEIGHT).
 
-        obj_props = obj.MX_ObjectProperties
-        if not obj_props.mx_export_object:
-            continue
+    Blender's cam_data.angle is measured along the sensor-fit axis, which
+    for AUTO is the longer side of the frame.
+    """
+    fit = cam_data.sensor_fit
+    if fit == 'VERTICAL' or (fit == 'AUTO' and aspect < 1.0):
+        return cam_data.angle
+    return 2.0 * math.atan(math.tan(cam_data.angle * 0.5) / aspect)
+
+
+# mx_camera_attributes_type → (export keys, attrgetter over the matching
+# mx_cam_* settings). DISABLED has no entry and exports only the type.
+_CAM_COMMON_FIELDS = (
+    ('exposure_multiplier', 'mx_cam_exposure_multiplier'),
+    ('auto_exp_enabled', 'mx_cam_auto_exp_enabled'),
+    ('auto_exp_scale', 'mx_cam_auto_exp_scale'),
+    ('auto_exp_speed', 'mx_cam_auto_exp_speed'),
+)
+_CAM_PRACTICAL_FIELDS = (
+    ('dof_far_enabled', 'mx_cam_dof_far_enabled'),
+    ('dof_near_enabled', 'mx_cam_dof_near_enabled'),
+    ('dof_amount', 'mx_cam_dof_amount'),
+    ('auto_exp_min_sensitivity', 'mx_cam_auto_exp_min_sensitivity'),
+    ('auto_exp_max_sensitivity', 'mx_cam_auto_exp_max_sensitivity'),
+)
+_CAM_PHYSICAL_FIELDS = (
+    ('frustum_focus_distance', 'mx_cam_frustum_focus_distance'),
+    ('frustum_focal_length', 'mx_cam_frustum_focal_length'),
+    ('frustum_near', 'mx_cam_frustum_near'),
+    ('frustum_far', 'mx_cam_frustum_far'),
+    ('phys_auto_exp_min', 'mx_cam_phys_auto_exp_min'),
+    ('phys_auto_exp_max', 'mx_cam_phys_auto_exp_max'),
+)
+
+
+def _cam_fields(pairs):
+    return tuple(k for k, _ in pairs), attrgetter(*(a for _, a in pairs))
+
+
+_CAM_ATTR_FIELDS = {
+    'PRACTICAL': _cam_fields(_CAM_COMMON_FIELDS + _CAM_PRACTICAL_FIELDS),
+    'PHYSICAL': _cam_fields(_CAM_COMMON_FIELDS + _CAM_PHYSICAL_FIELDS),
+}
+
+
+def _extract_camera(obj, obj_props, aspect):
+    if obj.hide_render:
+        return None
+
+    cam_data = obj.data
+    attr_type = obj_props.mx_camera_attributes_type
+    cam_attrs = {'type': attr_type}
+    fields = _CAM_ATTR_FIELDS.get(attr_type)
+    if fields is not None:
+        keys, get_values = fields
+        cam_attrs.update(zip(keys, get_values(obj_props)))
+    return {
+        'name': obj.name,
+        'transform': matrix_to_godot_transform(obj.matrix_world, is_camera=True),
+        'fov': math.degrees(_vertical_fov(cam_data, aspect)),
+        'near': cam_data.clip_start,
+        'far': cam_data.clip_end,
+        'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
+        'attributes': cam_attrs,
+    }
+
+
+def _extract_light(obj, obj_props, _aspect):
+    if obj.hide_render:
+        return None
+
+    light_data = obj.data
+    light_type = light_data.type
+
+    light_info = {
+        'name': obj.name,
+        'transform': matrix_to_godot_transform(obj.matrix_world, is_camera=True),
+        'type': light_type,
+        'energy': calibration.calibrate_light_energy(light_type, light_data.energy),
+        'color': light_data.color[:],
+        'shadow_enabled': light_data.use_shadow,
+        'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
+    }
+
+    match light_type:
+        case 'POINT':
+            light_info['range'] = light_data.distance if light_data.use_custom_distance else 10.0
+        case 'SPOT':
+            light_info['range'] = light_data.distance if light_data.use_custom_distance else 10.0
+            light_info['spot_angle'] = math.degrees(light_data.spot_size)
+            light_info['spot_blend'] = light_data.spot_blend
+
+    return light_info
+
+
+def _extract_probe(obj, obj_props, _aspect):
+    probe_data = obj.data
+    if probe_data.type not in ('CUBE', 'SPHERE'):
+        return None
+
+    influence = probe_data.influence_distance
+    scale = obj.scale
+
+    return {
+        'name': obj.name,
+        'transform': matrix_to_godot_transform(obj.matrix_world),
+        'type': probe_data.type,
+        'clip_start': probe_data.clip_start,
+        'clip_end': probe_data.clip_end,
+        'falloff': getattr(probe_data, 'falloff', 0.1),
+        'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
+        'update_mode': obj_props.mx_reflection_update_mode,
+        'intensity': obj_props.mx_reflection_intensity,
+        'max_distance': obj_props.mx_reflection_max_distance,
+        'ambient_mode': obj_props.mx_reflection_ambient_mode,
+        'cull_mask': bool_vector_to_bitmask(obj_props.mx_reflection_cull_mask),
+        'reflection_mask': bool_vector_to_bitmask(obj_props.mx_reflection_reflection_mask),
+        'box_projection': obj_props.mx_reflection_box_projection,
+        'interior': obj_props.mx_reflection_interior,
+        'enable_shadows': obj_props.mx_reflection_enable_shadows,
+        'blend_distance': obj_props.mx_reflection_blend_distance,
+        # Blender Z → Godot Y, Blender Y → Godot Z
+        'size': (influence * scale.x * 2.0, influence * scale.z * 2.0, influence * scale.y * 2.0),
+        'shape': 'box',
+    }
+
+
+def _image_source_path(img):
+    """Absolute path of an image's source file, or None if it has none on disk."""
+    if img is None:
+        return None
+    src = abspath(img.filepath) if img.filepath else None
+    return src if src and os.path.exists(src) else None
+
+
+# Plain-valued decal settings, fetched in one attrgetter call per decal
+# instead of one RNA attribute lookup per dict entry.
+_DECAL_SCALAR_KEYS = (
+    'emission_energy', 'albedo_mix', 'normal_fade', 'upper_fade',
+    'lower_fade', 'distance_fade', 'distance_fade_begin', 'distance_fade_length',
+)
+_get_decal_scalars = attrgetter(*('mx_decal_' + k for k in _DECAL_SCALAR_KEYS))
+_get_decal_textures = attrgetter(
+    'mx_decal_albedo_tex', 'mx_decal_normal_tex', 'mx_decal_orm_tex', 'mx_decal_emission_tex')
+
+
+def _extract_decal(obj, obj_props, _aspect):
+    if obj.hide_render or not obj_props.mx_is_decal:
+        return None
+
+    # Decompose world matrix → position + rotation, strip scale from basis
+    loc, rot, obj_scale = obj.matrix_world.decompose()
+    transform_str = matrix_to_godot_transform(Matrix.LocRotScale(loc, rot, None))
+
+    # mx_decal_size is the base size; multiply by object scale so Blender
+    # scaling the EMPTY directly controls the Godot Decal projection volume.
+    # Axis remap: Blender X→Godot X, Blender Z→Godot Y, Blender Y→Godot Z
+    base = obj_props.mx_decal_size
+    size = (base[0] * obj_scale.x, base[1] * obj_scale.z, base[2] * obj_scale.y)
+    albedo_tex, normal_tex, orm_tex, emission_tex = _get_decal_textures(obj_props)
+
+    decal = {
+        'name': obj.name,
+        'transform': transform_str,
+        'size': size,
+        'albedo_src':    _image_source_path(albedo_tex),
+        'normal_src':    _image_source_path(normal_tex),
+        'orm_src':       _image_source_path(orm_tex),
+        'emission_src':  _image_source_path(emission_tex),
+        'albedo_name':   albedo_tex.name   if albedo_tex   else None,
+        'normal_name':   normal_tex.name   if normal_tex   else None,
+        'orm_name':      orm_tex.name      if orm_tex      else None,
+        'emission_name': emission_tex.name if emission_tex else None,
+        'modulate': obj_props.mx_decal_modulate[:],
+        'cull_mask': bool_vector_to_bitmask(obj_props.mx_decal_cull_mask),
+    }
+    decal.update(zip(_DECAL_SCALAR_KEYS, _get_decal_scalars(obj_props)))
+    return decal
 
-        if obj.type == 'CAMERA':
-            cam_data = obj.data
-            attr_type = obj_props.mx_camera_attributes_type
-            cam_attrs = {'type': attr_type}
-            if attr_type != 'DISABLED':
-                cam_attrs.update({
-                    'exposure_multiplier': obj_props.mx_cam_exposure_multiplier,
-                    'auto_exp_enabled': obj_props.mx_cam_auto_exp_enabled,
-                    'auto_exp_scale': obj_props.mx_cam_auto_exp_scale,
-                    'auto_exp_speed': obj_props.mx_cam_auto_exp_speed,
-                })
-            if attr_type == 'PRACTICAL':
-                cam_attrs.update({
-                    'dof_far_enabled': obj_props.mx_cam_dof_far_enabled,
-                    'dof_near_enabled': obj_props.mx_cam_dof_near_enabled,
-                    'dof_amount': obj_props.mx_cam_dof_amount,
-                    'auto_exp_min_sensitivity': obj_props.mx_cam_auto_exp_min_sensitivity,
-                    'auto_exp_max_sensitivity': obj_props.mx_cam_auto_exp_max_sensitivity,
-                })
-            elif attr_type == 'PHYSICAL':
-                cam_attrs.update({
-                    'frustum_focus_distance': obj_props.mx_cam_frustum_focus_distance,
-                    'frustum_focal_length': obj_props.mx_cam_frustum_focal_length,
-                    'frustum_near': obj_props.mx_cam_frustum_near,
-                    'frustum_far': obj_props.mx_cam_frustum_far,
-                    'phys_auto_exp_min': obj_props.mx_cam_phys_auto_exp_min,
-                    'phys_auto_exp_max': obj_props.mx_cam_phys_auto_exp_max,
-                })
-            cameras.append({
-                'name': obj.name,
-                'transform': matrix_to_godot_transform(obj.matrix_world, is_camera=True),
-                'fov': math.degrees(cam_data.angle),
-                'near': cam_data.clip_start,
-                'far': cam_data.clip_end,
-                'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
-                'attributes': cam_attrs,
-            })
-
-        elif obj.type == 'LIGHT':
-            light_data = obj.data
-            light_type = light_data.type
-
-            light_info = {
-                'name': obj.name,
-                'transform': matrix_to_godot_transform(obj.matrix_world, is_camera=True),
-                'type': light_type,
-                'energy': calibration.calibrate_light_energy(light_type, light_data.energy),
-                'color': (light_data.color[0], light_data.color[1], light_data.color[2]),
-                'shadow_enabled': light_data.use_shadow,
-                'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
-            }
-
-            if light_type == 'POINT':
-                light_info['range'] = light_data.distance if light_data.use_custom_distance else 10.0
-            elif light_type == 'SPOT':
-                light_info['range'] = light_data.distance if light_data.use_custom_distance else 10.0
-                light_info['spot_angle'] = math.degrees(light_data.spot_size)
-                light_info['spot_blend'] = light_data.spot_blend
-
-            lights.append(light_info)
-
-    return cameras, lights
-
-
-def extract_reflection_probes():
-    """Extract reflection probe data from Blender light probes."""
-    probes = []
+
+# obj.type → extractor(obj, obj_props, render_aspect); decals are EMPTY
+# objects tagged with mx_is_decal.
+_SCENE_EXTRACTORS = {
+    'CAMERA': _extract_camera,
+    'LIGHT': _extract_light,
+    'LIGHT_PROBE': _extract_probe,
+    'EMPTY': _extract_decal,
+}
+
+
+def extract_scene_objects(scene=None):
+    """Extract cameras, lights, reflection probes and decals in one pass.
+
+    `scene` is the scene the caller already holds; defaults to the context scene.
+    Returns (cameras, lights, probes, decals).
+    """
+    found = {obj_type: [] for obj_type in _SCENE_EXTRACTORS}
+    # Scene-wide, so computed once rather than per camera.
+    aspect = _render_aspect(scene or bpy.context.scene)
 
     for obj in bpy.data.objects:
-        if obj.type != 'LIGHT_PROBE':
+        extract = _SCENE_EXTRACTORS.get(obj.type)
+        if extract is None:
             continue
 
         obj_props = obj.MX_ObjectProperties
         if not obj_props.mx_export_object:
             continue
 
-        probe_data = obj.data
-        if probe_data.type not in ('CUBE', 'SPHERE'):
-            continue
+        item = extract(obj, obj_props, aspect)
+        if item is not None:
+            found[obj.type].append(item)
 
-        influence = probe_data.influence_distance
-        scale = obj.scale
-
-        probes.append({
-            'name': obj.name,
-            'transform': matrix_to_godot_transform(obj.matrix_world),
-            'type': probe_data.type,
-            'clip_start': probe_data.clip_start,
-            'clip_end': probe_data.clip_end,
-            'falloff': probe_data.falloff if hasattr(probe_data, 'falloff') else 0.1,
-            'render_layers': bool_vector_to_bitmask(obj_props.mx_render_layers),
-            'update_mode': obj_props.mx_reflection_update_mode,
-            'intensity': obj_props.mx_reflection_intensity,
-            'max_distance': obj_props.mx_reflection_max_distance,
-            'ambient_mode': obj_props.mx_reflection_ambient_mode,
-            'cull_mask': bool_vector_to_bitmask(obj_props.mx_reflection_cull_mask),
-            'reflection_mask': bool_vector_to_bitmask(obj_props.mx_reflection_reflection_mask),
-            'box_projection': obj_props.mx_reflection_box_projection,
-            'interior': obj_props.mx_reflection_interior,
-            'enable_shadows': obj_props.mx_reflection_enable_shadows,
-            'blend_distance': obj_props.mx_reflection_blend_distance,
-            # Blender Z → Godot Y, Blender Y → Godot Z
-            'size': (influence * scale.x * 2.0, influence * scale.z * 2.0, influence * scale.y * 2.0),
-            'shape': 'box',
-        })
-
-    return probes
+    return found['CAMERA'], found['LIGHT'], found['LIGHT_PROBE'], found['EMPTY']
 
 
 # ===== MATERIAL CONVERSION HELPERS =====
@@ -399,7 +683,8 @@ def prepare_materials_for_export(props):
 
             if not props.mx_convert_emission:
                 strength = node.inputs.get('Emission Strength')
-                if strength:
+                # Skip the RNA write (and the restore) when it is already zero
+                if strength and strength.default_value != 0.0:
                     saved_values.append((strength, strength.default_value))
                     strength.default_value = 0.0
                 emission = node.inputs.get('Emission Color')
@@ -436,66 +721,3 @@ def restore_materials_after_export(saved_state):
             node_tree.links.new(from_socket, to_socket)
         for socket, value in saved_values:
             socket.default_value = value
-
-
-def extract_decals():
-    """Extract Decal data from EMPTY objects tagged with mx_is_decal."""
-    decals = []
-
-    for obj in bpy.data.objects:
-        if obj.type != 'EMPTY':
-            continue
-        if obj.hide_render:
-            continue
-
-        obj_props = obj.MX_ObjectProperties
-        if not obj_props.mx_export_object:
-            continue
-        if not obj_props.mx_is_decal:
-            continue
-
-        # Decompose world matrix → position + rotation, strip scale from basis
-        loc, rot, obj_scale = obj.matrix_world.decompose()
-        rot_mat = rot.to_matrix().to_4x4()
-        rot_mat.translation = loc
-        transform_str = matrix_to_godot_transform(rot_mat)
-
-        # mx_decal_size is the base size; multiply by object scale so Blender
-        # scaling the EMPTY directly controls the Godot Decal projection volume.
-        # Axis remap: Blender X→Godot X, Blender Z→Godot Y, Blender Y→Godot Z
-        base = obj_props.mx_decal_size
-        size = (base[0] * obj_scale.x, base[1] * obj_scale.z, base[2] * obj_scale.y)
-        col = obj_props.mx_decal_modulate
-
-        def _img_path(img):
-            if img is None:
-                return None
-            src = bpy.path.abspath(img.filepath) if img.filepath else None
-            return src if src and os.path.exists(src) else None
-
-        decals.append({
-            'name': obj.name,
-            'transform': transform_str,
-            'size': (size[0], size[1], size[2]),
-            'albedo_src':    _img_path(obj_props.mx_decal_albedo_tex),
-            'normal_src':    _img_path(obj_props.mx_decal_normal_tex),
-            'orm_src':       _img_path(obj_props.mx_decal_orm_tex),
-            'emission_src':  _img_path(obj_props.mx_decal_emission_tex),
-            'albedo_name':   obj_props.mx_decal_albedo_tex.name   if obj_props.mx_decal_albedo_tex   else None,
-            'normal_name':   obj_props.mx_decal_normal_tex.name   if obj_props.mx_decal_normal_tex   else None,
-            'orm_name':      obj_props.mx_decal_orm_tex.name      if obj_props.mx_decal_orm_tex      else None,
-            'emission_name': obj_props.mx_decal_emission_tex.name if obj_props.mx_decal_emission_tex else None,
-            'emission_energy': obj_props.mx_decal_emission_energy,
-            'modulate': (col[0], col[1], col[2], col[3]),
-            'albedo_mix':   obj_props.mx_decal_albedo_mix,
-            'normal_fade':  obj_props.mx_decal_normal_fade,
-            'upper_fade':   obj_props.mx_decal_upper_fade,
-            'lower_fade':   obj_props.mx_decal_lower_fade,
-            'distance_fade': obj_props.mx_decal_distance_fade,
-            'distance_fade_begin':  obj_props.mx_decal_distance_fade_begin,
-            'distance_fade_length': obj_props.mx_decal_distance_fade_length,
-            'cull_mask': bool_vector_to_bitmask(obj_props.mx_decal_cull_mask),
-        })
-
-    return decals
-